@@ -0,0 +1,63 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    항목마다 만료 시각을 갖는 LRU 캐시입니다.
+
+    maxsize를 넘으면 가장 오래 사용하지 않은 항목부터 버리고, 만료된 항목은 조회 시점에 지웁니다.
+    동기 의존성은 스레드풀에서 실행되므로 모든 접근을 잠금으로 감쌉니다.
+    """
+
+    def __init__(self, maxsize: int, ttl: float = 0, enabled: bool = True):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.enabled = enabled and maxsize > 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> V | None:
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.time():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """ttl초 동안 값을 보관합니다. ttl이 없으면 기본 ttl을 사용하고, 0 이하이면 보관하지 않습니다."""
+        ttl = self.ttl if ttl is None else ttl
+        if not self.enabled or ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.time() + ttl, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: K) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
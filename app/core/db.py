@@ -1,5 +1,31 @@
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import create_engine
 
 from app.core.settings import settings
 
-engine = create_engine(str(settings.DB_URI), connect_args={"check_same_thread": False})
+# 드라이버가 지정되지 않은 DB_URI에 대해 사용할 비동기 드라이버
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def get_async_db_uri(db_uri: str) -> str:
+    """동기 DB_URI를 비동기 드라이버를 사용하는 URI로 변환합니다."""
+    url = make_url(db_uri)
+    if url.drivername in ASYNC_DRIVERS:
+        url = url.set(drivername=ASYNC_DRIVERS[url.drivername])
+    return url.render_as_string(hide_password=False)
+
+
+def get_connect_args(db_uri: str) -> dict:
+    """드라이버에 넘길 연결 인자. check_same_thread는 SQLite 드라이버만 받습니다."""
+    if make_url(db_uri).get_backend_name() == "sqlite":
+        return {"check_same_thread": False}
+    return {}
+
+
+engine = create_engine(str(settings.DB_URI), connect_args=get_connect_args(settings.DB_URI))
+
+async_engine = create_async_engine(get_async_db_uri(settings.DB_URI))
@@ -0,0 +1,45 @@
+"""
+엔진에서 실행되는 SQL 문의 시간을 한 번만 재서 구독자들에게 나눠 줍니다.
+
+요청 단계별 시간(timing), 쿼리 로그(queries), 지표(metrics)가 모두 문마다 실행 시간을 필요로 합니다.
+각자 리스너를 달면 문마다 리스너 쌍과 perf_counter 호출이 구독자 수만큼 늘어나므로,
+엔진에는 이 모듈의 리스너 한 쌍만 등록하고 각 모듈은 subscribe()로 콜백을 등록합니다.
+
+    def on_statement(conn, statement, parameters, executemany, seconds): ...
+
+    instrument_engine(engine)
+    subscribe(on_statement)
+"""
+
+import time
+from typing import Any, Callable
+
+from sqlalchemy import Connection, Engine, event
+
+StatementCallback = Callable[[Connection, str, Any, bool, float], None]
+
+_subscribers: tuple[StatementCallback, ...] = ()
+
+
+def subscribe(callback: StatementCallback) -> None:
+    """문이 끝날 때마다 callback(conn, statement, parameters, executemany, seconds)을 호출합니다. 중복은 무시."""
+    global _subscribers
+    if callback not in _subscribers:
+        _subscribers = (*_subscribers, callback)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    context._statement_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    seconds = time.perf_counter() - context._statement_started
+    for callback in _subscribers:
+        callback(conn, statement, parameters, executemany, seconds)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """engine에 리스너 한 쌍을 등록합니다. 여러 번 호출해도 한 번만 등록됩니다."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,131 @@
+"""
+사용자의 목표/할 일/노트/파일 데이터를 스트리밍으로 내보냅니다.
+
+각 테이블을 서버 사이드 커서로 EXPORT_CHUNK_SIZE 행씩 읽어 한 줄에 한 행씩 NDJSON으로 씁니다.
+결과 전체를 메모리에 올리지 않으므로 행 수와 관계없이 메모리 사용량이 일정하고, 첫 줄은 바로 전송됩니다.
+
+    {"type": "user", "data": {"id": 1, "email": "...", ...}}
+    {"type": "goal", "data": {"id": 3, "title": "...", ...}}
+"""
+
+import io
+import json
+import zipfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, AsyncIterator
+
+import anyio
+from sqlalchemy import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.db import async_engine
+from app.core.settings import settings
+from app.models import File, Goal, Note, Todo, User
+
+EXPORT_CHUNK_SIZE = 500
+MEDIA_CHUNK_SIZE = 1024 * 1024
+
+# 참조되는 테이블이 먼저 오도록 나열 (가져오기 시 이 순서대로 복원)
+EXPORT_TABLES = (("goal", Goal), ("todo", Todo), ("note", Note), ("file", File))
+USER_EXPORT_COLUMNS = (User.id, User.email, User.name, User.created_at, User.updated_at)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _dump_line(record_type: str, data: dict) -> bytes:
+    return (json.dumps({"type": record_type, "data": data}, default=_json_default, ensure_ascii=False) + "\n").encode()
+
+
+async def iter_ndjson(user_id: int) -> AsyncIterator[bytes]:
+    """
+    사용자의 데이터를 NDJSON 청크로 반환합니다. 청크 하나에 최대 EXPORT_CHUNK_SIZE 행이 들어갑니다.
+    응답이 끝날 때까지 열려 있어야 하므로 요청의 세션 대신 별도 세션을 사용합니다.
+    """
+    async with AsyncSession(async_engine) as session:
+        user = (await session.exec(select(*USER_EXPORT_COLUMNS).where(User.id == user_id))).one()
+        yield _dump_line("user", user._asdict())
+
+        for record_type, model in EXPORT_TABLES:
+            table = model.__table__
+            query = (
+                select(table)
+                .where(table.c.user_id == user_id)
+                .order_by(table.c.id)
+                .execution_options(yield_per=EXPORT_CHUNK_SIZE)
+            )
+            result = await session.stream(query)
+            async for rows in result.partitions():
+                yield b"".join(_dump_line(record_type, row._asdict()) for row in rows)
+
+
+class _ZipBuffer(io.RawIOBase):
+    """ZipFile이 쓴 바이트를 모아 두었다가 drain()으로 꺼내는 탐색 불가능한 스트림입니다."""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+        self._offset = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._offset += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._offset
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _zip_info(path: Path, arcname: str) -> zipfile.ZipInfo | None:
+    """파일의 크기와 수정 시각으로 ZIP 항목 정보를 만듭니다. 파일이 없으면 None. 디스크를 읽으므로 스레드에서 호출."""
+    try:
+        if not path.is_file():
+            return None
+        return zipfile.ZipInfo.from_file(path, arcname)
+    except FileNotFoundError:
+        return None
+
+
+async def iter_zip(user_id: int) -> AsyncIterator[bytes]:
+    """
+    NDJSON(export.ndjson)과 사용자가 올린 파일(media/<file id>/<파일명>)을 ZIP으로 묶어 스트리밍합니다.
+    출력이 탐색 불가능하므로 각 항목의 크기와 CRC는 데이터 뒤의 data descriptor에 기록됩니다.
+    """
+    buffer = _ZipBuffer()
+    with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+        with archive.open("export.ndjson", mode="w", force_zip64=True) as entry:
+            async for chunk in iter_ndjson(user_id):
+                entry.write(chunk)
+                if data := buffer.drain():
+                    yield data
+
+        async with AsyncSession(async_engine) as session:
+            query = select(File.id, File.filename, File.file_path).where(File.user_id == user_id).order_by(File.id)
+            files = (await session.exec(query)).all()
+        for file in files:
+            path = Path(settings.MEDIA_ROOT) / file.file_path
+            # 같은 이름의 파일이 여러 개일 수 있으므로 id로 구분
+            info = await anyio.to_thread.run_sync(_zip_info, path, f"media/{file.id}/{file.filename}")
+            if info is None:
+                continue
+            # 미디어 파일은 대부분 이미 압축되어 있으므로 그대로 저장
+            info.compress_type = zipfile.ZIP_STORED
+            with archive.open(info, mode="w") as entry:
+                async with await anyio.open_file(path, "rb") as media:
+                    while chunk := await media.read(MEDIA_CHUNK_SIZE):
+                        entry.write(chunk)
+                        yield buffer.drain()
+
+    # 중앙 디렉터리
+    yield buffer.drain()
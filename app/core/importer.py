@@ -0,0 +1,260 @@
+"""
+NDJSON으로 받은 목표/할 일/노트를 일괄로 가져옵니다.
+
+레코드 형식은 내보내기(app.core.export)와 같습니다. data의 id는 클라이언트 쪽 참조 값으로,
+같은 가져오기 안의 todo/note가 goalId/todoId로 가리키면 새로 발급된 id로 바꿔 저장합니다.
+
+    {"type": "goal", "data": {"id": "g1", "title": "운동"}}
+    {"type": "todo", "data": {"id": "t1", "title": "달리기", "goalId": "g1"}}
+    {"type": "note", "data": {"title": "기록", "content": "5km", "goal_id": "g1", "todo_id": "t1"}}
+
+본문을 줄 단위로 읽으면서 IMPORT_BATCH_SIZE 레코드마다 executemany로 넣고 커밋합니다.
+잘못된 레코드는 건너뛰고 줄 번호와 함께 결과에 기록합니다.
+"""
+
+import json
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, AsyncIterable, NamedTuple
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models import Counter, Goal, Note, Todo
+from app.models.counter import USER_SCOPE
+from app.schema.goal import GoalCreate
+from app.schema.importer import ImportRecordError, ImportResult, TodoImport
+from app.schema.note import NoteCreate
+
+IMPORT_BATCH_SIZE = 1000
+IMPORT_MAX_LINE_SIZE = 1024 * 1024
+IMPORT_MAX_ERRORS = 100
+
+# 참조되는 레코드가 먼저 들어가도록 나열
+IMPORT_SCHEMAS: dict[str, type[BaseModel]] = {"goal": GoalCreate, "todo": TodoImport, "note": NoteCreate}
+# 내보내기 파일을 그대로 가져올 수 있도록 무시하는 레코드
+SKIPPED_RECORD_TYPES = {"user", "file"}
+
+
+class PendingRecord(NamedTuple):
+    line: int
+    ref: Any
+    item: BaseModel
+
+
+class NdjsonImporter:
+    def __init__(self, session: AsyncSession, user_id: int, batch_size: int = IMPORT_BATCH_SIZE):
+        self.session = session
+        self.user_id = user_id
+        self.batch_size = batch_size
+        self.result = ImportResult()
+
+        self.pending: dict[str, list[PendingRecord]] = {record_type: [] for record_type in IMPORT_SCHEMAS}
+        # 클라이언트 참조 -> 새 id
+        self.goal_ids: dict[Any, int] = {}
+        self.todo_ids: dict[Any, int] = {}
+        self.noted_todo_ids: set[int] = set()
+        # 현재 배치의 행에 기록할 사용자 데이터 버전
+        self.change_seq = 0
+
+    async def run(self, chunks: AsyncIterable[bytes]) -> ImportResult:
+        """바이트 스트림을 줄 단위로 나눠 가져옵니다. 한 줄은 IMPORT_MAX_LINE_SIZE를 넘을 수 없습니다."""
+        line_number = 0
+        buffer = b""
+        skipping = False
+        async for chunk in chunks:
+            *lines, buffer = (buffer + chunk).split(b"\n")
+            for line in lines:
+                line_number += 1
+                if skipping:
+                    skipping = False
+                    continue
+                await self.feed(line_number, line)
+            if len(buffer) > IMPORT_MAX_LINE_SIZE:
+                # 줄 끝까지 버리고 다음 줄부터 계속. 여러 청크에 걸친 줄도 오류는 한 번만 기록
+                if not skipping:
+                    self.error(line_number + 1, "Line too long")
+                buffer = b""
+                skipping = True
+        if buffer and not skipping:
+            await self.feed(line_number + 1, buffer)
+
+        await self.flush()
+        return self.result
+
+    async def feed(self, line_number: int, line: bytes) -> None:
+        if not line.strip():
+            return
+        try:
+            record = json.loads(line)
+            record_type, data = record["type"], record["data"]
+        except (ValueError, KeyError, TypeError):
+            self.error(line_number, "Invalid record")
+            return
+
+        if record_type in SKIPPED_RECORD_TYPES:
+            return
+        schema = IMPORT_SCHEMAS.get(record_type)
+        if schema is None or not isinstance(data, dict):
+            self.error(line_number, f"Unknown record type: {record_type}")
+            return
+
+        # 참조 값은 문자열일 수도 있으므로 검증 전에 분리
+        refs = {key: data.pop(key) for key in ("goalId", "goal_id", "todoId", "todo_id") if key in data}
+        try:
+            item = schema.model_validate({**data, **{key: 0 for key in refs}}, by_alias=True, by_name=True)
+        except ValidationError as e:
+            error = e.errors()[0]
+            self.error(line_number, f"{'.'.join(map(str, error['loc']))}: {error['msg']}")
+            return
+
+        for key, ref in refs.items():
+            setattr(item, "goal_id" if key.startswith("goal") else "todo_id", ref)
+        self.pending[record_type].append(PendingRecord(line=line_number, ref=data.get("id"), item=item))
+
+        if sum(len(records) for records in self.pending.values()) >= self.batch_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """대기 중인 레코드를 참조 순서대로 넣고 커밋합니다."""
+        self.change_seq = await Counter.touch(self.session, self.user_id)
+        now = datetime.now(timezone.utc)
+        await self._flush_goals(self._take("goal"), now)
+        await self._flush_todos(self._take("todo"), now)
+        await self._flush_notes(self._take("note"), now)
+        await self.session.commit()
+
+    def error(self, line_number: int, detail: str) -> None:
+        self.result.failed += 1
+        if len(self.result.errors) < IMPORT_MAX_ERRORS:
+            self.result.errors.append(ImportRecordError(line=line_number, detail=detail))
+
+    def _take(self, record_type: str) -> list[PendingRecord]:
+        records, self.pending[record_type] = self.pending[record_type], []
+        return records
+
+    async def _flush_goals(self, records: list[PendingRecord], now: datetime) -> None:
+        rows = [
+            {
+                "title": record.item.title,
+                "user_id": self.user_id,
+                "created_at": now,
+                "updated_at": now,
+                "change_seq": self.change_seq,
+            }
+            for record in records
+        ]
+        ids = await self._insert(Goal, records, rows)
+
+        new_goal_ids = []
+        for record, goal_id in zip(records, ids):
+            if goal_id is None:
+                continue
+            new_goal_ids.append(goal_id)
+            if record.ref is not None:
+                self.goal_ids[record.ref] = goal_id
+        if new_goal_ids:
+            await self.session.exec(
+                insert(Counter), params=[{"user_id": self.user_id, "goal_id": goal_id} for goal_id in new_goal_ids]
+            )
+            await Counter.increment(self.session, self.user_id, [USER_SCOPE], goals=len(new_goal_ids))
+        self.result.goals += len(new_goal_ids)
+
+    async def _flush_todos(self, records: list[PendingRecord], now: datetime) -> None:
+        resolved, rows = [], []
+        for record in records:
+            goal_id = self.goal_ids.get(record.item.goal_id)
+            if goal_id is None:
+                self.error(record.line, "Unknown goal reference")
+                continue
+            resolved.append(record)
+            rows.append(
+                {
+                    "title": record.item.title,
+                    "done": record.item.done,
+                    "link_url": record.item.link_url,
+                    "file_url": record.item.file_url,
+                    "user_id": self.user_id,
+                    "goal_id": goal_id,
+                    "created_at": now,
+                    "updated_at": now,
+                    "change_seq": self.change_seq,
+                }
+            )
+        ids = await self._insert(Todo, resolved, rows)
+
+        changes = []
+        for record, row, todo_id in zip(resolved, rows, ids):
+            if todo_id is None:
+                continue
+            changes.append((None, (row["goal_id"], row["done"])))
+            if record.ref is not None:
+                self.todo_ids[record.ref] = todo_id
+        await Counter.update_todo_stats(self.session, self.user_id, changes)
+        self.result.todos += len(changes)
+
+    async def _flush_notes(self, records: list[PendingRecord], now: datetime) -> None:
+        resolved, rows = [], []
+        for record in records:
+            goal_id = self.goal_ids.get(record.item.goal_id)
+            todo_id = self.todo_ids.get(record.item.todo_id)
+            if goal_id is None or todo_id is None:
+                self.error(record.line, f"Unknown {'goal' if goal_id is None else 'todo'} reference")
+                continue
+            # 할 일 하나에는 노트가 하나만 존재
+            if todo_id in self.noted_todo_ids:
+                self.error(record.line, "Todo already has a note")
+                continue
+            self.noted_todo_ids.add(todo_id)
+            resolved.append(record)
+            rows.append(
+                {
+                    "title": record.item.title,
+                    "content": record.item.content,
+                    "link_url": record.item.link_url,
+                    "user_id": self.user_id,
+                    "goal_id": goal_id,
+                    "todo_id": todo_id,
+                    "created_at": now,
+                    "updated_at": now,
+                    "change_seq": self.change_seq,
+                }
+            )
+        ids = await self._insert(Note, resolved, rows)
+
+        notes_per_goal: dict[int, int] = defaultdict(int)
+        for row, note_id in zip(rows, ids):
+            if note_id is not None:
+                notes_per_goal[row["goal_id"]] += 1
+        for goal_id, notes in notes_per_goal.items():
+            await Counter.increment(self.session, self.user_id, [goal_id], notes=notes)
+        await Counter.increment(self.session, self.user_id, [USER_SCOPE], notes=sum(notes_per_goal.values()))
+        self.result.notes += sum(notes_per_goal.values())
+
+    async def _insert(self, model, records: list[PendingRecord], rows: list[dict]) -> list[int | None]:
+        """
+        rows를 executemany로 넣고 각 행의 새 id를 반환합니다.
+        배치가 실패하면 한 행씩 다시 넣어 실패한 행만 None으로 표시하고 오류를 기록합니다.
+        """
+        if not rows:
+            return []
+        table = model.__table__
+        try:
+            async with self.session.begin_nested():
+                # 각 레코드에 새 id를 대응시키도록 RETURNING 행을 입력 순서대로 받음
+                query = insert(table).returning(table.c.id, sort_by_parameter_order=True)
+                return list((await self.session.exec(query, params=rows)).scalars())
+        except IntegrityError:
+            pass
+
+        ids = []
+        for record, row in zip(records, rows):
+            try:
+                async with self.session.begin_nested():
+                    ids.append((await self.session.exec(insert(table).values(row).returning(table.c.id))).scalar_one())
+            except IntegrityError:
+                self.error(record.line, "Conflicts with existing data")
+                ids.append(None)
+        return ids
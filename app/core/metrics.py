@@ -0,0 +1,206 @@
+"""
+프로세스 안에서 지표를 모아 /metrics로 Prometheus 텍스트 형식(0.0.4)으로 내보냅니다.
+
+기록은 이벤트 루프와 스레드 풀에서 잠금 없이 값을 더하기만 하므로 요청 경로에 병목이 생기지 않습니다.
+GIL 아래에서 +=가 드물게 겹쳐 값이 하나 빠질 수는 있지만 지표 용도로는 허용합니다.
+다른 객체가 이미 들고 있는 값(큐 길이, 캐시 적중 수)은 따로 기록하지 않고 수집할 때 콜백으로 읽습니다.
+
+워커 프로세스마다 레지스트리가 따로 있으므로 여러 워커로 띄우면 워커별 값이 응답됩니다.
+"""
+
+import abc
+import math
+from bisect import bisect_left
+from typing import Callable, Iterable, Iterator
+
+from sqlalchemy import Engine
+
+from app.core import db_events
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 초 단위 지연 시간 버킷
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Sample = tuple[str, dict[str, str], float]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric(abc.ABC):
+    type: str = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    @abc.abstractmethod
+    def samples(self) -> Iterator[Sample]:
+        """(이름 접미사, 라벨, 값) 표본을 내보냅니다."""
+
+    def _labels(self, labelvalues: tuple) -> dict[str, str]:
+        return dict(zip(self.labelnames, labelvalues))
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, *labelvalues: str, amount: float = 1) -> None:
+        self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def samples(self) -> Iterator[Sample]:
+        for labelvalues, value in list(self._values.items()):
+            yield "", self._labels(labelvalues), value
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (), buckets: tuple = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 값 -> [버킷별 관측 수(+Inf 포함), 합계]
+        self._children: dict[tuple, list] = {}
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        child = self._children.get(labelvalues)
+        if child is None:
+            child = self._children.setdefault(labelvalues, [[0] * (len(self.buckets) + 1), 0.0])
+        # 누적은 내보낼 때 계산하고, 기록할 때는 해당 버킷 하나만 올림
+        child[0][bisect_left(self.buckets, value)] += 1
+        child[1] += value
+
+    def samples(self) -> Iterator[Sample]:
+        for labelvalues, (counts, total) in list(self._children.items()):
+            labels = self._labels(labelvalues)
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), list(counts)):
+                cumulative += count
+                yield "_bucket", {**labels, "le": _format_value(bound)}, cumulative
+            yield "_sum", labels, total
+            yield "_count", labels, cumulative
+
+
+class CallbackMetric(Metric):
+    """수집할 때 callback이 돌려주는 (라벨 값, 값) 목록을 그대로 내보내는 지표"""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        callback: Callable[[], Iterable[tuple[tuple, float]]],
+        labelnames: Iterable[str] = (),
+        type: str = "gauge",
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.type = type
+        self.callback = callback
+
+    def samples(self) -> Iterator[Sample]:
+        for labelvalues, value in self.callback():
+            yield "", self._labels(labelvalues), value
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            for suffix, labels, value in metric.samples():
+                label_text = ",".join(f'{key}="{_escape(str(label))}"' for key, label in labels.items())
+                name = f"{metric.name}{suffix}{{{label_text}}}" if label_text else f"{metric.name}{suffix}"
+                lines.append(f"{name} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+http_requests = registry.register(Counter("http_requests_total", "처리한 HTTP 요청 수", ("method", "route", "status")))
+http_request_duration = registry.register(
+    Histogram("http_request_duration_seconds", "HTTP 요청 처리 시간(초)", ("method", "route"))
+)
+db_statements = registry.register(Counter("db_statements_total", "실행한 SQL 문 수"))
+db_statement_duration = registry.register(Histogram("db_statement_duration_seconds", "SQL 문 실행 시간(초)"))
+upload_bytes = registry.register(Counter("upload_bytes_total", "업로드로 받은 파일 크기 합계(bytes)"))
+
+
+def _password_hash_queue_depth() -> list[tuple[tuple, float]]:
+    from app.core.security import password_hash_pool
+
+    return [((), password_hash_pool.queue_depth)]
+
+
+def _auth_caches() -> dict:
+    from app.core.security import token_cache
+    from app.depends.user import user_cache
+
+    return {"token": token_cache, "user": user_cache}
+
+
+registry.register(
+    CallbackMetric(
+        "password_hash_queue_depth", "bcrypt 프로세스 풀에 제출되었지만 끝나지 않은 작업 수", _password_hash_queue_depth
+    )
+)
+registry.register(
+    CallbackMetric(
+        "cache_hits_total",
+        "인증 캐시 적중 수",
+        lambda: [((name,), cache.hits) for name, cache in _auth_caches().items()],
+        ("cache",),
+        type="counter",
+    )
+)
+registry.register(
+    CallbackMetric(
+        "cache_misses_total",
+        "인증 캐시 실패 수",
+        lambda: [((name,), cache.misses) for name, cache in _auth_caches().items()],
+        ("cache",),
+        type="counter",
+    )
+)
+registry.register(
+    CallbackMetric(
+        "cache_hit_ratio",
+        "인증 캐시 적중률 (조회가 없었으면 0)",
+        lambda: [((name,), cache.hits / ((cache.hits + cache.misses) or 1)) for name, cache in _auth_caches().items()],
+        ("cache",),
+    )
+)
+
+
+def _on_statement(conn, statement, parameters, executemany, seconds) -> None:
+    db_statements.inc()
+    db_statement_duration.observe(seconds)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """engine에서 실행되는 SQL 문의 수와 시간을 기록합니다. 여러 번 호출해도 한 번만 등록됩니다."""
+    db_events.instrument_engine(engine)
+    db_events.subscribe(_on_statement)
@@ -0,0 +1,32 @@
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import Engine, inspect
+
+from app.core.db import engine
+
+MIGRATIONS_DIR = Path(__file__).resolve().parent.parent / "migrations"
+
+# create_all로 만들어진 기존 DB의 스키마에 해당하는 리비전
+BASELINE_REVISION = "0001"
+
+
+def get_alembic_config() -> Config:
+    config = Config()
+    config.set_main_option("script_location", str(MIGRATIONS_DIR))
+    return config
+
+
+def run_migrations(bind: Engine = engine) -> None:
+    """
+    DB 스키마를 최신 리비전으로 올립니다.
+    alembic_version 없이 테이블만 있는 DB는 create_all로 만들어진 것으로 보고 초기 리비전으로 표시한 뒤 진행합니다.
+    """
+    config = get_alembic_config()
+    with bind.begin() as connection:
+        config.attributes["connection"] = connection
+        tables = inspect(connection).get_table_names()
+        if "user" in tables and "alembic_version" not in tables:
+            command.stamp(config, BASELINE_REVISION)
+        command.upgrade(config, "head")
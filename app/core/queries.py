@@ -0,0 +1,118 @@
+"""
+엔진에서 실행되는 SQL 문을 세고 시간을 잽니다.
+
+track_queries() 블록 안에서 실행된 문은 QueryLog에 쌓이고, 블록이 겹치면 바깥 블록에도 함께 기록됩니다.
+QueryLogMiddleware는 요청마다 블록을 열어 같은 문이 반복되면 N+1로 의심해 경고하고,
+SLOW_QUERY_MS 이상 걸린 문은 실행 계획과 함께 로그로 남깁니다.
+
+테스트에서는 assert_max_queries(n)로 엔드포인트의 쿼리 수 상한을 고정합니다.
+
+    with assert_max_queries(3):
+        client.get("/todos")
+"""
+
+import logging
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from sqlalchemy import Engine
+
+from app.core import db_events
+from app.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# 실행 계획을 조회할 때 문 앞에 붙이는 접두사
+EXPLAIN_PREFIXES = {"sqlite": "EXPLAIN QUERY PLAN ", "postgresql": "EXPLAIN "}
+EXPLAINABLE_STATEMENTS = ("SELECT", "UPDATE", "DELETE", "WITH")
+
+
+class QueryLog:
+    __slots__ = ("statements", "durations", "parent")
+
+    def __init__(self, parent: "QueryLog | None" = None):
+        self.statements: list[str] = []
+        self.durations: list[float] = []
+        self.parent = parent
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    @property
+    def total_time(self) -> float:
+        return sum(self.durations)
+
+    def record(self, statement: str, seconds: float) -> None:
+        log = self
+        while log is not None:
+            log.statements.append(statement)
+            log.durations.append(seconds)
+            log = log.parent
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """threshold번 이상 실행된 같은 문과 실행 횟수. 행마다 관계를 따로 읽는 N+1 패턴일 가능성이 큽니다."""
+        return [(statement, count) for statement, count in Counter(self.statements).most_common() if count >= threshold]
+
+    def format(self) -> str:
+        return "\n".join(
+            f"{i}. ({seconds * 1000:.2f}ms) {statement}"
+            for i, (statement, seconds) in enumerate(zip(self.statements, self.durations), start=1)
+        )
+
+
+current_queries: ContextVar[QueryLog | None] = ContextVar("current_queries", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryLog]:
+    """블록 안에서 계측된 엔진으로 실행된 SQL 문을 모읍니다."""
+    log = QueryLog(parent=current_queries.get())
+    token = current_queries.set(log)
+    try:
+        yield log
+    finally:
+        current_queries.reset(token)
+
+
+@contextmanager
+def assert_max_queries(n: int) -> Iterator[QueryLog]:
+    """블록 안에서 실행된 SQL 문이 n개를 넘으면 실행된 문 목록과 함께 실패합니다."""
+    with track_queries() as log:
+        yield log
+    if log.count > n:
+        raise AssertionError(f"Expected at most {n} queries, got {log.count}:\n{log.format()}")
+
+
+def explain(conn, statement: str, parameters) -> str:
+    """같은 커넥션에서 문의 실행 계획을 조회합니다. 이벤트를 다시 발생시키지 않도록 DBAPI 커서를 직접 사용합니다."""
+    prefix = EXPLAIN_PREFIXES.get(conn.dialect.name)
+    if prefix is None or not statement.lstrip().upper().startswith(EXPLAINABLE_STATEMENTS):
+        return ""
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute(prefix + statement, parameters)
+        return "\n".join(" ".join(str(column) for column in row) for row in cursor.fetchall())
+    finally:
+        cursor.close()
+
+
+def _on_statement(conn, statement, parameters, executemany, seconds) -> None:
+    log = current_queries.get()
+    if log is not None:
+        log.record(statement, seconds)
+
+    if settings.SLOW_QUERY_MS is not None and seconds * 1000 >= settings.SLOW_QUERY_MS:
+        try:
+            plan = "" if executemany else explain(conn, statement, parameters)
+        except Exception as e:
+            plan = f"(실행 계획 조회 실패: {e})"
+        logger.warning("Slow query (%.2fms): %s\n%s", seconds * 1000, statement, plan)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """engine에서 실행되는 문을 기록합니다. 여러 번 호출해도 한 번만 등록됩니다."""
+    db_events.instrument_engine(engine)
+    db_events.subscribe(_on_statement)
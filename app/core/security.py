@@ -1,11 +1,19 @@
+import asyncio
+import hashlib
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, Callable
 
 import jwt
 from fastapi import HTTPException
 from passlib.context import CryptContext
 
+from app.core.cache import TTLCache
 from app.core.settings import settings
+from app.exceptions.http_exception import ServiceUnavailableHTTPException
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -28,6 +36,68 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+class PasswordHashPool:
+    """
+    bcrypt 해시/검증을 이벤트 루프 밖의 프로세스 풀에서 실행합니다.
+
+    대기 중인 작업이 max_pending을 넘으면 큐에 쌓지 않고 503으로 거절합니다.
+    워커가 죽어 풀이 깨지면 풀을 새로 만들어 다시 시도하고, 그래도 실패하면 503으로 응답합니다.
+    """
+
+    def __init__(self, max_workers: int | None, max_pending: int):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: ProcessPoolExecutor | None = None
+        self._pending = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """제출되었지만 아직 끝나지 않은 작업 수"""
+        return self._pending
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # 스레드가 있는 프로세스에서 fork하지 않도록 spawn 사용
+            self._executor = ProcessPoolExecutor(self.max_workers, mp_context=multiprocessing.get_context("spawn"))
+        return self._executor
+
+    def _discard(self, executor: ProcessPoolExecutor) -> None:
+        """워커가 죽어 깨진 풀을 버립니다. 다음 호출은 새 풀을 만듭니다."""
+        if self._executor is executor:
+            self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self._pending >= self.max_pending:
+            raise ServiceUnavailableHTTPException()
+        self._pending += 1
+        try:
+            # 워커가 OOM이나 segfault로 죽으면 풀 전체가 깨지므로 새 풀에서 한 번만 다시 시도
+            for _ in range(2):
+                executor = self._get_executor()
+                try:
+                    return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+                except BrokenProcessPool:
+                    self._discard(executor)
+            raise ServiceUnavailableHTTPException()
+        finally:
+            self._pending -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+password_hash_pool = PasswordHashPool(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_MAX_PENDING)
+
+
 def create_refresh_token(subject: str | Any) -> str:
     expire = datetime.now(timezone.utc) + timedelta(days=30)
     to_encode = {"exp": expire, "sub": str(subject), "type": "refresh"}
@@ -35,11 +105,22 @@ def create_refresh_token(subject: str | Any) -> str:
     return encoded_jwt
 
 
+# 토큰 digest -> 검증된 claims. 토큰의 만료 시각까지만 보관합니다.
+token_cache: TTLCache[bytes, dict] = TTLCache(settings.AUTH_CACHE_SIZE, enabled=settings.AUTH_CACHE_ENABLED)
+
+
 def verify_token(token: str) -> dict:
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    payload = token_cache.get(key)
+    if payload is not None:
+        return payload
+
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token has expired")
     except jwt.PyJWTError:
         raise HTTPException(status_code=500, detail="Could not validate token")
+
+    token_cache.set(key, payload, ttl=payload.get("exp", 0) - time.time())
+    return payload
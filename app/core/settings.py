@@ -8,8 +8,38 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     DB_URI: str = ""
 
+    # bcrypt 해시/검증을 수행할 프로세스 수 (None이면 CPU 코어 수)
+    PASSWORD_HASH_WORKERS: int | None = None
+    # 처리 대기 중인 해시/검증 작업 수 상한. 초과하면 503으로 거절합니다.
+    PASSWORD_HASH_MAX_PENDING: int = 256
+
+    # 검증한 JWT와 인증된 사용자를 캐시할지 여부와 캐시별 최대 항목 수
+    AUTH_CACHE_ENABLED: bool = True
+    AUTH_CACHE_SIZE: int = 10000
+    # 사용자 캐시 유지 시간(초). 0이면 사용자는 캐시하지 않고 매 요청마다 조회합니다.
+    USER_CACHE_TTL_SECONDS: float = 5
+
+    # 응답에 단계별 처리 시간(Server-Timing 헤더)을 붙일지 여부와, 같은 내용을 요청마다 로그로 남길지 여부
+    SERVER_TIMING_ENABLED: bool = False
+    SERVER_TIMING_LOG: bool = False
+
+    # 요청별 SQL 문 수/시간 집계 여부. 켜면 같은 문이 QUERY_N_PLUS_ONE_THRESHOLD번 이상 반복될 때 N+1로 경고하고,
+    # SLOW_QUERY_MS(밀리초) 이상 걸린 문은 실행 계획과 함께 로그로 남깁니다. None이면 느린 쿼리 로그를 끕니다.
+    QUERY_LOG_ENABLED: bool = False
+    QUERY_N_PLUS_ONE_THRESHOLD: int = 5
+    SLOW_QUERY_MS: float | None = 100
+
+    # /metrics로 요청 수/지연 시간 등의 지표를 내보낼지 여부. 경로별 트래픽과 DB 통계가 드러나므로 기본은 끔.
+    # METRICS_TOKEN을 설정하면 Authorization: Bearer <METRICS_TOKEN> 헤더가 있는 요청에만 응답합니다.
+    METRICS_ENABLED: bool = False
+    METRICS_TOKEN: str | None = None
+
     MEDIA_URL: str = "media"
     MEDIA_ROOT: str = "../media"
+    # 업로드 파일 최대 크기(bytes). 넘으면 413으로 거절합니다.
+    UPLOAD_MAX_SIZE: int = 100 * 1024 * 1024
+    # 업로드를 디스크에 쓸 때 한 번에 읽는 크기(bytes). 업로드당 메모리 사용량의 상한입니다.
+    UPLOAD_CHUNK_SIZE: int = 1024 * 1024
 
 
 settings = Settings()
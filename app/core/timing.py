@@ -0,0 +1,107 @@
+"""
+요청 하나를 처리하는 동안 단계별로 걸린 시간을 모읍니다.
+
+ServerTimingMiddleware가 요청마다 RequestTiming을 current_timing에 넣고, 각 단계는 measure()로 감싸 시간을 더합니다.
+DB 시간과 쿼리 수는 엔진 이벤트로 모으며, 다른 단계 안에서 실행된 쿼리 시간은 그 단계가 아닌 db에만 더합니다.
+측정 중이 아니면 measure()는 공유된 nullcontext를 돌려주므로 ContextVar 조회 한 번 외의 비용은 없습니다.
+"""
+
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, ContextManager, Iterator
+
+from fastapi import routing
+from sqlalchemy import Engine
+
+from app.core import db_events
+
+_NOOP = nullcontext()
+
+
+class RequestTiming:
+    __slots__ = ("started", "durations", "db_time", "db_count")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.durations: dict[str, float] = {}
+        self.db_time = 0.0
+        self.db_count = 0
+
+    def add(self, phase: str, seconds: float) -> None:
+        self.durations[phase] = self.durations.get(phase, 0.0) + seconds
+
+    def phases(self) -> dict[str, float]:
+        """
+        지금까지의 단계별 시간(초). 따로 재지 않은 나머지 시간은 handler로,
+        의존성 풀이와 라우팅도 여기에 포함됩니다.
+        """
+        total = time.perf_counter() - self.started
+        phases = {**self.durations, "db": self.db_time}
+        phases["handler"] = max(total - sum(phases.values()), 0.0)
+        phases["total"] = total
+        return phases
+
+    def header(self, phases: dict[str, float]) -> str:
+        metrics = []
+        for phase, seconds in phases.items():
+            metric = f"{phase};dur={seconds * 1000:.2f}"
+            if phase == "db":
+                metric += f';desc="{self.db_count} queries"'
+            metrics.append(metric)
+        return ", ".join(metrics)
+
+
+current_timing: ContextVar[RequestTiming | None] = ContextVar("current_timing", default=None)
+
+
+@contextmanager
+def _measure(timing: RequestTiming, phase: str) -> Iterator[None]:
+    started, db_time = time.perf_counter(), timing.db_time
+    try:
+        yield
+    finally:
+        timing.add(phase, time.perf_counter() - started - (timing.db_time - db_time))
+
+
+def measure(phase: str) -> ContextManager[None]:
+    """현재 요청의 phase 단계 시간을 잽니다. 측정 중인 요청이 없으면 아무것도 하지 않습니다."""
+    timing = current_timing.get()
+    if timing is None:
+        return _NOOP
+    return _measure(timing, phase)
+
+
+def _on_statement(conn, statement, parameters, executemany, seconds) -> None:
+    timing = current_timing.get()
+    if timing is not None:
+        timing.db_time += seconds
+        timing.db_count += 1
+
+
+def instrument_engine(engine: Engine) -> None:
+    """engine에서 실행되는 쿼리의 시간과 수를 현재 요청에 더합니다. 여러 번 호출해도 한 번만 등록됩니다."""
+    db_events.instrument_engine(engine)
+    db_events.subscribe(_on_statement)
+
+
+def instrument_serialization() -> None:
+    """
+    FastAPI가 response_model로 응답을 검증하고 JSON으로 직렬화하는 시간을 encode 단계로 잽니다.
+    여러 번 호출해도 한 번만 감쌉니다.
+
+    응답 클래스를 바꾸면 FastAPI가 pydantic에서 바로 JSON bytes를 만드는 경로(dump_json)를 쓰지 않으므로,
+    응답 클래스 대신 라우터가 호출하는 fastapi.routing.serialize_response를 감쌉니다.
+    """
+    serialize_response = routing.serialize_response
+    if getattr(serialize_response, "_timed", False):
+        return
+
+    @wraps(serialize_response)
+    async def timed_serialize_response(**kwargs: Any) -> Any:
+        with measure("encode"):
+            return await serialize_response(**kwargs)
+
+    timed_serialize_response._timed = True
+    routing.serialize_response = timed_serialize_response
@@ -1,9 +1,10 @@
-from typing import Annotated, Generator
+from typing import Annotated, AsyncGenerator, Generator
 
 from fastapi import Depends
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.core.db import engine
+from app.core.db import async_engine, engine
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -11,4 +12,10 @@ def get_db() -> Generator[Session, None, None]:
         yield session
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSession(bind=async_engine, expire_on_commit=False) as session:
+        yield session
+
+
 SessionDep = Annotated[Session, Depends(get_db)]
+AsyncSessionDep = Annotated[AsyncSession, Depends(get_async_db)]
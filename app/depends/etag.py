@@ -0,0 +1,30 @@
+from fastapi import Depends, HTTPException, Request, Response
+
+from app.depends.db import AsyncSessionDep
+from app.depends.user import UserIDDepends
+from app.models.counter import Counter
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match는 약한 비교를 사용하므로 W/ 접두사는 무시
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+async def check_etag(request: Request, response: Response, session: AsyncSessionDep, user_id: UserIDDepends) -> None:
+    """
+    사용자 데이터 버전(Counter.version)으로 ETag를 만듭니다.
+    If-None-Match가 일치하면 조회 쿼리를 실행하기 전에 304로 응답합니다.
+    """
+    # 카운터 행이 없으면 아직 바뀐 적이 없으므로 버전 0. 집계는 핸들러에 맡김
+    version = await Counter.get_version(session, user_id) or 0
+
+    headers = {"ETag": f'"{user_id}-{version}"', "Cache-Control": "private, no-cache"}
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match and etag_matches(if_none_match, headers["ETag"]):
+        raise HTTPException(status_code=304, headers=headers)
+    response.headers.update(headers)
+
+
+ETagCheck = Depends(check_etag)
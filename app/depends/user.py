@@ -1,25 +1,48 @@
 from typing import Annotated
 
 from fastapi import Depends, HTTPException
+from sqlalchemy import event
 from sqlmodel import select
 
+from app.core.cache import TTLCache
 from app.core.security import verify_token
-from app.depends.db import SessionDep
+from app.core.settings import settings
+from app.core.timing import measure
+from app.depends.db import AsyncSessionDep
 from app.depends.token import get_token_from_header
 from app.models.user import User
 
+# user_id -> 인증된 사용자. 세션에서 분리된 객체이므로 관계 속성은 로드할 수 없습니다.
+user_cache: TTLCache[int, User] = TTLCache(
+    settings.AUTH_CACHE_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS, enabled=settings.AUTH_CACHE_ENABLED
+)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def invalidate_cached_user(mapper, connection, target: User) -> None:
+    # ORM을 거치지 않은 변경은 TTL이 지나야 반영됩니다
+    user_cache.invalidate(target.id)
+
 
 def get_user_id(token: str = Depends(get_token_from_header)) -> int:
-    payload = verify_token(token)
+    with measure("auth"):
+        payload = verify_token(token)
     return int(payload["sub"])
 
 
-def get_user(session: SessionDep, token: str = Depends(get_token_from_header)) -> User:
-    payload = verify_token(token)
-    user = session.exec(select(User).where(User.id == int(payload["sub"]))).one_or_none()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    return user
+async def get_user(session: AsyncSessionDep, user_id: int = Depends(get_user_id)) -> User:
+    # get_user_id를 거치므로 같은 요청에서 UserIDDepends와 함께 써도 토큰은 한 번만 검증
+    with measure("auth"):
+        user = user_cache.get(user_id)
+        if user is not None:
+            return user
+
+        user = (await session.exec(select(User).where(User.id == user_id))).one_or_none()
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+        user_cache.set(user_id, user)
+        return user
 
 
 UserDepends = Annotated[User, Depends(get_user)]
@@ -4,6 +4,8 @@ from .http_exception import (
     ConflictHTTPException,
     ForbiddenHTTPException,
     NotFoundHTTPException,
+    PayloadTooLargeHTTPException,
+    ServiceUnavailableHTTPException,
     UnauthorizedHTTPException,
 )
 
@@ -13,5 +15,7 @@ __all__ = [
     "ConflictHTTPException",
     "ForbiddenHTTPException",
     "NotFoundHTTPException",
+    "PayloadTooLargeHTTPException",
+    "ServiceUnavailableHTTPException",
     "UnauthorizedHTTPException",
 ]
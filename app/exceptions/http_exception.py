@@ -24,3 +24,13 @@ class UnauthorizedHTTPException(HTTPException):
 class BadRequestHTTPException(HTTPException):
     def __init__(self, detail: str = "잘못된 요청입니다"):
         super().__init__(status_code=400, detail=detail)
+
+
+class ServiceUnavailableHTTPException(HTTPException):
+    def __init__(self, detail: str = "요청이 많아 잠시 후 다시 시도해주세요"):
+        super().__init__(status_code=503, detail=detail)
+
+
+class PayloadTooLargeHTTPException(HTTPException):
+    def __init__(self, detail: str = "요청 본문이 너무 큽니다"):
+        super().__init__(status_code=413, detail=detail)
@@ -2,23 +2,28 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 
 from app.core.settings import settings
-from app.middleware import SQLAlchemyExceptionMiddleware
+from app.middleware import (
+    MetricsMiddleware,
+    QueryLogMiddleware,
+    ServerTimingMiddleware,
+    SQLAlchemyExceptionMiddleware,
+)
 
-from .routers import auth, file, goal, note, todo, user
+from .routers import auth, export, file, goal, importer, media, metrics, note, sync, todo, user
 
 
-# 임시코드임 나중에 alembic 으로 대체예정
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    from sqlmodel import SQLModel
-
-    from app.core.db import engine
+    from app.core.db import async_engine
+    from app.core.migration import run_migrations
+    from app.core.security import password_hash_pool
 
-    SQLModel.metadata.create_all(engine)
+    run_migrations()
     yield
+    password_hash_pool.shutdown()
+    await async_engine.dispose()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -33,7 +38,14 @@ app.add_middleware(
 
 app.add_middleware(SQLAlchemyExceptionMiddleware)
 
-app.mount("/media", StaticFiles(directory=settings.MEDIA_ROOT), name="media")
+# 꺼져 있으면 미들웨어와 엔진 이벤트를 등록하지 않으므로 비용이 없음
+if settings.SERVER_TIMING_ENABLED:
+    app.add_middleware(ServerTimingMiddleware, log=settings.SERVER_TIMING_LOG)
+if settings.QUERY_LOG_ENABLED:
+    app.add_middleware(QueryLogMiddleware, n_plus_one_threshold=settings.QUERY_N_PLUS_ONE_THRESHOLD)
+# 마지막에 추가한 미들웨어가 가장 바깥에서 실행되므로 다른 미들웨어가 바꾼 응답 상태까지 기록됨
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
 
 app.include_router(auth.router)
 app.include_router(user.router)
@@ -41,3 +53,9 @@ app.include_router(goal.router)
 app.include_router(todo.router)
 app.include_router(note.router)
 app.include_router(file.router)
+app.include_router(media.router)
+app.include_router(export.router)
+app.include_router(importer.router)
+app.include_router(sync.router)
+if settings.METRICS_ENABLED:
+    app.include_router(metrics.router)
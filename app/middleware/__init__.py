@@ -1,3 +1,6 @@
 from .error_handler import SQLAlchemyExceptionMiddleware
+from .metrics import MetricsMiddleware
+from .query_log import QueryLogMiddleware
+from .server_timing import ServerTimingMiddleware
 
-__all__ = ["SQLAlchemyExceptionMiddleware"]
+__all__ = ["MetricsMiddleware", "QueryLogMiddleware", "SQLAlchemyExceptionMiddleware", "ServerTimingMiddleware"]
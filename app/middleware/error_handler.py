@@ -1,22 +1,42 @@
-from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.exceptions.db_exception import handle_db_exception
 
 
-class SQLAlchemyExceptionMiddleware(BaseHTTPMiddleware):
-    """SQLAlchemy 예외를 처리하는 미들웨어"""
+class SQLAlchemyExceptionMiddleware:
+    """
+    SQLAlchemy 예외를 처리하는 미들웨어
+
+    요청과 응답을 별도 태스크나 메모리 스트림으로 감싸지 않는 순수 ASGI 미들웨어이므로
+    요청마다 추가 비용이 거의 없고 스트리밍 응답도 그대로 전달됩니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
 
-    async def dispatch(self, request: Request, call_next):
         try:
-            # 정상적인 요청 처리
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send_wrapper)
         except Exception as exc:
+            # 이미 응답을 보내기 시작했으면 바꿀 수 없으므로 서버에 맡김
+            if response_started:
+                raise
             http_exc = handle_db_exception(exc)
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=http_exc.status_code,
                 content={"detail": http_exc.detail},
             )
+            await response(scope, receive, send)
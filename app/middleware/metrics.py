@@ -0,0 +1,43 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import http_request_duration, http_requests, instrument_engine
+
+# 어떤 라우트와도 맞지 않은 요청(404 등)은 경로별로 나누지 않고 하나로 모음
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    라우트 경로 템플릿(/todos/{todo_id} 등)별로 요청 수와 처리 시간을 기록합니다.
+    처리 시간은 응답 본문을 모두 보낼 때까지이며, 응답 전에 예외가 나면 500으로 기록합니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        from app.core.db import async_engine, engine
+
+        self.app = app
+        for instrumented in (engine, async_engine.sync_engine):
+            instrument_engine(instrumented)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            http_requests.inc(scope["method"], route, str(status))
+            http_request_duration.observe(time.perf_counter() - started, scope["method"], route)
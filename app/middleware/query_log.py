@@ -0,0 +1,41 @@
+import logging
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.queries import instrument_engine, track_queries
+
+logger = logging.getLogger(__name__)
+
+
+class QueryLogMiddleware:
+    """
+    요청마다 실행된 SQL 문의 수와 시간을 집계합니다.
+
+    같은 문이 n_plus_one_threshold번 이상 반복되면 N+1로 의심해 라우트 경로와 함께 경고하고,
+    나머지 요청은 DEBUG 수준으로 요약만 남깁니다.
+    """
+
+    def __init__(self, app: ASGIApp, n_plus_one_threshold: int = 5):
+        from app.core.db import async_engine, engine
+
+        self.app = app
+        self.n_plus_one_threshold = n_plus_one_threshold
+        for instrumented in (engine, async_engine.sync_engine):
+            instrument_engine(instrumented)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as queries:
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                # 라우팅이 끝나면 scope에 매칭된 라우트가 들어 있음
+                route = getattr(scope.get("route"), "path", scope["path"])
+                for statement, count in queries.repeated(self.n_plus_one_threshold):
+                    logger.warning("Possible N+1 in %s %s: %d x %s", scope["method"], route, count, statement)
+                logger.debug(
+                    "%s %s: %d queries in %.2fms", scope["method"], route, queries.count, queries.total_time * 1000
+                )
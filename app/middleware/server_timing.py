@@ -0,0 +1,59 @@
+import json
+import logging
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.timing import RequestTiming, current_timing, instrument_engine, instrument_serialization
+
+logger = logging.getLogger(__name__)
+
+
+class ServerTimingMiddleware:
+    """
+    요청의 단계별 처리 시간(auth, db, encode, handler, total)을 Server-Timing 헤더로 응답합니다.
+
+    시간은 응답 헤더를 보내는 시점까지 측정하므로 스트리밍 응답의 본문을 만드는 시간은 포함되지 않습니다.
+    log가 True이면 같은 내용을 요청마다 JSON 한 줄로 로그에 남깁니다.
+    """
+
+    def __init__(self, app: ASGIApp, log: bool = False):
+        from app.core.db import async_engine, engine
+
+        self.app = app
+        self.log = log
+        for instrumented in (engine, async_engine.sync_engine):
+            instrument_engine(instrumented)
+        instrument_serialization()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timing = RequestTiming()
+        token = current_timing.set(timing)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                phases = timing.phases()
+                MutableHeaders(scope=message).append("Server-Timing", timing.header(phases))
+                if self.log:
+                    self._log(scope, message["status"], timing, phases)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            current_timing.reset(token)
+
+    @staticmethod
+    def _log(scope: Scope, status: int, timing: RequestTiming, phases: dict[str, float]) -> None:
+        record = {
+            "method": scope["method"],
+            "path": scope["path"],
+            "status": status,
+            **{f"{phase}_ms": round(seconds * 1000, 2) for phase, seconds in phases.items()},
+            "db_count": timing.db_count,
+        }
+        logger.info(json.dumps(record))
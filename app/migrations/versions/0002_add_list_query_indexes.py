@@ -0,0 +1,31 @@
+"""add list query indexes
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 17:45:37.867147
+"""
+
+from typing import Sequence
+
+from alembic import op
+
+revision: str = "0002"
+down_revision: str | None = "0001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_file_user_id_id", "file", ["user_id", "id"], if_not_exists=True)
+    op.create_index("ix_goal_user_id_id", "goal", ["user_id", "id"], if_not_exists=True)
+    op.create_index("ix_note_user_id_goal_id_id", "note", ["user_id", "goal_id", "id"], if_not_exists=True)
+    op.create_index("ix_todo_user_id_goal_id_done_id", "todo", ["user_id", "goal_id", "done", "id"], if_not_exists=True)
+    op.create_index("ix_todo_user_id_id", "todo", ["user_id", "id"], if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_todo_user_id_id", table_name="todo")
+    op.drop_index("ix_todo_user_id_goal_id_done_id", table_name="todo")
+    op.drop_index("ix_note_user_id_goal_id_id", table_name="note")
+    op.drop_index("ix_goal_user_id_id", table_name="goal")
+    op.drop_index("ix_file_user_id_id", table_name="file")
@@ -0,0 +1,35 @@
+"""add counter table
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 17:50:17.286193
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0003"
+down_revision: str | None = "0002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # 기존 데이터의 카운터는 0011에서 채움
+    op.create_table(
+        "counter",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("goal_id", sa.Integer(), nullable=False),
+        sa.Column("goals", sa.Integer(), nullable=False),
+        sa.Column("todos", sa.Integer(), nullable=False),
+        sa.Column("done_todos", sa.Integer(), nullable=False),
+        sa.Column("notes", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"]),
+        sa.PrimaryKeyConstraint("user_id", "goal_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("counter")
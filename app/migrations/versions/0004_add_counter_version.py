@@ -0,0 +1,25 @@
+"""add counter version
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 18:20:41.507318
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0004"
+down_revision: str | None = "0003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("counter", sa.Column("version", sa.Integer(), server_default="0", nullable=False))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("counter") as batch_op:
+        batch_op.drop_column("version")
@@ -0,0 +1,46 @@
+"""add change sequence and tombstone table
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 18:41:12.930447
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0005"
+down_revision: str | None = "0004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+SYNCED_TABLES = ("goal", "todo", "note")
+
+
+def upgrade() -> None:
+    # 기존 행은 0으로 시작하므로 since 없이 요청하는 첫 동기화에 모두 포함됨
+    for table in SYNCED_TABLES:
+        op.add_column(table, sa.Column("change_seq", sa.Integer(), server_default="0", nullable=False))
+        op.create_index(f"ix_{table}_user_id_change_seq_id", table, ["user_id", "change_seq", "id"])
+
+    op.create_table(
+        "tombstone",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("entity", sa.String(), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column("change_seq", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_tombstone_user_id_change_seq_id", "tombstone", ["user_id", "change_seq", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tombstone_user_id_change_seq_id", table_name="tombstone")
+    op.drop_table("tombstone")
+    for table in SYNCED_TABLES:
+        op.drop_index(f"ix_{table}_user_id_change_seq_id", table_name=table)
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column("change_seq")
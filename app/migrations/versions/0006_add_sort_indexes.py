@@ -0,0 +1,30 @@
+"""add created_at/updated_at sort indexes
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 19:02:37.114520
+"""
+
+from typing import Sequence
+
+from alembic import op
+
+revision: str = "0006"
+down_revision: str | None = "0005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+SORTED_TABLES = ("goal", "todo", "note")
+SORT_COLUMNS = ("created_at", "updated_at")
+
+
+def upgrade() -> None:
+    for table in SORTED_TABLES:
+        for column in SORT_COLUMNS:
+            op.create_index(f"ix_{table}_user_id_{column}_id", table, ["user_id", column, "id"])
+
+
+def downgrade() -> None:
+    for table in SORTED_TABLES:
+        for column in SORT_COLUMNS:
+            op.drop_index(f"ix_{table}_user_id_{column}_id", table_name=table)
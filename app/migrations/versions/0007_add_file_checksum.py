@@ -0,0 +1,25 @@
+"""add file checksum
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 19:41:08.265913
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0007"
+down_revision: str | None = "0006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("file", sa.Column("checksum", sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("file") as batch_op:
+        batch_op.drop_column("checksum")
@@ -0,0 +1,31 @@
+"""add blob table
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18 20:07:52.630194
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0008"
+down_revision: str | None = "0007"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # 기존 파일은 사용자별 경로에 그대로 두고 checksum 없이 남김
+    op.create_table(
+        "blob",
+        sa.Column("checksum", sa.String(), nullable=False),
+        sa.Column("size", sa.Integer(), nullable=False),
+        sa.Column("ref_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("checksum"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("blob")
@@ -0,0 +1,23 @@
+"""add file checksum index
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18 20:31:15.804417
+"""
+
+from typing import Sequence
+
+from alembic import op
+
+revision: str = "0009"
+down_revision: str | None = "0008"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_file_checksum", "file", ["checksum"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_file_checksum", table_name="file")
@@ -0,0 +1,25 @@
+"""add todo insert sentinel
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-18 23:12:40.518206
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0010"
+down_revision: str | None = "0009"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("todo", sa.Column("_sentinel", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("todo") as batch_op:
+        batch_op.drop_column("_sentinel")
@@ -0,0 +1,48 @@
+"""backfill counters
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-18 23:48:05.274913
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0011"
+down_revision: str | None = "0010"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Counter.compute와 같은 집계로 없는 카운터 행만 채움. 사용자 전체 행(goal_id = 0)과 목표별 행을 따로 넣습니다.
+BACKFILL_USER_ROWS = """
+INSERT INTO counter (user_id, goal_id, goals, todos, done_todos, notes)
+SELECT u.id, 0,
+    (SELECT COUNT(*) FROM goal WHERE goal.user_id = u.id),
+    (SELECT COUNT(*) FROM todo WHERE todo.user_id = u.id),
+    (SELECT COUNT(*) FROM todo WHERE todo.user_id = u.id AND todo.done),
+    (SELECT COUNT(*) FROM note WHERE note.user_id = u.id)
+FROM "user" AS u
+WHERE NOT EXISTS (SELECT 1 FROM counter WHERE counter.user_id = u.id AND counter.goal_id = 0)
+"""
+
+BACKFILL_GOAL_ROWS = """
+INSERT INTO counter (user_id, goal_id, goals, todos, done_todos, notes)
+SELECT g.user_id, g.id, 0,
+    (SELECT COUNT(*) FROM todo WHERE todo.user_id = g.user_id AND todo.goal_id = g.id),
+    (SELECT COUNT(*) FROM todo WHERE todo.user_id = g.user_id AND todo.goal_id = g.id AND todo.done),
+    (SELECT COUNT(*) FROM note WHERE note.user_id = g.user_id AND note.goal_id = g.id)
+FROM goal AS g
+WHERE NOT EXISTS (SELECT 1 FROM counter WHERE counter.user_id = g.user_id AND counter.goal_id = g.id)
+"""
+
+
+def upgrade() -> None:
+    op.execute(sa.text(BACKFILL_USER_ROWS))
+    op.execute(sa.text(BACKFILL_GOAL_ROWS))
+
+
+def downgrade() -> None:
+    # 채운 행은 이후의 증감과 구분할 수 없으므로 그대로 둠
+    pass
@@ -0,0 +1,28 @@
+"""add goal and note insert sentinel
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-19 00:21:37.640129
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0012"
+down_revision: str | None = "0011"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("goal", sa.Column("_sentinel", sa.Integer(), nullable=True))
+    op.add_column("note", sa.Column("_sentinel", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("note") as batch_op:
+        batch_op.drop_column("_sentinel")
+    with op.batch_alter_table("goal") as batch_op:
+        batch_op.drop_column("_sentinel")
@@ -0,0 +1,28 @@
+"""add goal-filtered todo indexes
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-19 10:12:48.503217
+"""
+
+from typing import Sequence
+
+from alembic import op
+
+revision: str = "0013"
+down_revision: str | None = "0012"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# 목표로만 거른 할 일 목록의 정렬 열 (id, 생성/수정 시각)
+SORT_COLUMNS = (("id",), ("created_at", "id"), ("updated_at", "id"))
+
+
+def upgrade() -> None:
+    for columns in SORT_COLUMNS:
+        op.create_index(f"ix_todo_user_id_goal_id_{'_'.join(columns)}", "todo", ["user_id", "goal_id", *columns])
+
+
+def downgrade() -> None:
+    for columns in SORT_COLUMNS:
+        op.drop_index(f"ix_todo_user_id_goal_id_{'_'.join(columns)}", table_name="todo")
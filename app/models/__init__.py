@@ -1,6 +1,10 @@
+from app.models.blob import Blob
+from app.models.counter import Counter
+from app.models.file import File
 from app.models.goal import Goal
 from app.models.note import Note
 from app.models.todo import Todo
+from app.models.tombstone import Tombstone
 from app.models.user import User
 
-__all__ = ["User", "Goal", "Todo", "Note"]
+__all__ = ["User", "Goal", "Todo", "Note", "File", "Counter", "Tombstone", "Blob"]
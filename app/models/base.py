@@ -1,9 +1,38 @@
+from collections import namedtuple
 from datetime import datetime, timezone
+from functools import lru_cache
 
-from sqlalchemy import func
+from pydantic import BaseModel
+from sqlalchemy import Index, func
+from sqlalchemy.orm import Bundle, InstrumentedAttribute
 from sqlmodel import Field, SQLModel
 
 
+@lru_cache(maxsize=None)
+def _record_type(name: str, fields: tuple[str, ...]) -> type[tuple]:
+    return namedtuple(name, fields)
+
+
+class Record(Bundle):
+    """
+    select()한 컬럼 묶음을 namedtuple 레코드 하나로 받는 Bundle입니다.
+
+    엔티티와 달리 identity map과 변경 추적을 거치지 않고, 속성 조회가 Row보다 훨씬 빨라
+    응답 모델이 레코드에서 바로 값을 읽는 목록 조회에 사용합니다. Record 안에 Record를 넣으면 중첩 레코드가 됩니다.
+    모든 컬럼이 NULL이면 (외부 조인에서 짝이 없으면) 레코드 대신 None을 반환합니다.
+    """
+
+    def create_row_processor(self, query, procs, labels):
+        make = _record_type(self.name, tuple(labels))._make
+
+        def proc(row):
+            values = [process(row) for process in procs]
+            # 외부 조인으로 짝이 없는 행은 모든 컬럼이 NULL이므로 레코드 대신 None
+            return make(values) if any(value is not None for value in values) else None
+
+        return proc
+
+
 class ModelBase(SQLModel):
     id: int = Field(default=None, primary_key=True)
     created_at: datetime = Field(
@@ -18,3 +47,30 @@ class ModelBase(SQLModel):
             "onupdate": lambda: datetime.now(timezone.utc),
         },
     )
+
+    @classmethod
+    def columns_for(cls, schema: type[BaseModel]) -> list[InstrumentedAttribute]:
+        """schema의 필드 중 이 테이블의 컬럼인 것만 반환합니다. 관계나 프로퍼티처럼 컬럼이 아닌 필드는 건너뜁니다."""
+        columns = cls.__table__.columns
+        return [getattr(cls, name) for name in schema.model_fields if name in columns]
+
+    @classmethod
+    def record(cls, schema: type[BaseModel], *columns) -> Record:
+        """schema에 필요한 이 테이블의 컬럼과 추가 columns를 테이블 이름의 레코드로 읽는 Record"""
+        return Record(cls.__tablename__, *cls.columns_for(schema), *columns)
+
+
+class SyncedModel(ModelBase):
+    """
+    동기화 API가 변경분을 찾는 엔티티입니다.
+
+    change_seq에 마지막으로 바뀐 시점의 사용자 데이터 버전(Counter.version)을 기록하며, Counter.stamp()로 채웁니다.
+    테이블마다 change_seq_index()를 __table_args__에 넣어야 합니다.
+    """
+
+    change_seq: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+
+    @staticmethod
+    def change_seq_index(table: str) -> Index:
+        """사용자별 변경분을 버전 순으로 읽는 인덱스"""
+        return Index(f"ix_{table}_user_id_change_seq_id", "user_id", "change_seq", "id")
@@ -0,0 +1,77 @@
+from sqlalchemy import delete, insert
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Field, SQLModel, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+BLOB_DIR = "blobs"
+
+
+class Blob(SQLModel, table=True):
+    """
+    내용 주소 방식으로 저장된 미디어 파일입니다.
+
+    같은 내용의 파일은 xxh3-128 해시(checksum)를 이름으로 한 번만 저장하고, 이를 가리키는 File 행의 수를
+    ref_count로 관리합니다. 디스크의 파일은 커밋 전에 쓰고, 지우는 것은 커밋이 끝난 뒤 claim_removed()로
+    blob 키를 다시 잡은 상태에서 합니다.
+    """
+
+    checksum: str = Field(primary_key=True)
+    size: int = Field(nullable=False)
+    ref_count: int = Field(default=0, nullable=False)
+
+    @staticmethod
+    def relative_path(checksum: str) -> str:
+        """media 폴더 내의 상대 경로. 한 디렉토리에 파일이 몰리지 않도록 해시 앞 두 글자로 나눕니다."""
+        return f"{BLOB_DIR}/{checksum[:2]}/{checksum}"
+
+    @classmethod
+    async def acquire(cls, session: AsyncSession, checksum: str, size: int) -> bool:
+        """참조를 하나 늘립니다. 새로 생긴 blob이라 파일을 써야 하면 True를 반환합니다."""
+        query = (
+            update(cls)
+            .where(cls.checksum == checksum)
+            .values(ref_count=cls.ref_count + 1, size=size)
+            .returning(cls.ref_count)
+        )
+        ref_count = (await session.exec(query)).scalar_one_or_none()
+        if ref_count is not None:
+            # ref_count가 0인 행은 claim_removed()가 잡아 둔 키일 뿐이므로 파일이 지워지는 중일 수 있음
+            return ref_count == 1
+        try:
+            async with session.begin_nested():
+                await session.exec(insert(cls).values(checksum=checksum, size=size, ref_count=1))
+        except IntegrityError:
+            # 다른 요청이 먼저 만든 경우
+            return (await session.exec(query)).scalar_one() == 1
+        return True
+
+    @classmethod
+    async def release(cls, session: AsyncSession, checksum: str) -> bool:
+        """참조를 하나 줄입니다. 마지막 참조였다면 행을 지우고 True를 반환하므로 호출한 쪽에서 파일을 지워야 합니다."""
+        query = update(cls).where(cls.checksum == checksum).values(ref_count=cls.ref_count - 1).returning(cls.ref_count)
+        ref_count = (await session.exec(query)).scalar_one_or_none()
+        if ref_count is None or ref_count > 0:
+            return False
+        await session.exec(delete(cls).where(cls.checksum == checksum))
+        return True
+
+    @classmethod
+    async def claim_removed(cls, session: AsyncSession, checksum: str) -> bool:
+        """
+        release()로 지운 blob을 다시 만든 요청이 없으면 ref_count가 0인 행을 넣어 키를 잡고 True를 반환합니다.
+        키를 잡은 동안 같은 내용의 업로드는 acquire()에서 기다리므로, 호출한 쪽은 파일을 지운 뒤
+        drop_claim()과 커밋으로 키를 놓아야 합니다. 그 사이 다시 만들어졌으면 False이고 파일은 그대로 둡니다.
+
+        SQLite에서는 바깥 트랜잭션 없이 연 savepoint를 놓는 순간 커밋되어 키가 바로 보이므로, savepoint 없이
+        새 트랜잭션에서 호출해야 합니다. 실패하면 그 트랜잭션을 롤백합니다.
+        """
+        try:
+            await session.exec(insert(cls).values(checksum=checksum, size=0, ref_count=0))
+        except IntegrityError:
+            await session.rollback()
+            return False
+        return True
+
+    @classmethod
+    async def drop_claim(cls, session: AsyncSession, checksum: str) -> None:
+        await session.exec(delete(cls).where(cls.checksum == checksum, cls.ref_count == 0))
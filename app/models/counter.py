@@ -0,0 +1,255 @@
+from collections import defaultdict
+from typing import Iterable, Sequence
+
+from sqlalchemy import case, func, insert
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Field, SQLModel, select, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.base import SyncedModel
+from app.models.goal import Goal
+from app.models.note import Note
+from app.models.todo import Todo
+from app.models.user import User
+
+# goal_id가 USER_SCOPE인 행은 사용자 전체 집계, 나머지는 목표별 집계
+USER_SCOPE = 0
+
+COUNTER_FIELDS = ("goals", "todos", "done_todos", "notes")
+
+
+class Counter(SQLModel, table=True):
+    """
+    사용자/목표별 개수를 비정규화해 저장하는 카운터입니다.
+
+    생성/수정/삭제 핸들러가 같은 트랜잭션 안에서 increment()로 갱신합니다.
+    카운터 도입 전의 데이터는 마이그레이션이 채웁니다. 그래도 행이 없으면 갱신은 건너뛰고,
+    조회 시 get()이 실제 데이터로부터 계산한 값을 저장하지 않고 돌려줍니다. 저장된 행은 reconcile()로 바로잡습니다.
+    """
+
+    user_id: int = Field(foreign_key="user.id", primary_key=True)
+    goal_id: int = Field(default=USER_SCOPE, primary_key=True)
+    goals: int = Field(default=0)
+    todos: int = Field(default=0)
+    done_todos: int = Field(default=0)
+    notes: int = Field(default=0)
+    # 사용자 데이터가 바뀔 때마다 1씩 증가 (USER_SCOPE 행만 사용). ETag를 만드는 데 씁니다.
+    version: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+
+    @property
+    def progress(self) -> float:
+        """완료된 할 일의 비율. 할 일이 없으면 0입니다."""
+        if self.todos == 0:
+            return 0.0
+        return self.done_todos / self.todos
+
+    def count_todos(self, done: bool | None = None) -> int:
+        if done is None:
+            return self.todos
+        return self.done_todos if done else self.todos - self.done_todos
+
+    @classmethod
+    async def increment(cls, session: AsyncSession, user_id: int, goal_ids: Sequence[int], **deltas: int) -> None:
+        """주어진 범위(USER_SCOPE 또는 목표 id)의 행에 증감을 반영합니다."""
+        values = {name: getattr(cls, name) + delta for name, delta in deltas.items() if delta}
+        if not values or not goal_ids:
+            return
+        await session.exec(update(cls).where(cls.user_id == user_id, cls.goal_id.in_(goal_ids)).values(**values))
+
+    @classmethod
+    async def touch(cls, session: AsyncSession, user_id: int) -> int:
+        """
+        사용자 데이터의 버전을 올리고 새 값을 반환합니다.
+        목표/할 일/노트를 바꾸는 요청은 엔티티를 바꾸기 전에 호출하고, 바뀐 행의 change_seq에 이 값을 기록해야 합니다.
+        사용자 행이 없으면 실제 데이터로부터 그 행만 만들며, 호출한 쪽의 트랜잭션을 커밋하거나 롤백하지 않습니다.
+        카운터 행의 잠금이 커밋까지 유지되므로 같은 사용자의 쓰기는 버전 순서대로 커밋됩니다.
+        """
+        query = (
+            update(cls)
+            .where(cls.user_id == user_id, cls.goal_id == USER_SCOPE)
+            .values(version=cls.version + 1)
+            .returning(cls.version)
+        )
+        version = (await session.exec(query)).scalar_one_or_none()
+        if version is None:
+            await cls._create_user_row(session, user_id)
+            version = (await session.exec(query)).scalar_one()
+        return version
+
+    @classmethod
+    async def stamp(cls, session: AsyncSession, user_id: int, entity: SyncedModel) -> int:
+        """
+        touch()로 버전을 올리고 entity의 change_seq에 기록한 뒤 새 버전을 반환합니다.
+        카운터 행을 만들 때 집계가 수정 전 데이터를 보도록, entity의 필드를 바꾸거나 세션에 추가하기 전에
+        호출해야 합니다.
+        """
+        entity.change_seq = await cls.touch(session, user_id)
+        return entity.change_seq
+
+    @classmethod
+    async def _create_user_row(cls, session: AsyncSession, user_id: int) -> None:
+        """
+        없는 USER_SCOPE 행을 실제 데이터로부터 만듭니다. 호출한 쪽의 트랜잭션 안에서 savepoint로만 쓰고
+        커밋/롤백하지 않으므로, 집계가 수정 전 데이터를 보도록 엔티티를 바꾸기 전에 호출해야 합니다.
+        """
+        live = (await cls.compute(session, user_id)).get((user_id, USER_SCOPE), cls(user_id=user_id))
+        try:
+            async with session.begin_nested():
+                await session.exec(insert(cls).values(**live.model_dump()))
+        except IntegrityError:
+            # 다른 요청이 먼저 만든 경우
+            pass
+
+    @classmethod
+    async def get_version(cls, session: AsyncSession, user_id: int) -> int | None:
+        """사용자 데이터의 버전. 카운터 행이 아직 없으면 None입니다."""
+        query = select(cls.version).where(cls.user_id == user_id, cls.goal_id == USER_SCOPE)
+        return (await session.exec(query)).first()
+
+    @classmethod
+    async def update_todo_stats(
+        cls,
+        session: AsyncSession,
+        user_id: int,
+        changes: Iterable[tuple[tuple[int, bool] | None, tuple[int, bool] | None]],
+    ) -> None:
+        """
+        할 일들의 (goal_id, done)이 old에서 new로 바뀐 것을 반영합니다. 생성이면 old, 삭제면 new가 None입니다.
+        할 일 수와 관계없이 증감이 같은 범위끼리 묶어 UPDATE 한 번씩만 실행합니다.
+        """
+        deltas: dict[int, list[int]] = defaultdict(lambda: [0, 0])
+        for old, new in changes:
+            for stats, sign in ((old, -1), (new, 1)):
+                if stats is None:
+                    continue
+                goal_id, done = stats
+                for scope in (USER_SCOPE, goal_id):
+                    deltas[scope][0] += sign
+                    deltas[scope][1] += sign * int(done)
+        scopes_by_delta: dict[tuple[int, int], list[int]] = defaultdict(list)
+        for scope, delta in deltas.items():
+            scopes_by_delta[tuple(delta)].append(scope)
+        for (todos, done_todos), scopes in scopes_by_delta.items():
+            await cls.increment(session, user_id, scopes, todos=todos, done_todos=done_todos)
+
+    @classmethod
+    async def get(cls, session: AsyncSession, user_id: int, goal_id: int = USER_SCOPE) -> "Counter":
+        return (await cls.get_many(session, user_id, [goal_id]))[0]
+
+    @classmethod
+    async def get_many(
+        cls, session: AsyncSession, user_id: int, goal_ids: Sequence[int] | None = None
+    ) -> list["Counter"]:
+        """
+        여러 카운터를 한 번의 쿼리로 조회합니다. goal_ids가 없으면 사용자의 모든 목표 행을 goal_id 순으로 반환합니다.
+        사용자의 목표가 아닌 id는 행을 만들지 않고 0으로 채웁니다.
+        """
+        query = select(cls).where(cls.user_id == user_id)
+        if goal_ids is None:
+            query = query.where(cls.goal_id != USER_SCOPE)
+        else:
+            query = query.where(cls.goal_id.in_(goal_ids))
+        query = query.order_by(cls.goal_id)
+
+        counters = {counter.goal_id: counter for counter in await session.exec(query)}
+        if await cls._has_missing_rows(session, user_id, goal_ids, counters):
+            # 없는 행은 실제 데이터로 계산한 값으로 채우되 저장하지 않음 (호출한 쪽의 트랜잭션에 쓰지 않음)
+            live = await cls.compute(session, user_id)
+            counters = {
+                goal_id: counters.get(goal_id, counter)
+                for (_, goal_id), counter in sorted(live.items())
+                if goal_id != USER_SCOPE or goal_ids is not None
+            }
+
+        if goal_ids is None:
+            return list(counters.values())
+        return [counters.get(goal_id) or cls(user_id=user_id, goal_id=goal_id) for goal_id in goal_ids]
+
+    @classmethod
+    async def _has_missing_rows(
+        cls, session: AsyncSession, user_id: int, goal_ids: Sequence[int] | None, counters: dict[int, "Counter"]
+    ) -> bool:
+        if goal_ids is None:
+            user_counter = await session.get(cls, (user_id, USER_SCOPE))
+            return user_counter is None or user_counter.goals != len(counters)
+
+        missing = [goal_id for goal_id in goal_ids if goal_id not in counters]
+        if not missing:
+            return False
+        if USER_SCOPE in missing:
+            return True
+        # 행이 없는 id 중 실제 사용자의 목표가 있을 때만 다시 계산
+        query = select(Goal.id).where(Goal.user_id == user_id, Goal.id.in_(missing)).limit(1)
+        return (await session.exec(query)).first() is not None
+
+    @classmethod
+    async def compute(cls, session: AsyncSession, user_id: int | None = None) -> dict[tuple[int, int], "Counter"]:
+        """실제 데이터로부터 카운터 값을 집계합니다."""
+
+        def scoped(query, user_column):
+            return query if user_id is None else query.where(user_column == user_id)
+
+        computed: dict[tuple[int, int], Counter] = {}
+
+        def row(owner_id: int, goal_id: int) -> Counter:
+            key = (owner_id, goal_id)
+            if key not in computed:
+                computed[key] = cls(user_id=owner_id, goal_id=goal_id)
+            return computed[key]
+
+        for owner_id in await session.exec(scoped(select(User.id), User.id)):
+            row(owner_id, USER_SCOPE)
+        for goal_id, owner_id in await session.exec(scoped(select(Goal.id, Goal.user_id), Goal.user_id)):
+            row(owner_id, USER_SCOPE).goals += 1
+            row(owner_id, goal_id)
+
+        todo_query = select(Todo.user_id, Todo.goal_id, func.count(), func.sum(case((Todo.done, 1), else_=0))).group_by(
+            Todo.user_id, Todo.goal_id
+        )
+        for owner_id, goal_id, todos, done_todos in await session.exec(scoped(todo_query, Todo.user_id)):
+            for scope in (USER_SCOPE, goal_id):
+                if (owner_id, scope) in computed:
+                    computed[(owner_id, scope)].todos += todos
+                    computed[(owner_id, scope)].done_todos += done_todos
+
+        note_query = select(Note.user_id, Note.goal_id, func.count()).group_by(Note.user_id, Note.goal_id)
+        for owner_id, goal_id, notes in await session.exec(scoped(note_query, Note.user_id)):
+            for scope in (USER_SCOPE, goal_id):
+                if (owner_id, scope) in computed:
+                    computed[(owner_id, scope)].notes += notes
+
+        return computed
+
+    @classmethod
+    async def reconcile(
+        cls, session: AsyncSession, user_id: int | None = None, *, fix: bool = True
+    ) -> list[tuple[int, int]]:
+        """
+        저장된 카운터를 실제 집계와 비교해 어긋난 행의 (user_id, goal_id) 목록을 반환합니다.
+        fix가 True이면 어긋난 행을 바로잡고 커밋합니다. user_id가 없으면 전체 사용자를 대상으로 합니다.
+        """
+        computed = await cls.compute(session, user_id)
+        query = select(cls) if user_id is None else select(cls).where(cls.user_id == user_id)
+        stored = {(counter.user_id, counter.goal_id): counter for counter in await session.exec(query)}
+
+        drifted = []
+        for key, live in computed.items():
+            counter = stored.pop(key, None)
+            if counter is None:
+                drifted.append(key)
+                if fix:
+                    session.add(live)
+            elif any(getattr(counter, name) != getattr(live, name) for name in COUNTER_FIELDS):
+                drifted.append(key)
+                if fix:
+                    for name in COUNTER_FIELDS:
+                        setattr(counter, name, getattr(live, name))
+        # 삭제된 목표의 행
+        for key, counter in stored.items():
+            drifted.append(key)
+            if fix:
+                await session.delete(counter)
+
+        if fix and drifted:
+            await session.commit()
+        return sorted(drifted)
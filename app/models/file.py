@@ -1,13 +1,20 @@
 import os
-from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, AsyncIterable, AsyncIterator
+from uuid import uuid4
 
+import anyio
+import xxhash
 from fastapi import UploadFile
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.core.metrics import upload_bytes
 from app.core.settings import settings
+from app.exceptions import PayloadTooLargeHTTPException
 from app.models.base import ModelBase
+from app.models.blob import Blob
 
 if TYPE_CHECKING:
     from app.models.user import User
@@ -16,14 +23,17 @@ if TYPE_CHECKING:
 class FileBase(ModelBase):
     filename: str = Field(nullable=False)
     original_filename: str = Field(nullable=False)
-    file_path: str = Field(nullable=False)  # media 폴더 내의 상대 경로
+    file_path: str = Field(nullable=False)  # media 폴더 내의 상대 경로 (blobs/<해시 앞 두 글자>/<해시>)
     mime_type: str = Field(nullable=False)
     size: int = Field(nullable=False)  # 파일 크기 (bytes)
+    checksum: str | None = Field(default=None)  # 파일 내용의 xxh3-128 해시 (hex)
     user_id: int = Field(foreign_key="user.id", nullable=False)
 
 
 class File(FileBase, table=True):
-    user: "User" = Relationship(back_populates="files", sa_relationship_kwargs={"lazy": "selectin"})
+    __table_args__ = (Index("ix_file_user_id_id", "user_id", "id"), Index("ix_file_checksum", "checksum"))
+
+    user: "User" = Relationship(back_populates="files")
 
     def get_save_path(self) -> str:
         """
@@ -35,58 +45,123 @@ class File(FileBase, table=True):
         return os.path.join(settings.MEDIA_URL, self.file_path)
 
     @classmethod
-    async def create_from_upload(cls, upload_file: UploadFile, user_id: int) -> "File":
+    async def create_from_upload(cls, session: AsyncSession, upload_file: UploadFile, user_id: int) -> "File":
         """
-        UploadFile로부터 File 객체를 생성하고 파일을 저장합니다.
+        UploadFile로부터 File 객체를 생성해 세션에 추가하고, 같은 내용의 파일이 없을 때만 파일을 저장합니다.
+        커밋은 호출한 쪽에서 합니다.
         """
-        # 파일 정보 수집
-        content = await upload_file.read()
-        size = len(content)
-
         if not upload_file.filename:
             raise ValueError("파일 이름이 없습니다.")
-
-        # 파일명 생성 (날짜_랜덤문자열.확장자)
-        filename = f"{upload_file.filename}"
-
-        # 저장 경로 생성 (user_id/filename)
-        relative_path = f"{user_id}/{filename}"
-
-        # File 객체 생성
+        # 크기를 미리 알 수 있으면 읽기 전에 거절
+        if upload_file.size is not None and upload_file.size > settings.UPLOAD_MAX_SIZE:
+            raise PayloadTooLargeHTTPException()
+
+        # 먼저 해시만 계산해 같은 내용이 이미 저장되어 있으면 디스크에 쓰지 않음
+        digest = _UploadDigest()
+        async for chunk in cls._read_chunks(upload_file):
+            digest.update(chunk)
+        checksum = digest.hexdigest()
+        upload_bytes.inc(amount=digest.size)
+
+        # File 객체 생성 (경로 구분자가 들어간 파일명은 마지막 부분만 사용)
+        filename = Path(upload_file.filename).name
         file_obj = cls(
             filename=filename,
             original_filename=upload_file.filename,
-            file_path=relative_path,
+            file_path=Blob.relative_path(checksum),
             mime_type=upload_file.content_type or "application/octet-stream",
-            size=size,
+            size=digest.size,
+            checksum=checksum,
             user_id=user_id,
         )
 
-        # 파일 저장
-        await file_obj.save_file(content)
+        # 새 blob이거나 파일이 사라진 경우에만 저장
+        if (
+            await Blob.acquire(session, checksum, digest.size)
+            or not await anyio.Path(file_obj.get_save_path()).exists()
+        ):
+            await upload_file.seek(0)
+            await file_obj.save_stream(cls._read_chunks(upload_file))
+
+        session.add(file_obj)
+        await session.flush()
         return file_obj
 
-    async def save_file(self, content: bytes) -> None:
+    @staticmethod
+    async def _read_chunks(upload_file: UploadFile) -> AsyncIterator[bytes]:
+        while chunk := await upload_file.read(settings.UPLOAD_CHUNK_SIZE):
+            yield chunk
+
+    async def save_stream(self, chunks: AsyncIterable[bytes]) -> None:
         """
-        파일을 media 폴더에 저장합니다.
+        청크를 같은 디렉토리의 임시 파일에 쓰고, 끝까지 받으면 최종 경로로 옮깁니다.
+        쓰면서 크기와 체크섬을 계산하고, UPLOAD_MAX_SIZE를 넘으면 임시 파일을 지운 뒤 413으로 거절합니다.
+        디스크 I/O는 스레드에서 수행하므로 이벤트 루프를 막지 않습니다.
         """
-        full_path = Path(self.get_save_path())
-        full_path.parent.mkdir(parents=True, exist_ok=True)
-
-        full_path.write_bytes(content)
+        full_path = anyio.Path(self.get_save_path())
+        await full_path.parent.mkdir(parents=True, exist_ok=True)
+        # 같은 파일 시스템 안에서의 rename이어야 원자적으로 교체됨
+        temp_path = full_path.with_name(f".{full_path.name}.{uuid4().hex}.part")
 
-    async def delete_file(self) -> None:
+        digest = _UploadDigest()
+        try:
+            async with await anyio.open_file(temp_path, "wb") as temp_file:
+                async for chunk in chunks:
+                    digest.update(chunk)
+                    await temp_file.write(chunk)
+            await temp_path.replace(full_path)
+        except BaseException:
+            with anyio.CancelScope(shield=True):
+                await temp_path.unlink(missing_ok=True)
+            raise
+
+        self.size = digest.size
+        self.checksum = digest.hexdigest()
+
+    async def delete(self, session: AsyncSession) -> list["File"]:
         """
-        media 폴더에서 파일을 삭제합니다.
+        File 행을 지우고, 커밋한 뒤 media 폴더에서 지워야 할 파일의 목록을 반환합니다.
+        같은 내용을 가리키는 마지막 행이었을 때만 들어 있으며, 트랜잭션이 롤백되면 파일은 그대로 남아야 하므로
+        호출한 쪽에서 커밋이 끝난 뒤 remove_files()로 지웁니다.
         """
-        try:
-            full_path = Path(self.get_save_path())
-            if full_path.exists():
-                full_path.unlink()
-
-            # 빈 디렉토리 정리
-            directory = full_path.parent
-            if directory.exists() and not any(directory.iterdir()):
-                directory.rmdir()
-        except Exception as e:
-            print(f"파일 삭제 중 오류 발생: {e}")  # 로깅으로 대체하는 것이 좋습니다
+        await session.delete(self)
+        # checksum이 없는 행은 내용 주소 방식 이전에 사용자별 경로로 저장된 파일
+        if self.checksum is None or await Blob.release(session, self.checksum):
+            return [self]
+        return []
+
+    @staticmethod
+    async def remove_files(session: AsyncSession, files: list["File"]) -> None:
+        """
+        delete()가 반환한 파일을 media 폴더에서 삭제합니다. 커밋이 끝난 뒤 새 트랜잭션에서 호출합니다.
+        커밋과 삭제 사이에 같은 내용이 다시 올라와 blob이 새로 만들어졌으면 그 파일은 지우지 않습니다.
+        """
+        for file in files:
+            path = anyio.Path(file.get_save_path())
+            if file.checksum is None:
+                await path.unlink(missing_ok=True)
+                continue
+            if await Blob.claim_removed(session, file.checksum):
+                try:
+                    await path.unlink(missing_ok=True)
+                finally:
+                    await Blob.drop_claim(session, file.checksum)
+            # 파일마다 키를 바로 놓음
+            await session.commit()
+
+
+class _UploadDigest:
+    """읽은 청크의 크기와 xxh3-128 해시를 누적하고, UPLOAD_MAX_SIZE를 넘으면 413으로 거절합니다."""
+
+    def __init__(self):
+        self.size = 0
+        self._hash = xxhash.xxh3_128()
+
+    def update(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        if self.size > settings.UPLOAD_MAX_SIZE:
+            raise PayloadTooLargeHTTPException()
+        self._hash.update(chunk)
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
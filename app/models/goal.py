@@ -1,8 +1,9 @@
 from typing import TYPE_CHECKING
 
+from sqlalchemy import Index, insert_sentinel
 from sqlmodel import Field, Relationship
 
-from app.models.base import ModelBase
+from app.models.base import ModelBase, SyncedModel
 from app.models.user import User
 
 if TYPE_CHECKING:
@@ -15,7 +16,19 @@ class GoalBase(ModelBase):
     user_id: int = Field(foreign_key="user.id", nullable=False)
 
 
-class Goal(GoalBase, table=True):
+class Goal(GoalBase, SyncedModel, table=True):
+    __table_args__ = (
+        Index("ix_goal_user_id_id", "user_id", "id"),
+        SyncedModel.change_seq_index("goal"),
+        # 생성/수정 시각 정렬
+        Index("ix_goal_user_id_created_at_id", "user_id", "created_at", "id"),
+        Index("ix_goal_user_id_updated_at_id", "user_id", "updated_at", "id"),
+    )
+
     user: "User" = Relationship(back_populates="goals")
-    todos: list["Todo"] = Relationship(back_populates="goal", sa_relationship_kwargs={"lazy": "selectin"})
-    notes: list["Note"] = Relationship(back_populates="goal", sa_relationship_kwargs={"lazy": "selectin"})
+    todos: list["Todo"] = Relationship(back_populates="goal")
+    notes: list["Note"] = Relationship(back_populates="goal")
+
+
+# 가져오기에서 RETURNING 행을 입력 순서대로 받기 위한 열 (Todo._sentinel 참고)
+Goal.__table__.append_column(insert_sentinel("_sentinel"))
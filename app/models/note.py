@@ -1,8 +1,9 @@
 from typing import Optional
 
+from sqlalchemy import Index, insert_sentinel
 from sqlmodel import Field, Relationship
 
-from app.models.base import ModelBase
+from app.models.base import ModelBase, SyncedModel
 from app.models.goal import Goal
 from app.models.todo import Todo
 from app.models.user import User
@@ -17,7 +18,19 @@ class NoteBase(ModelBase):
     todo_id: int = Field(foreign_key="todo.id", nullable=False, unique=True)
 
 
-class Note(NoteBase, table=True):
-    user: "User" = Relationship(back_populates="notes", sa_relationship_kwargs={"lazy": "selectin"})
-    goal: "Goal" = Relationship(back_populates="notes", sa_relationship_kwargs={"lazy": "selectin"})
-    todo: "Todo" = Relationship(back_populates="note", sa_relationship_kwargs={"lazy": "selectin"})
+class Note(NoteBase, SyncedModel, table=True):
+    __table_args__ = (
+        Index("ix_note_user_id_goal_id_id", "user_id", "goal_id", "id"),
+        SyncedModel.change_seq_index("note"),
+        # 생성/수정 시각 정렬
+        Index("ix_note_user_id_created_at_id", "user_id", "created_at", "id"),
+        Index("ix_note_user_id_updated_at_id", "user_id", "updated_at", "id"),
+    )
+
+    user: "User" = Relationship(back_populates="notes")
+    goal: "Goal" = Relationship(back_populates="notes")
+    todo: "Todo" = Relationship(back_populates="note")
+
+
+# 가져오기에서 RETURNING 행을 입력 순서대로 받기 위한 열 (Todo._sentinel 참고)
+Note.__table__.append_column(insert_sentinel("_sentinel"))
@@ -1,8 +1,9 @@
 from typing import TYPE_CHECKING
 
+from sqlalchemy import Index, insert_sentinel
 from sqlmodel import Field, Relationship
 
-from app.models.base import ModelBase
+from app.models.base import ModelBase, SyncedModel
 
 if TYPE_CHECKING:
     from app.models.goal import Goal
@@ -20,11 +21,32 @@ class TodoBase(ModelBase):
     goal_id: int = Field(foreign_key="goal.id", nullable=False)
 
 
-class Todo(TodoBase, table=True):
+class Todo(TodoBase, SyncedModel, table=True):
+    __table_args__ = (
+        # 목표/완료 여부 필터 + id 커서 페이지네이션, 진행도 집계
+        Index("ix_todo_user_id_goal_id_done_id", "user_id", "goal_id", "done", "id"),
+        # 완료 여부 없이 목표로만 거른 목록
+        Index("ix_todo_user_id_goal_id_id", "user_id", "goal_id", "id"),
+        # 필터 없는 내 할 일 목록
+        Index("ix_todo_user_id_id", "user_id", "id"),
+        # 동기화
+        SyncedModel.change_seq_index("todo"),
+        # 생성/수정 시각 정렬
+        Index("ix_todo_user_id_created_at_id", "user_id", "created_at", "id"),
+        Index("ix_todo_user_id_updated_at_id", "user_id", "updated_at", "id"),
+        Index("ix_todo_user_id_goal_id_created_at_id", "user_id", "goal_id", "created_at", "id"),
+        Index("ix_todo_user_id_goal_id_updated_at_id", "user_id", "goal_id", "updated_at", "id"),
+    )
+
     user: "User" = Relationship(back_populates="todos")
     goal: "Goal" = Relationship(back_populates="todos")
-    note: "Note" = Relationship(back_populates="todo", sa_relationship_kwargs={"uselist": False, "lazy": "selectin"})
+    note: "Note" = Relationship(back_populates="todo", sa_relationship_kwargs={"uselist": False})
 
     @property
     def note_id(self) -> int | None:
         return self.note.id if self.note else None
+
+
+# 일괄 생성에서 RETURNING 행을 요청 순서대로 받기 위한 열. SQLite는 자동 증가 id를 순서 기준으로 쓸 수 없으므로
+# 이 열이 없으면 sort_by_parameter_order=True인 INSERT가 행마다 한 문씩 실행됩니다. 조회 문에는 포함되지 않습니다.
+Todo.__table__.append_column(insert_sentinel("_sentinel"))
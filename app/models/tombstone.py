@@ -0,0 +1,32 @@
+from typing import Iterable, Literal
+
+from sqlalchemy import Index, insert
+from sqlmodel import Field, SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+EntityType = Literal["goal", "todo", "note"]
+
+
+class Tombstone(SQLModel, table=True):
+    """
+    삭제된 목표/할 일/노트의 기록입니다. 동기화 API가 삭제를 클라이언트에 전달하는 데 씁니다.
+    """
+
+    __table_args__ = (Index("ix_tombstone_user_id_change_seq_id", "user_id", "change_seq", "id"),)
+
+    id: int = Field(default=None, primary_key=True)
+    user_id: int = Field(foreign_key="user.id", nullable=False)
+    entity: str = Field(nullable=False)
+    entity_id: int = Field(nullable=False)
+    change_seq: int = Field(nullable=False)
+
+    @classmethod
+    async def record(
+        cls, session: AsyncSession, user_id: int, entity: EntityType, entity_ids: Iterable[int], change_seq: int
+    ) -> None:
+        rows = [
+            {"user_id": user_id, "entity": entity, "entity_id": entity_id, "change_seq": change_seq}
+            for entity_id in entity_ids
+        ]
+        if rows:
+            await session.exec(insert(cls), params=rows)
@@ -20,7 +20,7 @@ class UserBase(ModelBase):
 class User(UserBase, table=True):
     hashed_password: str
 
-    goals: list["Goal"] = Relationship(back_populates="user", sa_relationship_kwargs={"lazy": "selectin"})
-    todos: list["Todo"] = Relationship(back_populates="user", sa_relationship_kwargs={"lazy": "selectin"})
-    notes: list["Note"] = Relationship(back_populates="user", sa_relationship_kwargs={"lazy": "selectin"})
-    files: list["File"] = Relationship(back_populates="user", sa_relationship_kwargs={"lazy": "selectin"})
+    goals: list["Goal"] = Relationship(back_populates="user")
+    todos: list["Todo"] = Relationship(back_populates="user")
+    notes: list["Note"] = Relationship(back_populates="user")
+    files: list["File"] = Relationship(back_populates="user")
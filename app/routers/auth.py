@@ -4,10 +4,10 @@ from sqlmodel import select
 from app.core.security import (
     create_access_token,
     create_refresh_token,
-    verify_password,
+    password_hash_pool,
     verify_token,
 )
-from app.depends.db import SessionDep
+from app.depends.db import AsyncSessionDep
 from app.depends.token import get_token_from_header
 from app.models.user import User
 
@@ -15,9 +15,9 @@ router = APIRouter(prefix="/auth", tags=["Auth"])
 
 
 @router.post("/login", name="로그인")
-async def login(session: SessionDep, email: str = Body(...), password: str = Body(...)):
-    user = session.exec(select(User).where(User.email == email)).one_or_none()
-    if not user or not verify_password(password, user.hashed_password):
+async def login(session: AsyncSessionDep, email: str = Body(...), password: str = Body(...)):
+    user = (await session.exec(select(User).where(User.email == email))).one_or_none()
+    if not user or not await password_hash_pool.verify(password, user.hashed_password):
         raise HTTPException(status_code=500, detail="이메일 또는 비밀번호가 잘못되었습니다")
 
     return {
@@ -28,7 +28,7 @@ async def login(session: SessionDep, email: str = Body(...), password: str = Bod
 
 
 @router.post("/tokens", name="토큰 재발급")
-async def refresh_token(session: SessionDep, token: str = Depends(get_token_from_header)):
+async def refresh_token(session: AsyncSessionDep, token: str = Depends(get_token_from_header)):
     # 토큰 검증
     payload = verify_token(token)
 
@@ -37,7 +37,7 @@ async def refresh_token(session: SessionDep, token: str = Depends(get_token_from
         raise HTTPException(status_code=500, detail="Invalid token type")
 
     # 사용자 확인
-    user = session.exec(select(User).where(User.id == int(payload["sub"]))).one_or_none()
+    user = (await session.exec(select(User).where(User.id == int(payload["sub"])))).one_or_none()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
@@ -0,0 +1,26 @@
+from typing import Literal
+
+from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
+
+from app.core.export import iter_ndjson, iter_zip
+from app.depends.user import UserIDDepends
+
+router = APIRouter(prefix="/export", tags=["Export"])
+
+
+@router.get("", name="데이터 내보내기")
+async def export_data(
+    user_id: UserIDDepends, export_format: Literal["ndjson", "zip"] = Query("ndjson", alias="format")
+):
+    if export_format == "zip":
+        return StreamingResponse(
+            iter_zip(user_id),
+            media_type="application/zip",
+            headers={"Content-Disposition": 'attachment; filename="export.zip"'},
+        )
+    return StreamingResponse(
+        iter_ndjson(user_id),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="export.ndjson"'},
+    )
@@ -1,5 +1,7 @@
-from fastapi import APIRouter, UploadFile
+from fastapi import APIRouter, HTTPException, UploadFile
+from sqlmodel import select
 
+from app.depends.db import AsyncSessionDep
 from app.depends.user import UserIDDepends
 from app.models.file import File
 
@@ -7,6 +9,18 @@ router = APIRouter(prefix="/files")
 
 
 @router.post("")
-async def upload_file(file: UploadFile, user_id: UserIDDepends):
-    file_obj = await File.create_from_upload(file, user_id=user_id)
-    return {"url": file_obj.get_media_url()}
+async def upload_file(session: AsyncSessionDep, file: UploadFile, user_id: UserIDDepends):
+    file_obj = await File.create_from_upload(session, file, user_id=user_id)
+    await session.commit()
+    return {"id": file_obj.id, "url": file_obj.get_media_url()}
+
+
+@router.delete("/{file_id}", status_code=204)
+async def delete_file(session: AsyncSessionDep, file_id: int, user_id: UserIDDepends) -> None:
+    file_obj = (await session.exec(select(File).where(File.id == file_id, File.user_id == user_id))).first()
+    if not file_obj:
+        raise HTTPException(status_code=404, detail="File not found")
+
+    orphaned = await file_obj.delete(session)
+    await session.commit()
+    await File.remove_files(session, orphaned)
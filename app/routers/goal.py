@@ -1,73 +1,54 @@
 from fastapi import APIRouter, HTTPException, Query
-from sqlalchemy import func
-from sqlmodel import asc, delete, desc, select
+from sqlmodel import delete, select
 
-from app.depends.db import SessionDep
+from app.depends.db import AsyncSessionDep
+from app.depends.etag import ETagCheck
 from app.depends.user import UserIDDepends
+from app.models.counter import USER_SCOPE, Counter
 from app.models.goal import Goal
-from app.schema.common import SortOrder
-from app.schema.goal import GoalCreate, GoalList, GoalUpdate
+from app.models.tombstone import Tombstone
+from app.schema.common import KeysetPaginator, SortField, SortOrder
+from app.schema.goal import GoalCreate, GoalList, GoalResponse, GoalUpdate
 
 router = APIRouter(prefix="/goals", tags=["Goal"])
 
 
-@router.get("", name="내 목표 리스트 조회", response_model=GoalList)
+@router.get("", name="내 목표 리스트 조회", response_model=GoalList, dependencies=[ETagCheck])
 async def get_goals(
-    session: SessionDep,
+    session: AsyncSessionDep,
     user_id: UserIDDepends,
-    cursor: int = Query(default=None, description="마지막으로 받은 목표의 ID"),
+    cursor: str | None = Query(default=None, description="이전 응답의 next_cursor"),
     size: int = Query(default=20, gt=0),
     sort_order: SortOrder = Query(default=SortOrder.DESC, alias="sortOrder"),
+    sort_by: SortField = Query(default=SortField.ID, alias="sortBy"),
 ):
-    total_count = session.scalar(select(func.count()).select_from(Goal).where(Goal.user_id == user_id))
-    assert total_count is not None
+    total_count = (await Counter.get(session, user_id)).goals
 
-    query = select(Goal).where(Goal.user_id == user_id)
+    # 커서 기반 페이지네이션. 응답에 필요한 컬럼만 레코드로 조회
+    paginator = KeysetPaginator(Goal, size, cursor, sort_order, sort_by)
+    query = paginator.apply(select(Goal.record(GoalResponse)).where(Goal.user_id == user_id))
 
-    # 커서 기반 페이지네이션
-    if cursor:
-        if sort_order == SortOrder.DESC:
-            query = query.where(Goal.id <= cursor)
-        else:
-            query = query.where(Goal.id >= cursor)
-
-    # 정렬
-    if sort_order == SortOrder.DESC:
-        query = query.order_by(desc(Goal.id))
-    else:
-        query = query.order_by(asc(Goal.id))
-
-    # 사이즈 제한
-    query = query.limit(size + 1)  # 다음 페이지 존재 여부 확인을 위해 1개 더 가져옴
-
-    goals = session.exec(query).all()
-
-    # 다음 페이지 커서 설정
-    next_cursor = None
-    if len(goals) > size:
-        next_cursor = goals[-1].id
-        goals = goals[:size]
-
-    # 전체 목표 수 조회
+    goals, next_cursor = paginator.paginate((await session.exec(query)).all())
 
     return GoalList(goals=goals, next_cursor=next_cursor, total_count=total_count)
 
 
 @router.post("", name="내 목표 생성", response_model=Goal)
-async def create_goal(session: SessionDep, user_id: UserIDDepends, goal: GoalCreate):
-    new_goal = Goal(
-        title=goal.title,
-        user_id=user_id,
-    )
+async def create_goal(session: AsyncSessionDep, user_id: UserIDDepends, goal: GoalCreate):
+    new_goal = Goal(title=goal.title, user_id=user_id)
+    await Counter.stamp(session, user_id, new_goal)
     session.add(new_goal)
-    session.commit()
-    session.refresh(new_goal)
+    await session.flush()
+    session.add(Counter(user_id=user_id, goal_id=new_goal.id))
+    await Counter.increment(session, user_id, [USER_SCOPE], goals=1)
+    await session.commit()
+    await session.refresh(new_goal)
     return new_goal
 
 
-@router.get("/{goal_id}", name="내 목표 조회", response_model=Goal)
-async def get_goal(session: SessionDep, user_id: UserIDDepends, goal_id: int):
-    goal = session.exec(select(Goal).where(Goal.id == goal_id, Goal.user_id == user_id)).first()
+@router.get("/{goal_id}", name="내 목표 조회", response_model=Goal, dependencies=[ETagCheck])
+async def get_goal(session: AsyncSessionDep, user_id: UserIDDepends, goal_id: int):
+    goal = (await session.exec(select(Goal).where(Goal.id == goal_id, Goal.user_id == user_id))).first()
 
     if not goal:
         raise HTTPException(status_code=404, detail="Goal not found")
@@ -76,29 +57,33 @@ async def get_goal(session: SessionDep, user_id: UserIDDepends, goal_id: int):
 
 
 @router.patch("/{goal_id}", name="내 목표 수정", response_model=Goal)
-async def update_goal(session: SessionDep, goal_id: int, user_id: UserIDDepends, goal: GoalUpdate):
-    db_goal = session.exec(select(Goal).where(Goal.id == goal_id, Goal.user_id == user_id)).first()
+async def update_goal(session: AsyncSessionDep, goal_id: int, user_id: UserIDDepends, goal: GoalUpdate):
+    db_goal = (await session.exec(select(Goal).where(Goal.id == goal_id, Goal.user_id == user_id))).first()
 
     if not db_goal:
         raise HTTPException(status_code=404, detail="Goal not found")
 
-    # 업데이트할 필드 설정
+    await Counter.stamp(session, user_id, db_goal)
     goal_data = goal.model_dump(exclude_unset=True)
     for key, value in goal_data.items():
         setattr(db_goal, key, value)
 
     session.add(db_goal)
-    session.commit()
-    session.refresh(db_goal)
+    # expire_on_commit=False라 커밋 후 다시 읽지 않음 (updated_at은 flush에서 채워짐)
+    await session.commit()
 
     return db_goal
 
 
 @router.delete("/{goal_id}", name="내 목표 삭제", status_code=204)
-async def delete_goal(session: SessionDep, goal_id: int, user_id: UserIDDepends) -> None:
-    result = session.exec(delete(Goal).where(Goal.id == goal_id, Goal.user_id == user_id))
+async def delete_goal(session: AsyncSessionDep, goal_id: int, user_id: UserIDDepends) -> None:
+    change_seq = await Counter.touch(session, user_id)
+    result = await session.exec(delete(Goal).where(Goal.id == goal_id, Goal.user_id == user_id))
 
     if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="Goal not found")
 
-    session.commit()
+    await session.exec(delete(Counter).where(Counter.user_id == user_id, Counter.goal_id == goal_id))
+    await Counter.increment(session, user_id, [USER_SCOPE], goals=-1)
+    await Tombstone.record(session, user_id, "goal", [goal_id], change_seq)
+    await session.commit()
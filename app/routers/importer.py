@@ -0,0 +1,14 @@
+from fastapi import APIRouter, Request
+
+from app.core.importer import NdjsonImporter
+from app.depends.db import AsyncSessionDep
+from app.depends.user import UserIDDepends
+from app.schema.importer import ImportResult
+
+router = APIRouter(prefix="/import", tags=["Import"])
+
+
+@router.post("", name="데이터 가져오기", response_model=ImportResult)
+async def import_data(request: Request, session: AsyncSessionDep, user_id: UserIDDepends):
+    # 본문 전체를 읽지 않고 도착하는 대로 처리
+    return await NdjsonImporter(session, user_id).run(request.stream())
@@ -0,0 +1,73 @@
+import os
+import re
+import stat
+from pathlib import Path
+
+import anyio
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import FileResponse
+from sqlmodel import select
+
+from app.core.settings import settings
+from app.depends.db import AsyncSessionDep
+from app.depends.etag import etag_matches
+from app.exceptions import NotFoundHTTPException
+from app.models.blob import BLOB_DIR
+from app.models.file import File
+
+router = APIRouter(prefix="/" + settings.MEDIA_URL.strip("/"), tags=["Media"])
+
+BLOB_PATH = re.compile(rf"{BLOB_DIR}/[0-9a-f]{{2}}/(?P<checksum>[0-9a-f]{{32}})")
+# 내용 주소의 내용은 바뀌지 않으므로 브라우저/CDN이 재검증 없이 1년 동안 사용
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# 내용 주소 방식 이전의 파일은 같은 경로의 내용이 바뀔 수 있으므로 매번 재검증
+MUTABLE_CACHE_CONTROL = "public, no-cache"
+
+
+@router.api_route("/{path:path}", methods=["GET", "HEAD"], name="미디어 파일 조회")
+async def get_media(request: Request, session: AsyncSessionDep, path: str) -> FileResponse:
+    """
+    media 폴더의 파일을 응답합니다.
+
+    Range/If-Range 요청은 요청한 구간만 보내고, 서버가 ASGI pathsend 확장을 지원하면 sendfile로 보냅니다.
+    내용 주소(blobs/...)의 ETag는 저장된 체크섬이므로 If-None-Match가 일치하면 파일을 열지 않고 304로 응답합니다.
+    같은 내용의 blob은 여러 사용자가 공유하고 이 경로는 인증 없이 열리므로
+    파일 이름(Content-Disposition)은 보내지 않습니다.
+    """
+    media_root = Path(settings.MEDIA_ROOT).resolve()
+    full_path = (media_root / path).resolve()
+    if not full_path.is_relative_to(media_root):
+        raise NotFoundHTTPException()
+
+    if_none_match = request.headers.get("If-None-Match")
+    match = BLOB_PATH.fullmatch(path)
+    if match is None:
+        headers, media_type = {"Cache-Control": MUTABLE_CACHE_CONTROL}, None
+    else:
+        headers = {"ETag": f'"{match["checksum"]}"', "Cache-Control": IMMUTABLE_CACHE_CONTROL}
+        if if_none_match and etag_matches(if_none_match, headers["ETag"]):
+            raise HTTPException(status_code=304, headers=headers)
+        query = select(File.mime_type).where(File.checksum == match["checksum"]).limit(1)
+        media_type = (await session.exec(query)).first()
+        if media_type is None:
+            raise NotFoundHTTPException()
+
+    try:
+        stat_result = await anyio.to_thread.run_sync(os.stat, full_path)
+    except (FileNotFoundError, NotADirectoryError):
+        raise NotFoundHTTPException()
+    if not stat.S_ISREG(stat_result.st_mode):
+        raise NotFoundHTTPException()
+
+    response = FileResponse(
+        full_path,
+        headers=headers,
+        media_type=media_type,
+        stat_result=stat_result,
+    )
+    # 이전 파일은 수정 시각/크기로 만든 ETag로 재검증
+    if if_none_match and etag_matches(if_none_match, response.headers["ETag"]):
+        raise HTTPException(
+            status_code=304, headers={"ETag": response.headers["ETag"], "Cache-Control": headers["Cache-Control"]}
+        )
+    return response
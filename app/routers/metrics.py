@@ -0,0 +1,24 @@
+import secrets
+
+from fastapi import APIRouter, Depends, Header, Response
+
+from app.core.metrics import CONTENT_TYPE, registry
+from app.core.settings import settings
+from app.exceptions import UnauthorizedHTTPException
+
+
+def verify_metrics_token(authorization: str | None = Header(default=None)) -> None:
+    """METRICS_TOKEN이 설정되어 있으면 같은 Bearer 토큰을 보낸 요청만 허용합니다."""
+    if settings.METRICS_TOKEN is None:
+        return
+    expected = f"Bearer {settings.METRICS_TOKEN}"
+    if authorization is None or not secrets.compare_digest(authorization.encode(), expected.encode()):
+        raise UnauthorizedHTTPException()
+
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"], dependencies=[Depends(verify_metrics_token)])
+
+
+@router.get("", name="지표 조회", include_in_schema=False)
+async def get_metrics() -> Response:
+    return Response(registry.render(), media_type=CONTENT_TYPE)
@@ -1,56 +1,73 @@
 from fastapi import APIRouter, HTTPException, Query
-from sqlalchemy import func
-from sqlmodel import delete, desc, select
+from sqlalchemy.orm import selectinload
+from sqlmodel import select
 
-from app.depends.db import SessionDep
+from app.depends.db import AsyncSessionDep
+from app.depends.etag import ETagCheck
 from app.depends.user import UserIDDepends
-from app.models.goal import Goal
+from app.models.counter import USER_SCOPE, Counter
+from app.models.goal import Goal, GoalBase
 from app.models.note import Note
+from app.models.todo import Todo, TodoBase
+from app.models.tombstone import Tombstone
+from app.models.user import User, UserBase
+from app.schema.common import KeysetPaginator, SortField, SortOrder
 from app.schema.note import NoteCreate, NoteList, NoteResponse, NoteUpdate
 
 router = APIRouter(prefix="/notes", tags=["Note"])
 
+# 관계는 기본적으로 로딩하지 않으므로 NoteResponse에 포함되는 관계만 명시적으로 로딩
+NOTE_RESPONSE_OPTIONS = (selectinload(Note.todo), selectinload(Note.goal), selectinload(Note.user))
 
-@router.get("", name="노트 리스트 조회", response_model=NoteList)
+# 목록 조회용. NoteResponse에 필요한 컬럼만 읽고, 관계는 조인해 중첩 레코드로 받음
+NOTE_LIST_RECORD = Note.record(NoteResponse, Todo.record(TodoBase), Goal.record(GoalBase), User.record(UserBase))
+
+
+@router.get("", name="노트 리스트 조회", response_model=NoteList, dependencies=[ETagCheck])
 async def get_notes(
-    session: SessionDep,
+    session: AsyncSessionDep,
     user_id: UserIDDepends,
     goal_id: int,
-    cursor: int = Query(default=None, description="마지막으로 받은 노트의 ID"),
+    cursor: str | None = Query(default=None, description="이전 응답의 next_cursor"),
     size: int = Query(default=20, gt=0),
+    sort_order: SortOrder = Query(default=SortOrder.DESC, alias="sortOrder"),
+    sort_by: SortField = Query(default=SortField.ID, alias="sortBy"),
 ):
     # 전체 노트 수 조회
-    total_count = session.scalar(
-        select(func.count()).select_from(Note).where(Note.user_id == user_id, Note.goal_id == goal_id)
+    total_count = (await Counter.get(session, user_id, goal_id)).notes
+
+    # 기본 쿼리 생성. 노트마다 할 일, 목표, 사용자는 많아야 하나이므로 조인해도 행 수가 늘지 않음.
+    # 삭제된 할 일을 가리키는 노트도 목록에 남도록 외부 조인 (todo는 null). 목표는 카운터와 같이 남아 있는 목표의
+    # 노트만 세도록 내부 조인하므로, 삭제된 목표로 조회하면 total_count와 같이 빈 목록
+    query = (
+        select(NOTE_LIST_RECORD)
+        .outerjoin(Todo, Note.todo_id == Todo.id)
+        .join(Goal, Note.goal_id == Goal.id)
+        .outerjoin(User, Note.user_id == User.id)
+        .where(Note.user_id == user_id, Note.goal_id == goal_id)
     )
-    assert total_count is not None
-
-    # 기본 쿼리 생성
-    query = select(Note).where(Note.user_id == user_id, Note.goal_id == goal_id)
 
     # 커서 기반 페이지네이션
-    if cursor:
-        query = query.where(Note.id <= cursor)
-
-    # 정렬 및 제한
-    query = query.order_by(desc(Note.id)).limit(size + 1)
-
-    notes = session.exec(query).all()
-
-    # 다음 페이지 커서 설정
-    next_cursor = None
-    if len(notes) > size:
-        next_cursor = notes[-1].id
-        notes = notes[:size]
+    paginator = KeysetPaginator(Note, size, cursor, sort_order, sort_by)
+    records, next_cursor = paginator.paginate((await session.exec(paginator.apply(query))).all())
+
+    # 목록의 노트는 모두 같은 목표와 사용자에 속하므로 첫 레코드에서 한 번만 검증해 모든 노트가 공유
+    shared = {}
+    if records:
+        goal, user = records[0].goal, records[0].user
+        shared = {
+            "goal": GoalBase.model_validate(goal),
+            "user": user and UserBase.model_validate(user),
+        }
+    notes = [NoteResponse(**{**record._asdict(), **shared}) for record in records]
 
-    # FastAPI가 response_model을 통해 자동으로 Note에서 NoteResponse로 변환
     return NoteList(notes=notes, next_cursor=next_cursor, total_count=total_count)
 
 
 @router.post("", name="노트 생성", response_model=NoteResponse)
-async def create_note(session: SessionDep, user_id: UserIDDepends, note: NoteCreate):
+async def create_note(session: AsyncSessionDep, user_id: UserIDDepends, note: NoteCreate):
     # goal이 현재 사용자의 것인지 확인
-    goal = session.exec(select(Goal).where(Goal.id == note.goal_id, Goal.user_id == user_id)).first()
+    goal = (await session.exec(select(Goal).where(Goal.id == note.goal_id, Goal.user_id == user_id))).first()
     if not goal:
         raise HTTPException(status_code=404, detail="Goal not found")
 
@@ -62,15 +79,21 @@ async def create_note(session: SessionDep, user_id: UserIDDepends, note: NoteCre
         goal_id=note.goal_id,
         todo_id=note.todo_id,
     )
+    await Counter.stamp(session, user_id, new_note)
     session.add(new_note)
-    session.commit()
-    session.refresh(new_note)
+    await Counter.increment(session, user_id, [USER_SCOPE, note.goal_id], notes=1)
+    await session.commit()
+    await session.refresh(new_note, ["todo", "goal", "user"])
     return new_note
 
 
-@router.get("/{note_id}", name="노트 조회", response_model=NoteResponse)
-async def get_note(session: SessionDep, user_id: UserIDDepends, note_id: int):
-    note = session.exec(select(Note).where(Note.id == note_id, Note.user_id == user_id)).first()
+@router.get("/{note_id}", name="노트 조회", response_model=NoteResponse, dependencies=[ETagCheck])
+async def get_note(session: AsyncSessionDep, user_id: UserIDDepends, note_id: int):
+    note = (
+        await session.exec(
+            select(Note).where(Note.id == note_id, Note.user_id == user_id).options(*NOTE_RESPONSE_OPTIONS)
+        )
+    ).first()
 
     if not note:
         raise HTTPException(status_code=404, detail="Note not found")
@@ -79,30 +102,38 @@ async def get_note(session: SessionDep, user_id: UserIDDepends, note_id: int):
 
 
 @router.patch("/{note_id}", name="노트 수정", response_model=NoteResponse)
-async def update_note(session: SessionDep, user_id: UserIDDepends, note_id: int, note: NoteUpdate):
-    db_note = session.exec(select(Note).where(Note.id == note_id, Note.user_id == user_id)).first()
+async def update_note(session: AsyncSessionDep, user_id: UserIDDepends, note_id: int, note: NoteUpdate):
+    db_note = (
+        await session.exec(
+            select(Note).where(Note.id == note_id, Note.user_id == user_id).options(*NOTE_RESPONSE_OPTIONS)
+        )
+    ).first()
 
     if not db_note:
         raise HTTPException(status_code=404, detail="Note not found")
 
+    await Counter.stamp(session, user_id, db_note)
     note_data = note.model_dump(exclude_unset=True)
     for key, value in note_data.items():
         setattr(db_note, key, value)
 
     session.add(db_note)
-    session.commit()
-    session.refresh(db_note)
+    # 관계는 조회할 때 이미 로딩되었고 expire_on_commit=False라 커밋 후 다시 읽지 않음 (updated_at은 flush에서 채워짐)
+    await session.commit()
 
     return db_note
 
 
 @router.delete("/{note_id}", name="노트 삭제", status_code=204)
-async def delete_note(session: SessionDep, user_id: UserIDDepends, note_id: int):
+async def delete_note(session: AsyncSessionDep, user_id: UserIDDepends, note_id: int):
     # 노트가 존재하는지 먼저 확인
-    note = session.exec(select(Note).where(Note.id == note_id, Note.user_id == user_id)).first()
+    note = (await session.exec(select(Note).where(Note.id == note_id, Note.user_id == user_id))).first()
     if not note:
         raise HTTPException(status_code=404, detail="Note not found")
 
     # 노트 삭제
-    session.delete(note)
-    session.commit()
+    change_seq = await Counter.touch(session, user_id)
+    await session.delete(note)
+    await Counter.increment(session, user_id, [USER_SCOPE, note.goal_id], notes=-1)
+    await Tombstone.record(session, user_id, "note", [note_id], change_seq)
+    await session.commit()
@@ -0,0 +1,77 @@
+from fastapi import APIRouter, HTTPException, Query
+from sqlalchemy import tuple_
+from sqlmodel import select
+
+from app.depends.db import AsyncSessionDep
+from app.depends.user import UserIDDepends
+from app.models.counter import Counter
+from app.models.goal import Goal
+from app.models.note import Note
+from app.models.todo import Todo
+from app.models.tombstone import Tombstone
+from app.schema.sync import SyncChanges
+
+router = APIRouter(prefix="/sync", tags=["Sync"])
+
+# 변경분은 (change_seq, 종류, id) 순서로 전달. 응답 필드 이름과 모델을 종류 순서대로 나열
+SYNC_SOURCES = (("goals", Goal), ("todos", Todo), ("notes", Note), ("deleted", Tombstone))
+
+
+def parse_cursor(cursor: str) -> tuple[int, int, int]:
+    try:
+        change_seq, kind, row_id = (int(part) for part in cursor.split("."))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return change_seq, kind, row_id
+
+
+def changed_after(model, kind: int, after: tuple[int, int, int]):
+    change_seq, after_kind, after_id = after
+    if kind < after_kind:
+        return model.change_seq > change_seq
+    if kind > after_kind:
+        return model.change_seq >= change_seq
+    return tuple_(model.change_seq, model.id) > tuple_(change_seq, after_id)
+
+
+@router.get("", name="변경분 동기화", response_model=SyncChanges)
+async def get_changes(
+    session: AsyncSessionDep,
+    user_id: UserIDDepends,
+    since: int | None = Query(default=None, ge=0, description="지난 동기화 응답의 version. 없으면 전체를 반환"),
+    cursor: str | None = Query(default=None, description="같은 동기화의 다음 페이지를 요청할 때 사용"),
+    size: int = Query(default=500, gt=0, le=1000),
+):
+    # 버전을 먼저 읽으므로 이 버전 이하의 변경은 아래 조회에서 모두 보임
+    version = await Counter.get_version(session, user_id)
+    if version is None:
+        version = (await Counter.get(session, user_id)).version
+
+    if cursor:
+        after = parse_cursor(cursor)
+    else:
+        # 모든 종류에 대해 change_seq > since
+        after = (-1 if since is None else since, len(SYNC_SOURCES), 0)
+
+    # 종류별로 size + 1개씩 읽어 (change_seq, 종류, id) 순으로 합친 뒤 앞에서 size개만 사용
+    changes = []
+    for kind, (_, model) in enumerate(SYNC_SOURCES):
+        query = (
+            select(model)
+            .where(model.user_id == user_id, changed_after(model, kind, after))
+            .order_by(model.change_seq, model.id)
+            .limit(size + 1)
+        )
+        changes += [((row.change_seq, kind, row.id), row) for row in await session.exec(query)]
+    changes.sort(key=lambda change: change[0])
+
+    next_cursor = None
+    if len(changes) > size:
+        changes = changes[:size]
+        next_cursor = ".".join(map(str, changes[-1][0]))
+
+    page = {field: [] for field, _ in SYNC_SOURCES}
+    for (_, kind, _), row in changes:
+        page[SYNC_SOURCES[kind][0]].append(row)
+
+    return SyncChanges(version=version, next_cursor=next_cursor, **page)
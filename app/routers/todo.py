@@ -1,90 +1,84 @@
 from fastapi import APIRouter, HTTPException, Query
-from sqlalchemy import func
-from sqlmodel import asc, case, delete, desc, select
-
-from app.depends.db import SessionDep
+from sqlalchemy import false, insert, true
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlmodel import delete, select, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.depends.db import AsyncSessionDep
+from app.depends.etag import ETagCheck
 from app.depends.user import UserIDDepends
+from app.models.counter import USER_SCOPE, Counter
 from app.models.goal import Goal
 from app.models.note import Note
 from app.models.todo import Todo
-from app.schema.common import SortOrder
-from app.schema.todo import TodoCreate, TodoList, TodoResponse, TodoUpdate
+from app.models.tombstone import Tombstone
+from app.schema.common import KeysetPaginator, SortField, SortOrder
+from app.schema.todo import (
+    GoalProgress,
+    GoalProgressList,
+    TodoBulkCreate,
+    TodoBulkDelete,
+    TodoBulkList,
+    TodoBulkResult,
+    TodoBulkUpdate,
+    TodoCreate,
+    TodoList,
+    TodoResponse,
+    TodoUpdate,
+)
 
 router = APIRouter(prefix="/todos", tags=["Todo"])
 
 
-@router.get("", name="할 일 리스트 조회", response_model=TodoList)
+@router.get("", name="할 일 리스트 조회", response_model=TodoList, dependencies=[ETagCheck])
 async def get_todos(
-    session: SessionDep,
+    session: AsyncSessionDep,
     user_id: UserIDDepends,
     goal_id: int | None = Query(default=None, alias="goalId"),
     done: bool | None = Query(
         default=None,
         description="done이 true이면 완료된 todo만, false이면 미완료된 todo만 조회합니다. 아무것도 입력하지 않으면 모든 todo를 조회합니다.",
     ),
-    cursor: int = Query(default=None, description="마지막으로 받은 할 일의 ID"),
+    cursor: str | None = Query(default=None, description="이전 응답의 next_cursor"),
     size: int = Query(default=20, gt=0),
     sort_order: SortOrder = Query(default=SortOrder.DESC, alias="sortOrder"),
+    sort_by: SortField = Query(default=SortField.ID, alias="sortBy"),
 ):
-    # 기본 쿼리 생성
-    query = select(Todo).where(Todo.user_id == user_id)
+    # 응답에 필요한 컬럼만 레코드로 조회. 노트는 id만 필요하므로 관계를 로딩하지 않고 조인으로 읽음
+    query = (
+        select(Todo.record(TodoResponse, Note.id.label("note_id")))
+        .outerjoin(Note, Note.todo_id == Todo.id)
+        .where(Todo.user_id == user_id)
+    )
 
     if goal_id is not None:
-        query = query.where(Todo.goal_id == goal_id)
+        # 카운터와 같이 남아 있는 목표의 할 일만 세도록 내부 조인. 삭제된 목표로 조회하면 total_count와 같이 빈 목록
+        query = query.join(Goal, Todo.goal_id == Goal.id).where(Todo.goal_id == goal_id)
 
     # done 필터 적용
     if done is not None:
         query = query.where(Todo.done == done)
 
-    # 전체 할 일 수 조회
-    total_count = session.scalar(select(func.count()).select_from(Todo).where(Todo.user_id == user_id))
-    assert total_count is not None
+    # 필터 조건에 맞는 전체 할 일 수 조회
+    counter = await Counter.get(session, user_id, goal_id if goal_id is not None else USER_SCOPE)
+    total_count = counter.count_todos(done)
 
     # 커서 기반 페이지네이션
-    if cursor:
-        query = query.where(Todo.id <= cursor)
-
-    # 정렬 및 제한
-    if sort_order == SortOrder.DESC:
-        query = query.order_by(desc(Todo.id)).limit(size + 1)
-    else:
-        query = query.order_by(asc(Todo.id)).limit(size + 1)
-
-    todos = session.exec(query).all()
-
-    # 다음 페이지 커서 설정
-    next_cursor = None
-    if len(todos) > size:
-        next_cursor = todos[-1].id
-        todos = todos[:size]
-
-    todos_response = [
-        TodoResponse(
-            id=todo.id,
-            title=todo.title,
-            done=todo.done,
-            link_url=todo.link_url,
-            file_url=todo.file_url,
-            user_id=todo.user_id,
-            goal_id=todo.goal_id,
-            created_at=str(todo.created_at),
-            updated_at=str(todo.updated_at),
-            note_id=todo.note_id,
-        )
-        for todo in todos
-    ]
+    paginator = KeysetPaginator(Todo, size, cursor, sort_order, sort_by)
+    todos, next_cursor = paginator.paginate((await session.exec(paginator.apply(query))).all())
 
-    return TodoList(todos=todos_response, next_cursor=next_cursor, total_count=total_count)
+    return TodoList(todos=todos, next_cursor=next_cursor, total_count=total_count)
 
 
 @router.post("", name="할 일 생성", response_model=TodoResponse)
 async def create_todo(
-    session: SessionDep,
+    session: AsyncSessionDep,
     user_id: UserIDDepends,
     todo_create: TodoCreate,
 ):
     # goal이 현재 사용자의 것인지 확인
-    goal = session.exec(select(Goal).where(Goal.id == todo_create.goal_id, Goal.user_id == user_id)).first()
+    goal = (await session.exec(select(Goal).where(Goal.id == todo_create.goal_id, Goal.user_id == user_id))).first()
     if not goal:
         raise HTTPException(status_code=404, detail="Goal not found")
 
@@ -95,113 +89,252 @@ async def create_todo(
         user_id=user_id,
         goal_id=todo_create.goal_id,
     )
+    await Counter.stamp(session, user_id, new_todo)
     session.add(new_todo)
-    session.commit()
-    session.refresh(new_todo)
-    return TodoResponse(
-        id=new_todo.id,
-        title=new_todo.title,
-        done=new_todo.done,
-        link_url=new_todo.link_url,
-        file_url=new_todo.file_url,
-        user_id=new_todo.user_id,
-        goal_id=new_todo.goal_id,
-        created_at=str(new_todo.created_at),
-        updated_at=str(new_todo.updated_at),
-        note_id=new_todo.note_id,
-    )
+    await Counter.update_todo_stats(session, user_id, [(None, (new_todo.goal_id, new_todo.done))])
+    await session.commit()
+    await session.refresh(new_todo)
+    # 방금 생성된 할 일에는 노트가 없으므로 note_id를 읽을 때 노트를 조회하지 않도록 표시
+    set_committed_value(new_todo, "note", None)
+    return new_todo
+
+
+async def _get_progresses(session: AsyncSession, user_id: int, goal_ids: list[int] | None) -> list[GoalProgress]:
+    # 목표별 카운터에 유지되는 total/completed로 계산 (목표 수와 관계없이 쿼리 한 번)
+    counters = await Counter.get_many(session, user_id, goal_ids)
+    return [
+        GoalProgress(
+            goal_id=counter.goal_id,
+            total=counter.todos,
+            completed=counter.done_todos,
+            progress=counter.progress,
+        )
+        for counter in counters
+    ]
 
 
-@router.get("/progress", name="할 일 진행 상황 조회")
-async def get_todo_progress(session: SessionDep, user_id: UserIDDepends, goal_id: int = Query(..., alias="goalId")):
-    # Todo 테이블에서 total과 completed를 한 번의 쿼리로 조회
-    result = session.exec(
-        select(
-            func.count(Todo.id).label("total"), func.sum(case((Todo.done == True, 1), else_=0)).label("completed")
-        ).where(Todo.user_id == user_id, Todo.goal_id == goal_id)
-    ).first()
+@router.get("/progress", name="할 일 진행 상황 조회", dependencies=[ETagCheck])
+async def get_todo_progress(
+    session: AsyncSessionDep, user_id: UserIDDepends, goal_id: int = Query(..., alias="goalId")
+):
+    progresses = await _get_progresses(session, user_id, [goal_id])
+    return {"progress": progresses[0].progress}
+
+
+@router.get(
+    "/progress/batch", name="여러 목표의 진행 상황 조회", response_model=GoalProgressList, dependencies=[ETagCheck]
+)
+async def get_todo_progress_batch(
+    session: AsyncSessionDep,
+    user_id: UserIDDepends,
+    goal_ids: list[int] | None = Query(
+        default=None,
+        alias="goalIds",
+        description="조회할 목표 ID 목록. 입력하지 않으면 내 모든 목표의 진행 상황을 조회합니다.",
+    ),
+):
+    return GoalProgressList(progresses=await _get_progresses(session, user_id, goal_ids))
+
+
+async def _check_goals_owned(session: AsyncSession, user_id: int, goal_ids: set[int]) -> None:
+    # 모든 goal이 현재 사용자의 것인지 한 번의 쿼리로 확인
+    owned = (await session.exec(select(Goal.id).where(Goal.user_id == user_id, Goal.id.in_(goal_ids)))).all()
+    if len(owned) != len(goal_ids):
+        raise HTTPException(status_code=404, detail="Goal not found")
+
+
+@router.post("/bulk", name="할 일 일괄 생성", response_model=TodoBulkList)
+async def create_todos_bulk(session: AsyncSessionDep, user_id: UserIDDepends, bulk: TodoBulkCreate):
+    await _check_goals_owned(session, user_id, {todo_create.goal_id for todo_create in bulk.todos})
+
+    change_seq = await Counter.touch(session, user_id)
+    rows = [
+        Todo(
+            title=todo_create.title,
+            link_url=todo_create.link_url,
+            file_url=todo_create.file_url,
+            user_id=user_id,
+            goal_id=todo_create.goal_id,
+            change_seq=change_seq,
+        ).model_dump(exclude={"id"})
+        for todo_create in bulk.todos
+    ]
+    # 응답의 할 일이 요청 순서와 같도록 RETURNING 행을 파라미터 순서대로 받음
+    query = insert(Todo).returning(Todo, sort_by_parameter_order=True)
+    new_todos = (await session.exec(query, params=rows)).scalars().all()
+    await Counter.update_todo_stats(session, user_id, [(None, (todo.goal_id, todo.done)) for todo in new_todos])
+    await session.commit()
+
+    # 방금 생성된 할 일에는 노트가 없으므로 note_id를 읽을 때 노트를 조회하지 않도록 표시
+    for todo in new_todos:
+        set_committed_value(todo, "note", None)
+    return TodoBulkList(todos=new_todos)
+
+
+@router.patch("/bulk", name="할 일 일괄 수정", response_model=TodoBulkResult)
+async def update_todos_bulk(session: AsyncSessionDep, user_id: UserIDDepends, bulk: TodoBulkUpdate):
+    ids = set(bulk.ids)
+
+    # 모든 할 일의 소유 여부와 변경 전 상태를 한 번에 조회
+    old_stats = (
+        await session.exec(select(Todo.goal_id, Todo.done).where(Todo.user_id == user_id, Todo.id.in_(ids)))
+    ).all()
+    if len(old_stats) != len(ids):
+        raise HTTPException(status_code=404, detail="Todo not found")
+
+    if bulk.goal_id is not None:
+        await _check_goals_owned(session, user_id, {bulk.goal_id})
+
+    todo_data = bulk.model_dump(exclude_unset=True, exclude={"ids"})
+    if todo_data:
+        change_seq = await Counter.touch(session, user_id)
+        await session.exec(
+            update(Todo).where(Todo.user_id == user_id, Todo.id.in_(ids)).values(**todo_data, change_seq=change_seq)
+        )
+        await Counter.update_todo_stats(
+            session,
+            user_id,
+            [
+                ((goal_id, done), (todo_data.get("goal_id", goal_id), todo_data.get("done", done)))
+                for goal_id, done in old_stats
+            ],
+        )
+        await session.commit()
 
-    total, completed = result
+    return TodoBulkResult(count=len(ids))
 
-    # total이 0일 경우 진행도를 계산할 수 없으므로 처리
-    if total == 0:
-        return {"progress": 0.0}
 
-    return {"progress": completed / total}
+@router.post("/bulk/delete", name="할 일 일괄 삭제", response_model=TodoBulkResult)
+async def delete_todos_bulk(session: AsyncSessionDep, user_id: UserIDDepends, bulk: TodoBulkDelete):
+    ids = set(bulk.ids)
+    change_seq = await Counter.touch(session, user_id)
+    deleted = (
+        await session.exec(
+            delete(Todo).where(Todo.user_id == user_id, Todo.id.in_(ids)).returning(Todo.id, Todo.goal_id, Todo.done)
+        )
+    ).all()
+
+    # 하나라도 현재 사용자의 할 일이 아니면 전체를 취소
+    if len(deleted) != len(ids):
+        await session.rollback()
+        raise HTTPException(status_code=404, detail="Todo not found")
+
+    await Counter.update_todo_stats(session, user_id, [((goal_id, done), None) for _, goal_id, done in deleted])
+    await Tombstone.record(session, user_id, "todo", [todo_id for todo_id, _, _ in deleted], change_seq)
+    await session.commit()
+
+    return TodoBulkResult(count=len(deleted))
+
+
+@router.post("/bulk/complete", name="목표의 할 일 모두 완료", response_model=TodoBulkResult)
+async def complete_todos_in_goal(
+    session: AsyncSessionDep, user_id: UserIDDepends, goal_id: int = Query(..., alias="goalId")
+):
+    change_seq = await Counter.touch(session, user_id)
+    result = await session.exec(
+        update(Todo)
+        .where(Todo.user_id == user_id, Todo.goal_id == goal_id, Todo.done == false())
+        .values(done=True, change_seq=change_seq)
+    )
+    await Counter.increment(session, user_id, [USER_SCOPE, goal_id], done_todos=result.rowcount)
+    await session.commit()
+
+    return TodoBulkResult(count=result.rowcount)
+
+
+@router.delete("/bulk/done", name="목표의 완료된 할 일 모두 삭제", response_model=TodoBulkResult)
+async def clear_done_todos_in_goal(
+    session: AsyncSessionDep, user_id: UserIDDepends, goal_id: int = Query(..., alias="goalId")
+):
+    change_seq = await Counter.touch(session, user_id)
+    deleted_ids = (
+        (
+            await session.exec(
+                delete(Todo)
+                .where(Todo.user_id == user_id, Todo.goal_id == goal_id, Todo.done == true())
+                .returning(Todo.id)
+            )
+        )
+        .scalars()
+        .all()
+    )
+    await Counter.increment(
+        session, user_id, [USER_SCOPE, goal_id], todos=-len(deleted_ids), done_todos=-len(deleted_ids)
+    )
+    await Tombstone.record(session, user_id, "todo", deleted_ids, change_seq)
+    await session.commit()
+
+    return TodoBulkResult(count=len(deleted_ids))
 
 
-@router.get("/{todo_id}", name="할 일 상세 조회", response_model=TodoResponse)
+@router.get("/{todo_id}", name="할 일 상세 조회", response_model=TodoResponse, dependencies=[ETagCheck])
 async def get_todo(
-    session: SessionDep,
+    session: AsyncSessionDep,
     user_id: UserIDDepends,
     todo_id: int,
 ):
     # 노트 정보 포함하여 조회
-    todo = session.exec(select(Todo).where(Todo.id == todo_id, Todo.user_id == user_id)).first()
+    todo = (
+        await session.exec(
+            select(Todo).where(Todo.id == todo_id, Todo.user_id == user_id).options(selectinload(Todo.note))
+        )
+    ).first()
 
     if not todo:
         raise HTTPException(status_code=404, detail="Todo not found")
 
-    # TodoResponse 모델로 변환하여 반환
-    return TodoResponse(
-        id=todo.id,
-        title=todo.title,
-        done=todo.done,
-        link_url=todo.link_url,
-        file_url=todo.file_url,
-        user_id=todo.user_id,
-        goal_id=todo.goal_id,
-        created_at=str(todo.created_at),
-        updated_at=str(todo.updated_at),
-        note_id=todo.note_id,
-    )
+    # FastAPI가 response_model을 통해 자동으로 Todo에서 TodoResponse로 변환
+    return todo
 
 
 @router.patch("/{todo_id}", name="할 일 수정", response_model=TodoResponse)
 async def update_todo(
-    session: SessionDep,
+    session: AsyncSessionDep,
     user_id: UserIDDepends,
     todo_id: int,
     todo_update: TodoUpdate,
 ):
-    todo = session.exec(select(Todo).where(Todo.id == todo_id, Todo.user_id == user_id)).first()
+    todo = (
+        await session.exec(
+            select(Todo).where(Todo.id == todo_id, Todo.user_id == user_id).options(selectinload(Todo.note))
+        )
+    ).first()
 
     if not todo:
         raise HTTPException(status_code=404, detail="Todo not found")
 
     # goal_id가 변경되는 경우, 새로운 goal이 현재 사용자의 것인지 확인
     if todo_update.goal_id is not None:
-        goal = session.exec(select(Goal).where(Goal.id == todo_update.goal_id, Goal.user_id == user_id)).first()
+        goal = (await session.exec(select(Goal).where(Goal.id == todo_update.goal_id, Goal.user_id == user_id))).first()
         if not goal:
             raise HTTPException(status_code=404, detail="Goal not found")
 
+    old_stats = (todo.goal_id, todo.done)
+    await Counter.stamp(session, user_id, todo)
     todo_data = todo_update.model_dump(exclude_unset=True)
     for key, value in todo_data.items():
         setattr(todo, key, value)
 
     session.add(todo)
-    session.commit()
-    session.refresh(todo)
-
-    return TodoResponse(
-        id=todo.id,
-        title=todo.title,
-        done=todo.done,
-        link_url=todo.link_url,
-        file_url=todo.file_url,
-        user_id=todo.user_id,
-        goal_id=todo.goal_id,
-        created_at=str(todo.created_at),
-        updated_at=str(todo.updated_at),
-        note_id=todo.note_id,
-    )
+    await Counter.update_todo_stats(session, user_id, [(old_stats, (todo.goal_id, todo.done))])
+    # note는 조회할 때 이미 로딩되었고 expire_on_commit=False라 커밋 후 다시 읽지 않음 (updated_at은 flush에서 채워짐)
+    await session.commit()
+
+    return todo
 
 
 @router.delete("/{todo_id}", name="할 일 삭제", status_code=204)
-async def delete_todo(session: SessionDep, user_id: UserIDDepends, todo_id: int):
-    result = session.exec(delete(Todo).where(Todo.id == todo_id, Todo.user_id == user_id))
+async def delete_todo(session: AsyncSessionDep, user_id: UserIDDepends, todo_id: int):
+    change_seq = await Counter.touch(session, user_id)
+    deleted = (
+        await session.exec(
+            delete(Todo).where(Todo.id == todo_id, Todo.user_id == user_id).returning(Todo.goal_id, Todo.done)
+        )
+    ).first()
 
-    if result.rowcount == 0:
+    if deleted is None:
         raise HTTPException(status_code=404, detail="Todo not found")
 
-    session.commit()
+    await Counter.update_todo_stats(session, user_id, [((deleted.goal_id, deleted.done), None)])
+    await Tombstone.record(session, user_id, "todo", [todo_id], change_seq)
+    await session.commit()
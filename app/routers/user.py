@@ -1,9 +1,10 @@
 from fastapi import APIRouter, HTTPException
 from sqlmodel import select
 
-from app.core.security import get_password_hash
-from app.depends.db import SessionDep
+from app.core.security import password_hash_pool
+from app.depends.db import AsyncSessionDep
 from app.depends.user import UserDepends
+from app.models.counter import Counter
 from app.models.user import User, UserBase
 from app.schema.user import UserRegisterSchema
 
@@ -16,19 +17,24 @@ router = APIRouter(prefix="/user", tags=["User"])
     response_model=UserBase,
     response_model_exclude={"hashed_password"},
 )
-async def register_user(user_in: UserRegisterSchema, session: SessionDep):
-    user = session.exec(
-        select(User).where(
-            User.email == user_in.email,
+async def register_user(user_in: UserRegisterSchema, session: AsyncSessionDep):
+    user = (
+        await session.exec(
+            select(User).where(
+                User.email == user_in.email,
+            )
         )
     ).first()
     if user:
         raise HTTPException(status_code=400, detail="이미 존재하는 이메일입니다.")
 
-    user = User.model_validate(user_in, update={"hashed_password": get_password_hash(user_in.password)})
+    hashed_password = await password_hash_pool.hash(user_in.password)
+    user = User.model_validate(user_in, update={"hashed_password": hashed_password})
     session.add(user)
-    session.commit()
-    session.refresh(user)
+    await session.flush()
+    session.add(Counter(user_id=user.id))
+    await session.commit()
+    await session.refresh(user)
 
     return user
 
@@ -1,6 +1,15 @@
+import base64
+import json
+from datetime import datetime
 from enum import Enum
+from typing import Any, Sequence, TypeVar
 
 from pydantic import BaseModel
+from sqlalchemy import asc, desc, tuple_
+
+from app.exceptions.http_exception import BadRequestHTTPException
+
+T = TypeVar("T")
 
 
 class SortOrder(str, Enum):
@@ -8,6 +17,88 @@ class SortOrder(str, Enum):
     DESC = "newest"
 
 
+class SortField(str, Enum):
+    ID = "id"
+    CREATED_AT = "createdAt"
+    UPDATED_AT = "updatedAt"
+
+
+SORT_COLUMNS = {SortField.ID: "id", SortField.CREATED_AT: "created_at", SortField.UPDATED_AT: "updated_at"}
+
+
 class CursorPaginationBase(BaseModel):
-    next_cursor: int | None
+    next_cursor: str | None
     total_count: int
+
+
+class KeysetPaginator:
+    """
+    (정렬 키, id) 기준의 키셋 페이지네이션입니다.
+
+    커서는 마지막으로 받은 행의 (정렬 키, id)를 정렬 조건과 함께 인코딩한 불투명한 문자열이며,
+    다음 페이지는 그 행의 바로 다음 행부터 시작합니다. 조건은 (정렬 키, id)의 행 값 비교 하나이므로
+    (user_id, 정렬 키, id) 인덱스를 그대로 따라갈 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        model,
+        size: int,
+        cursor: str | None = None,
+        sort_order: SortOrder = SortOrder.DESC,
+        sort_by: SortField = SortField.ID,
+    ):
+        self.model = model
+        self.size = size
+        self.sort_order = sort_order
+        self.sort_by = sort_by
+        self.after = self.decode(cursor) if cursor else None
+
+    @property
+    def columns(self) -> tuple:
+        sort_column = getattr(self.model, SORT_COLUMNS[self.sort_by])
+        if self.sort_by == SortField.ID:
+            return (sort_column,)
+        return (sort_column, self.model.id)
+
+    def apply(self, query):
+        """커서 이후의 행을 정렬 순서대로 size + 1개 가져오도록 query를 바꿉니다."""
+        columns = self.columns
+        if self.after is not None:
+            keys, values = (columns[0], self.after[0]) if len(columns) == 1 else (tuple_(*columns), tuple_(*self.after))
+            query = query.where(keys < values if self.sort_order == SortOrder.DESC else keys > values)
+
+        order = desc if self.sort_order == SortOrder.DESC else asc
+        # 다음 페이지 존재 여부 확인을 위해 1개 더 가져옴
+        return query.order_by(*(order(column) for column in columns)).limit(self.size + 1)
+
+    def paginate(self, rows: Sequence[T]) -> tuple[Sequence[T], str | None]:
+        """apply()로 가져온 행에서 이번 페이지와 다음 페이지 커서를 반환합니다."""
+        if len(rows) <= self.size:
+            return rows, None
+        rows = rows[: self.size]
+        return rows, self.encode(rows[-1])
+
+    def encode(self, row: Any) -> str:
+        keys = [getattr(row, column.key) for column in self.columns]
+        payload = {
+            "s": self.sort_by.value,
+            "o": self.sort_order.value,
+            "k": [key.isoformat() if isinstance(key, datetime) else key for key in keys],
+        }
+        return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode().rstrip("=")
+
+    def decode(self, cursor: str) -> tuple:
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+            # 다른 정렬 조건으로 만든 커서는 사용할 수 없음
+            if payload["s"] != self.sort_by.value or payload["o"] != self.sort_order.value:
+                raise ValueError
+            keys = payload["k"]
+            if len(keys) != len(self.columns) or not isinstance(keys[-1], int):
+                raise ValueError
+            if self.sort_by != SortField.ID:
+                keys[0] = datetime.fromisoformat(keys[0])
+        except (ValueError, KeyError, TypeError):
+            raise BadRequestHTTPException("Invalid cursor")
+        return tuple(keys)
@@ -1,8 +1,6 @@
-from typing import Sequence
-
 from pydantic import BaseModel
 
-from app.models.goal import Goal
+from app.models.goal import GoalBase
 from app.schema.common import CursorPaginationBase
 
 
@@ -14,5 +12,9 @@ class GoalUpdate(GoalCreate):
     title: str
 
 
+class GoalResponse(GoalBase):
+    change_seq: int
+
+
 class GoalList(CursorPaginationBase):
-    goals: Sequence[Goal]
+    goals: list[GoalResponse]
@@ -0,0 +1,20 @@
+from pydantic import BaseModel
+
+from app.schema.todo import TodoCreate
+
+
+class TodoImport(TodoCreate):
+    done: bool = False
+
+
+class ImportRecordError(BaseModel):
+    line: int
+    detail: str
+
+
+class ImportResult(BaseModel):
+    goals: int = 0
+    todos: int = 0
+    notes: int = 0
+    failed: int = 0
+    errors: list[ImportRecordError] = []
@@ -1,5 +1,3 @@
-from typing import Sequence
-
 from pydantic import BaseModel, Field
 
 from app.models.goal import GoalBase
@@ -30,4 +28,4 @@ class NoteResponse(NoteBase):
 
 
 class NoteList(CursorPaginationBase):
-    notes: Sequence[NoteResponse]
+    notes: list[NoteResponse]
@@ -0,0 +1,16 @@
+from pydantic import BaseModel
+
+from app.models.goal import Goal
+from app.models.note import Note
+from app.models.todo import Todo
+from app.models.tombstone import Tombstone
+
+
+class SyncChanges(BaseModel):
+    # 다음 동기화에 since로 보낼 값 (마지막 페이지의 값을 사용)
+    version: int
+    goals: list[Goal]
+    todos: list[Todo]
+    notes: list[Note]
+    deleted: list[Tombstone]
+    next_cursor: str | None
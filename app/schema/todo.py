@@ -1,8 +1,7 @@
-from typing import Sequence
+from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
-from app.models.note import NoteBase
 from app.schema.common import CursorPaginationBase
 
 
@@ -22,6 +21,9 @@ class TodoUpdate(BaseModel):
 
 
 class TodoResponse(BaseModel):
+    # 라우터는 Todo를 그대로 넘기고, 응답 모델 검증에서 속성을 한 번만 읽어 만듦
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     title: str
     done: bool
@@ -29,11 +31,53 @@ class TodoResponse(BaseModel):
     file_url: str | None = None
     user_id: int
     goal_id: int
-    created_at: str
-    updated_at: str
+    created_at: datetime
+    updated_at: datetime
     note_id: int | None = None
-    note: NoteBase | None = None
 
 
 class TodoList(CursorPaginationBase):
-    todos: Sequence[TodoResponse]
+    todos: list[TodoResponse]
+
+
+# 일괄 요청 한 번에 처리할 수 있는 최대 할 일 수
+BULK_MAX_SIZE = 1000
+
+
+class TodoBulkCreate(BaseModel):
+    todos: list[TodoCreate] = Field(min_length=1, max_length=BULK_MAX_SIZE)
+
+
+class TodoBulkUpdate(TodoUpdate):
+    ids: list[int] = Field(min_length=1, max_length=BULK_MAX_SIZE)
+
+    @field_validator("title", "done", "goal_id")
+    @classmethod
+    def reject_null(cls, value):
+        # 보낸 값은 UPDATE에 그대로 들어가므로 NOT NULL 컬럼에 null을 보내면 DB 오류 대신 422로 거절
+        if value is None:
+            raise ValueError("null로 바꿀 수 없습니다.")
+        return value
+
+
+class TodoBulkDelete(BaseModel):
+    ids: list[int] = Field(min_length=1, max_length=BULK_MAX_SIZE)
+
+
+class TodoBulkList(BaseModel):
+    todos: list[TodoResponse]
+
+
+class TodoBulkResult(BaseModel):
+    count: int
+
+
+class GoalProgress(BaseModel):
+    goal_id: int
+    total: int
+    completed: int
+    progress: float
+
+
+class GoalProgressList(BaseModel):
+    progresses: list[GoalProgress]
@@ -0,0 +1,177 @@
+"""
+동기 Session(SessionDep)과 비동기 AsyncSession(AsyncSessionDep)의 동시 처리량을 비교하는 벤치마크입니다.
+
+두 의존성을 사용하는 동일한 목록 조회 엔드포인트를 별도 프로세스의 uvicorn으로 띄운 뒤,
+동시 클라이언트 N개(기본 200)로 요청을 보내 req/s와 지연 시간 분포, 실패(타임아웃 포함) 수를 출력합니다.
+동기 Session은 이벤트 루프를 막기 때문에 동시 요청 수가 커넥션 풀 크기를 넘으면 풀 대기 중에 루프 전체가 멈춥니다.
+
+    DB_URI=sqlite:///bench.db SECRET_KEY=bench python -m benchmarks.async_db --clients 200
+"""
+
+import argparse
+import asyncio
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import func
+from sqlmodel import Session, delete, desc, select
+
+from app.core.db import engine
+from app.core.migration import run_migrations
+from app.depends.db import AsyncSessionDep, SessionDep
+from app.models import Goal, User
+
+BENCH_USER_EMAIL = "bench@example.com"
+SCENARIOS = ("blocking", "async")
+
+bench_app = FastAPI()
+
+
+def _list_query(user_id: int):
+    return select(Goal).where(Goal.user_id == user_id).order_by(desc(Goal.id)).limit(21)
+
+
+def _count_query(user_id: int):
+    return select(func.count()).select_from(Goal).where(Goal.user_id == user_id)
+
+
+@bench_app.get("/blocking/{user_id}")
+async def blocking_goals(session: SessionDep, user_id: int):
+    total_count = session.scalar(_count_query(user_id))
+    goals = session.exec(_list_query(user_id)).all()
+    return {"total_count": total_count, "count": len(goals)}
+
+
+@bench_app.get("/async/{user_id}")
+async def async_goals(session: AsyncSessionDep, user_id: int):
+    total_count = await session.scalar(_count_query(user_id))
+    goals = (await session.exec(_list_query(user_id))).all()
+    return {"total_count": total_count, "count": len(goals)}
+
+
+def seed(goals: int) -> int:
+    run_migrations()
+    with Session(engine) as session:
+        user = session.exec(select(User).where(User.email == BENCH_USER_EMAIL)).first()
+        if not user:
+            user = User(email=BENCH_USER_EMAIL, name="bench", hashed_password="-")
+            session.add(user)
+            session.commit()
+            session.refresh(user)
+        session.exec(delete(Goal).where(Goal.user_id == user.id))
+        session.add_all(Goal(title=f"goal {i}", user_id=user.id) for i in range(goals))
+        session.commit()
+        return user.id
+
+
+async def run_load(base_url: str, path: str, clients: int, requests: int, timeout: float, deadline: float) -> dict:
+    latencies: list[float] = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def worker(client: httpx.AsyncClient):
+        nonlocal errors
+        for _ in remaining:
+            started = time.perf_counter()
+            try:
+                response = await client.get(path)
+                response.raise_for_status()
+            except httpx.HTTPError:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - started)
+
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=timeout) as client:
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(asyncio.gather(*(worker(client) for _ in range(clients))), deadline)
+        except asyncio.TimeoutError:
+            # 제한 시간 안에 끝나지 못한 요청은 모두 실패로 집계
+            errors = requests - len(latencies)
+        elapsed = time.perf_counter() - started
+
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else [float("nan")] * 99
+    return {
+        "rps": len(latencies) / elapsed,
+        "errors": errors,
+        "p50": quantiles[49] * 1000,
+        "p95": quantiles[94] * 1000,
+        "p99": quantiles[98] * 1000,
+    }
+
+
+def start_server(port: int) -> subprocess.Popen:
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "benchmarks.async_db:bench_app",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ]
+    )
+    for _ in range(100):
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/docs")
+            return server
+        except httpx.TransportError:
+            time.sleep(0.1)
+    server.kill()
+    raise RuntimeError("벤치마크 서버가 시작되지 않았습니다")
+
+
+def stop_server(server: subprocess.Popen):
+    # 이벤트 루프가 막힌 서버는 graceful shutdown을 처리하지 못하므로 일정 시간 후 강제 종료
+    server.terminate()
+    try:
+        server.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        server.kill()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=4000)
+    parser.add_argument("--goals", type=int, default=5000)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--timeout", type=float, default=10.0, help="요청별 타임아웃(초)")
+    parser.add_argument("--deadline", type=float, default=120.0, help="시나리오별 전체 제한 시간(초)")
+    parser.add_argument("--scenario", choices=SCENARIOS, action="append", help="실행할 시나리오 (기본: 전체)")
+    args = parser.parse_args()
+
+    user_id = seed(args.goals)
+
+    for name in args.scenario or SCENARIOS:
+        # 이전 시나리오에서 막힌 커넥션이 결과에 섞이지 않도록 시나리오마다 서버를 새로 띄움
+        server = start_server(args.port)
+        try:
+            result = asyncio.run(
+                run_load(
+                    f"http://127.0.0.1:{args.port}",
+                    f"/{name}/{user_id}",
+                    args.clients,
+                    args.requests,
+                    args.timeout,
+                    args.deadline,
+                )
+            )
+        finally:
+            stop_server(server)
+        print(
+            f"{name:>8}: {result['rps']:8.1f} req/s  errors {result['errors']:5d}  "
+            f"p50 {result['p50']:7.1f}ms  p95 {result['p95']:7.1f}ms  p99 {result['p99']:7.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+"""
+실제 앱(app.main:app)을 별도 프로세스의 uvicorn으로 띄워 HTTP로 부하를 주는 엔드투엔드 벤치마크입니다.
+
+시나리오별로 동시 클라이언트 N개(기본 50)가 요청을 보내 req/s와 지연 시간 분포(p50/p95/p99), 실패 수를 출력하고,
+--output에 JSON으로 기록합니다. --baseline을 주면 기준 결과와 비교해 req/s가 --threshold 비율 이상 떨어지거나
+p95가 그만큼 늘어난 시나리오를 회귀로 보고하고 종료 코드 1로 끝납니다.
+
+    login     로그인 폭주. bcrypt 검증이 프로세스 풀에서 처리되는 동안의 처리량
+    paging    10만 개 할 일을 커서로 끝까지 넘기며 조회
+    progress  목표 진행률 반복 조회
+    notes     노트 생성 (쓰기 + 카운터 갱신)
+    upload    64KB 파일 업로드 (매번 다른 내용)
+
+    DB_URI=sqlite:///bench.db SECRET_KEY=bench python -m benchmarks.e2e --output result.json \\
+        --baseline benchmarks/baselines/e2e.json
+
+기준 결과는 측정한 머신에 따라 다르므로, 같은 머신에서 변경 전 코드로 --output을 만들어 비교하는 것이 정확합니다.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Awaitable, Callable
+
+import httpx
+from sqlalchemy import delete, insert
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.db import async_engine, engine
+from app.core.migration import run_migrations
+from app.core.security import get_password_hash
+from app.models import Counter, File, Goal, Note, Todo, Tombstone, User
+
+BENCH_USER_EMAIL = "bench-e2e@example.com"
+BENCH_PASSWORD = "bench-password"
+SCENARIOS = ("login", "paging", "progress", "notes", "upload")
+SEED_BATCH_SIZE = 10000
+UPLOAD_SIZE = 64 * 1024
+
+Request = Callable[[httpx.AsyncClient, int], Awaitable[httpx.Response]]
+
+
+def seed(todos: int, goals: int = 10) -> dict:
+    """
+    벤치마크 사용자와 목표, 할 일을 새로 만듭니다. 할 일은 목표마다 고르게 나눕니다.
+    Core insert는 카운터를 갱신하지 않으므로 끝난 뒤 카운터를 다시 맞춥니다.
+    """
+    run_migrations()
+    with Session(engine) as session:
+        user = session.exec(select(User).where(User.email == BENCH_USER_EMAIL)).first()
+        if not user:
+            user = User(email=BENCH_USER_EMAIL, name="bench", hashed_password=get_password_hash(BENCH_PASSWORD))
+            session.add(user)
+            session.commit()
+            session.refresh(user)
+        for model in (Note, Todo, Counter, Goal, File, Tombstone):
+            session.exec(delete(model).where(model.user_id == user.id))
+        session.add_all(Goal(title=f"goal {i}", user_id=user.id) for i in range(goals))
+        session.commit()
+        goal_ids = session.exec(select(Goal.id).where(Goal.user_id == user.id).order_by(Goal.id)).all()
+
+        for start in range(0, todos, SEED_BATCH_SIZE):
+            rows = [
+                {"title": f"todo {i}", "done": i % 3 == 0, "user_id": user.id, "goal_id": goal_ids[i % goals]}
+                for i in range(start, min(start + SEED_BATCH_SIZE, todos))
+            ]
+            session.exec(insert(Todo), params=rows)
+        session.commit()
+        todo_ids = session.exec(select(Todo.id, Todo.goal_id).where(Todo.user_id == user.id).order_by(Todo.id)).all()
+    asyncio.run(rebuild_counters(user.id))
+    return {"user_id": user.id, "goal_ids": list(goal_ids), "todos": [tuple(row) for row in todo_ids]}
+
+
+async def rebuild_counters(user_id: int) -> None:
+    async with AsyncSession(async_engine) as session:
+        await Counter.reconcile(session, user_id)
+    # 시나리오마다 새 이벤트 루프를 쓰므로 커넥션을 남겨두지 않음
+    await async_engine.dispose()
+
+
+def build_scenarios(seeded: dict) -> dict[str, Request]:
+    login_body = {"email": BENCH_USER_EMAIL, "password": BENCH_PASSWORD}
+    goal_ids = seeded["goal_ids"]
+    # 노트는 할 일마다 하나만 만들 수 있으므로 요청마다 다음 할 일을 사용
+    note_targets = iter(seeded["todos"])
+    # 클라이언트별 다음 페이지 커서
+    cursors: dict[int, str | None] = {}
+
+    async def login(client: httpx.AsyncClient, worker: int) -> httpx.Response:
+        return await client.post("/auth/login", json=login_body)
+
+    async def paging(client: httpx.AsyncClient, worker: int) -> httpx.Response:
+        params = {"size": 100}
+        if cursors.get(worker):
+            params["cursor"] = cursors[worker]
+        response = await client.get("/todos", params=params)
+        if response.is_success:
+            cursors[worker] = response.json()["next_cursor"]
+        return response
+
+    async def progress(client: httpx.AsyncClient, worker: int) -> httpx.Response:
+        return await client.get("/todos/progress", params={"goalId": goal_ids[worker % len(goal_ids)]})
+
+    async def notes(client: httpx.AsyncClient, worker: int) -> httpx.Response:
+        todo_id, goal_id = next(note_targets)
+        body = {"title": "note", "content": "bench", "goal_id": goal_id, "todo_id": todo_id}
+        return await client.post("/notes", json=body)
+
+    async def upload(client: httpx.AsyncClient, worker: int) -> httpx.Response:
+        files = {"file": ("bench.bin", os.urandom(UPLOAD_SIZE), "application/octet-stream")}
+        return await client.post("/files", files=files)
+
+    return {"login": login, "paging": paging, "progress": progress, "notes": notes, "upload": upload}
+
+
+async def run_load(
+    base_url: str, headers: dict, request: Request, clients: int, requests: int, timeout: float, deadline: float
+) -> dict:
+    latencies: list[float] = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def worker(client: httpx.AsyncClient, worker_id: int):
+        nonlocal errors
+        for _ in remaining:
+            started = time.perf_counter()
+            try:
+                response = await request(client, worker_id)
+                response.raise_for_status()
+            except httpx.HTTPError:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - started)
+
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+    async with httpx.AsyncClient(base_url=base_url, headers=headers, limits=limits, timeout=timeout) as client:
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(asyncio.gather(*(worker(client, i) for i in range(clients))), deadline)
+        except asyncio.TimeoutError:
+            # 제한 시간 안에 끝나지 못한 요청은 모두 실패로 집계
+            errors = requests - len(latencies)
+        elapsed = time.perf_counter() - started
+
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else [float("nan")] * 99
+    return {
+        "requests": requests,
+        "rps": round(len(latencies) / elapsed, 2),
+        "errors": errors,
+        "p50": round(quantiles[49] * 1000, 2),
+        "p95": round(quantiles[94] * 1000, 2),
+        "p99": round(quantiles[98] * 1000, 2),
+    }
+
+
+def start_server(port: int, media_root: Path) -> subprocess.Popen:
+    env = {**os.environ, "MEDIA_ROOT": str(media_root)}
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"], env=env
+    )
+    for _ in range(100):
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/docs")
+            return server
+        except httpx.TransportError:
+            time.sleep(0.1)
+    server.kill()
+    raise RuntimeError("벤치마크 서버가 시작되지 않았습니다")
+
+
+def stop_server(server: subprocess.Popen):
+    server.terminate()
+    try:
+        server.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        server.kill()
+        server.wait()
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """기준보다 req/s가 threshold 비율 이상 떨어졌거나 p95가 그만큼 늘어난 시나리오를 찾습니다."""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get("scenarios", {}).get(name)
+        if base is None:
+            continue
+        if result["rps"] < base["rps"] * (1 - threshold):
+            regressions.append(f"{name}: req/s {base['rps']:.1f} -> {result['rps']:.1f}")
+        if result["p95"] > base["p95"] * (1 + threshold):
+            regressions.append(f"{name}: p95 {base['p95']:.1f}ms -> {result['p95']:.1f}ms")
+        if result["errors"] > base["errors"]:
+            regressions.append(f"{name}: errors {base['errors']} -> {result['errors']}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=2000, help="시나리오별 요청 수")
+    parser.add_argument("--login-requests", type=int, default=200, help="login 시나리오의 요청 수 (bcrypt가 느림)")
+    parser.add_argument("--todos", type=int, default=100_000)
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--timeout", type=float, default=30.0, help="요청별 타임아웃(초)")
+    parser.add_argument("--deadline", type=float, default=300.0, help="시나리오별 전체 제한 시간(초)")
+    parser.add_argument("--media-root", type=Path, default=Path("bench-media"))
+    parser.add_argument("--scenario", choices=SCENARIOS, action="append", help="실행할 시나리오 (기본: 전체)")
+    parser.add_argument("--output", type=Path, help="결과를 JSON으로 기록할 경로")
+    parser.add_argument("--baseline", type=Path, help="비교할 기준 결과(JSON)")
+    parser.add_argument("--threshold", type=float, default=0.1, help="회귀로 볼 변화 비율 (기본 0.1 = 10%%)")
+    args = parser.parse_args()
+
+    seeded = seed(args.todos)
+    args.media_root.mkdir(parents=True, exist_ok=True)
+    # 노트 생성 요청 수만큼 할 일이 있어야 함
+    requests = {name: args.login_requests if name == "login" else args.requests for name in SCENARIOS}
+    requests["notes"] = min(requests["notes"], len(seeded["todos"]))
+
+    results = {}
+    server = start_server(args.port, args.media_root.resolve())
+    try:
+        base_url = f"http://127.0.0.1:{args.port}"
+        token = httpx.post(f"{base_url}/auth/login", json={"email": BENCH_USER_EMAIL, "password": BENCH_PASSWORD})
+        headers = {"Authorization": f"Bearer {token.json()['access_token']}"}
+        scenarios = build_scenarios(seeded)
+        for name in args.scenario or SCENARIOS:
+            result = asyncio.run(
+                run_load(base_url, headers, scenarios[name], args.clients, requests[name], args.timeout, args.deadline)
+            )
+            results[name] = result
+            print(
+                f"{name:>8}: {result['rps']:8.1f} req/s  errors {result['errors']:5d}  "
+                f"p50 {result['p50']:7.1f}ms  p95 {result['p95']:7.1f}ms  p99 {result['p99']:7.1f}ms"
+            )
+    finally:
+        stop_server(server)
+
+    report = {
+        "machine": {
+            "python": platform.python_version(),
+            "platform": f"{platform.system()}-{platform.machine()}",
+            "cpus": os.cpu_count(),
+        },
+        "config": {"clients": args.clients, "todos": args.todos},
+        "scenarios": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+    if args.baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text()), args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+"""
+모든 요청이 거치는 구성 요소를 서버와 DB 없이 따로 재는 마이크로 벤치마크입니다.
+
+    token_create      create_access_token
+    token_verify      verify_token (캐시 없이 JWT 디코딩)
+    token_cached      verify_token (토큰 캐시 적중)
+    token_header      get_token_from_header
+    todo_response     할 일 100개의 레코드로 TodoList 만들기 (할 일 목록 라우터와 같은 방식)
+    todo_list_encode  100개짜리 TodoList를 response_model로 검증하고 JSON으로 인코딩
+    note_response     Todo/Goal/User가 함께 로딩된 Note를 NoteResponse로 검증하고 JSON으로 인코딩
+    db_exception      handle_db_exception (중복, 외래 키, 기타 DB 오류, HTTPException)
+
+응답 모델 경로는 라우트에 만들어지는 response_model 필드로 FastAPI와 같이 검증한 뒤 pydantic으로 바로 JSON bytes를
+만듭니다 (기본 응답 클래스일 때 FastAPI가 쓰는 dump_json 경로).
+
+케이스마다 한 라운드가 --min-time초 이상 걸리도록 반복 횟수를 정하고, GC를 끈 채 --rounds번 잰 뒤 가장 빠른 라운드를
+결과로 씁니다. 가장 빠른 라운드는 다른 프로세스나 GC의 간섭을 가장 덜 받은 값이라 라운드 사이 흔들림이 몇 % 안쪽이므로
+10% 회귀를 구분할 수 있습니다.
+
+    DB_URI=sqlite:///bench.db SECRET_KEY=bench python -m benchmarks.hotpath --output result.json \\
+        --baseline benchmarks/baselines/hotpath.json
+
+네트워크와 DB 연결 없이 실행됩니다 (목록 레코드는 메모리 SQLite에서 만듭니다).
+--baseline을 주면 기준보다 --threshold 비율 이상 느려진 케이스를 회귀로 보고하고 종료 코드 1로 끝납니다.
+기준 결과는 머신에 따라 다르므로 같은 머신에서 만든 결과끼리 비교해야 합니다.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+from fastapi import HTTPException
+from fastapi.routing import APIRoute
+from sqlalchemy import create_engine
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlmodel import Session, SQLModel, select
+
+from app.core.security import create_access_token, token_cache, verify_token
+from app.depends.token import get_token_from_header
+from app.exceptions.db_exception import handle_db_exception
+from app.models import Goal, Note, Todo, User
+from app.schema.note import NoteResponse
+from app.schema.todo import TodoList, TodoResponse
+
+TODO_COUNT = 100
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def make_todos(count: int = TODO_COUNT) -> list[Todo]:
+    todos = []
+    for i in range(1, count + 1):
+        todo = Todo(
+            id=i,
+            title=f"할 일 {i}",
+            done=i % 3 == 0,
+            link_url=f"https://example.com/{i}" if i % 2 else None,
+            user_id=1,
+            goal_id=i % 10 + 1,
+            created_at=NOW,
+            updated_at=NOW,
+        )
+        # 노트 관계가 로딩된 상태 (note_id 계산)
+        todo.note = (
+            Note(id=i, title="노트", content="내용", user_id=1, goal_id=todo.goal_id, todo_id=i) if i % 4 == 0 else None
+        )
+        todos.append(todo)
+    return todos
+
+
+def make_todo_records(count: int = TODO_COUNT) -> list[tuple]:
+    """할 일 목록 라우터와 같이 응답에 필요한 컬럼과 노트 id만 조회한 레코드. 메모리 SQLite에서 만듭니다."""
+    memory_engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(memory_engine)
+    with Session(memory_engine) as session:
+        session.add_all(make_todos(count))
+        session.commit()
+        query = (
+            select(Todo.record(TodoResponse, Note.id.label("note_id")))
+            .outerjoin(Note, Note.todo_id == Todo.id)
+            .order_by(Todo.id)
+        )
+        return session.exec(query).all()
+
+
+def make_note() -> Note:
+    user = User(id=1, email="bench@example.com", name="bench", hashed_password="x", created_at=NOW, updated_at=NOW)
+    goal = Goal(id=1, title="목표", user_id=1, created_at=NOW, updated_at=NOW)
+    todo = Todo(id=1, title="할 일", user_id=1, goal_id=1, created_at=NOW, updated_at=NOW)
+    note = Note(
+        id=1,
+        title="노트",
+        content="내용 " * 100,
+        link_url="https://example.com",
+        user_id=1,
+        goal_id=1,
+        todo_id=1,
+        created_at=NOW,
+        updated_at=NOW,
+    )
+    note.user, note.goal, note.todo = user, goal, todo
+    return note
+
+
+def response_encoder(model: type) -> Callable[[object], bytes]:
+    """FastAPI의 serialize_response와 같이 라우트의 response_model 필드로 검증한 뒤 JSON bytes로 직렬화"""
+
+    async def endpoint():
+        pass
+
+    field = APIRoute("/", endpoint, response_model=model).response_field
+
+    def encode(content: object) -> bytes:
+        value, errors = field.validate(content, {}, loc=("response",))
+        assert not errors, errors
+        return field.serialize_json(value, by_alias=True)
+
+    return encode
+
+
+def build_cases() -> dict[str, Callable[[], object]]:
+    token = create_access_token(1)
+    header = f"Bearer {token}"
+
+    def token_verify():
+        # 캐시를 비워 매번 JWT를 디코딩
+        token_cache.clear()
+        return verify_token(token)
+
+    def token_cached():
+        return verify_token(token)
+
+    todos = make_todo_records()
+
+    def todo_list():
+        return TodoList(todos=todos, total_count=len(todos), next_cursor="abc")
+
+    page = todo_list()
+    encode_todo_list = response_encoder(TodoList)
+    note = make_note()
+    encode_note = response_encoder(NoteResponse)
+
+    db_errors = [
+        IntegrityError("INSERT", {}, Exception("UNIQUE constraint failed: note.todo_id")),
+        IntegrityError("INSERT", {}, Exception("FOREIGN KEY constraint failed")),
+        OperationalError("SELECT", {}, Exception("database is locked")),
+        HTTPException(status_code=404),
+    ]
+
+    def db_exception():
+        for exc in db_errors:
+            handle_db_exception(exc)
+
+    verify_token(token)
+    return {
+        "token_create": lambda: create_access_token(1),
+        "token_verify": token_verify,
+        "token_cached": token_cached,
+        "token_header": lambda: get_token_from_header(header),
+        "todo_response": todo_list,
+        "todo_list_encode": lambda: encode_todo_list(page),
+        "note_response": lambda: encode_note(note),
+        "db_exception": db_exception,
+    }
+
+
+def calibrate(func: Callable[[], object], min_time: float) -> int:
+    """한 라운드가 min_time초 이상 걸리는 반복 횟수"""
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        if time.perf_counter() - started >= min_time:
+            return number
+        number *= 2
+
+
+def measure(func: Callable[[], object], number: int, rounds: int) -> list[float]:
+    """GC를 끈 채 number번씩 rounds번 실행해 라운드별 호출당 시간(초)을 반환합니다."""
+    timings = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            started = time.perf_counter()
+            for _ in range(number):
+                func()
+            timings.append((time.perf_counter() - started) / number)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return timings
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """기준보다 호출당 시간이 threshold 비율 이상 늘어난 케이스를 찾습니다."""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get("cases", {}).get(name)
+        if base is not None and result["best_us"] > base["best_us"] * (1 + threshold):
+            regressions.append(f"{name}: {base['best_us']:.2f}us -> {result['best_us']:.2f}us")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=7)
+    parser.add_argument("--min-time", type=float, default=0.2, help="라운드 하나의 최소 시간(초)")
+    parser.add_argument("--case", action="append", help="실행할 케이스 (기본: 전체)")
+    parser.add_argument("--output", type=Path, help="결과를 JSON으로 기록할 경로")
+    parser.add_argument("--baseline", type=Path, help="비교할 기준 결과(JSON)")
+    parser.add_argument("--threshold", type=float, default=0.1, help="회귀로 볼 변화 비율 (기본 0.1 = 10%%)")
+    args = parser.parse_args()
+
+    cases = build_cases()
+    unknown = set(args.case or ()) - cases.keys()
+    if unknown:
+        parser.error(f"알 수 없는 케이스: {', '.join(sorted(unknown))}")
+
+    results = {}
+    for name in args.case or cases:
+        func = cases[name]
+        number = calibrate(func, args.min_time)
+        timings = measure(func, number, args.rounds)
+        best, median = min(timings), sorted(timings)[len(timings) // 2]
+        results[name] = {"best_us": round(best * 1e6, 3), "median_us": round(median * 1e6, 3), "number": number}
+        print(f"{name:>16}: {best * 1e6:10.2f}us  median {median * 1e6:10.2f}us  spread {(median / best - 1):6.1%}")
+
+    report = {
+        "machine": {
+            "python": platform.python_version(),
+            "platform": f"{platform.system()}-{platform.machine()}",
+            "cpus": os.cpu_count(),
+        },
+        "config": {"rounds": args.rounds, "min_time": args.min_time},
+        "cases": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+    if args.baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text()), args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
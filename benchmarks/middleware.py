@@ -0,0 +1,114 @@
+"""
+에러 처리 미들웨어가 요청마다 더하는 비용을 측정하는 마이크로 벤치마크입니다.
+
+빈 응답을 돌려주는 엔드포인트 하나짜리 앱을 미들웨어 없이, 이전 BaseHTTPMiddleware 구현으로,
+현재 순수 ASGI 구현(SQLAlchemyExceptionMiddleware)으로 감싼 뒤 서버와 네트워크 없이 ASGI 앱을 직접 호출해
+요청당 시간을 비교합니다. 라운드마다 요청 N개(기본 20000)를 보내고 가장 빠른 라운드를 출력합니다.
+
+    DB_URI=sqlite:///bench.db SECRET_KEY=bench python -m benchmarks.middleware
+"""
+
+import argparse
+import asyncio
+import time
+
+from fastapi import FastAPI
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+from app.exceptions.db_exception import handle_db_exception
+from app.middleware import SQLAlchemyExceptionMiddleware
+
+
+class BaseHTTPExceptionMiddleware(BaseHTTPMiddleware):
+    """비교용으로 남겨 둔 이전 BaseHTTPMiddleware 기반 구현"""
+
+    async def dispatch(self, request: Request, call_next):
+        try:
+            return await call_next(request)
+        except Exception as exc:
+            http_exc = handle_db_exception(exc)
+            return JSONResponse(status_code=http_exc.status_code, content={"detail": http_exc.detail})
+
+
+def build_app(middleware: type | None) -> FastAPI:
+    bench_app = FastAPI()
+    if middleware is not None:
+        bench_app.add_middleware(middleware)
+
+    @bench_app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    return bench_app
+
+
+SCENARIOS = {
+    "none": None,
+    "base_http": BaseHTTPExceptionMiddleware,
+    "asgi": SQLAlchemyExceptionMiddleware,
+}
+
+SCOPE = {
+    "type": "http",
+    "asgi": {"version": "3.0", "spec_version": "2.4"},
+    "http_version": "1.1",
+    "method": "GET",
+    "scheme": "http",
+    "path": "/ping",
+    "raw_path": b"/ping",
+    "root_path": "",
+    "query_string": b"",
+    "headers": [(b"host", b"bench")],
+    "client": ("127.0.0.1", 50000),
+    "server": ("bench", 80),
+}
+
+
+async def run_round(bench_app: FastAPI, requests: int) -> float:
+    """요청 requests개를 순서대로 처리하고 요청당 평균 시간(초)을 반환합니다."""
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            assert message["status"] == 200, message
+
+    started = time.perf_counter()
+    for _ in range(requests):
+        await bench_app(dict(SCOPE), receive, send)
+    return (time.perf_counter() - started) / requests
+
+
+async def run(requests: int, rounds: int, scenarios: list[str]) -> dict[str, float]:
+    apps = {name: build_app(SCENARIOS[name]) for name in scenarios}
+    # 미들웨어 스택은 첫 요청에서 만들어지므로 측정 전에 한 번씩 호출
+    for bench_app in apps.values():
+        await run_round(bench_app, 100)
+
+    best = {name: float("inf") for name in scenarios}
+    # 시나리오를 번갈아 실행해 시간에 따른 변동이 한쪽에만 몰리지 않도록 함
+    for _ in range(rounds):
+        for name, bench_app in apps.items():
+            best[name] = min(best[name], await run_round(bench_app, requests))
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--scenario", choices=SCENARIOS, action="append", help="실행할 시나리오 (기본: 전체)")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.requests, args.rounds, args.scenario or list(SCENARIOS)))
+    baseline = results.get("none")
+    for name, seconds in results.items():
+        overhead = f"  overhead {(seconds - baseline) * 1e6:6.1f}us" if baseline is not None else ""
+        print(f"{name:>9}: {seconds * 1e6:7.1f}us/req  {1 / seconds:9.1f} req/s{overhead}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+저장된 카운터(목표 진행도 포함)를 실제 집계와 비교합니다.
+
+    python -m scripts.check_counters          # 어긋난 행만 출력, 있으면 종료 코드 1
+    python -m scripts.check_counters --fix    # 어긋난 행을 바로잡음
+"""
+
+import argparse
+import asyncio
+import sys
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.db import async_engine
+from app.models import Counter
+
+
+async def check_counters(user_id: int | None, fix: bool) -> list[tuple[int, int]]:
+    async with AsyncSession(bind=async_engine, expire_on_commit=False) as session:
+        drifted = await Counter.reconcile(session, user_id, fix=fix)
+    await async_engine.dispose()
+    return drifted
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--user-id", type=int, default=None, help="검사할 사용자 (기본: 전체)")
+    parser.add_argument("--fix", action="store_true", help="어긋난 카운터를 실제 집계 값으로 바로잡음")
+    args = parser.parse_args()
+
+    drifted = asyncio.run(check_counters(args.user_id, args.fix))
+    for user_id, goal_id in drifted:
+        print(f"user_id={user_id} goal_id={goal_id}")
+    print(f"{len(drifted)}개 행이 실제 집계와 {'달라 수정했습니다' if args.fix else '다릅니다'}")
+    if drifted and not args.fix:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,20 @@
+from contextlib import contextmanager
 from typing import Generator
 
 import pytest
+from alembic import command
 from fastapi.testclient import TestClient
-from app.core.db import engine
+from app.core.db import async_engine, engine
 from sqlmodel import SQLModel, Session, select
-import sqlalchemy as sa
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.core.security import get_password_hash
+from app.core.migration import get_alembic_config
+from app.core.queries import instrument_engine, track_queries
+from app.core.security import get_password_hash, token_cache
 from app.depends.db import SessionDep
+from app.depends.user import user_cache
 from app.main import app
+from app.models.counter import Counter
 from app.models.user import User
 from app.models.note import Note
 from app.models.goal import Goal
@@ -19,6 +25,11 @@ from app.models.todo import Todo
 def reset_db():
     SQLModel.metadata.drop_all(engine)
     SQLModel.metadata.create_all(engine)
+    # 앱 시작 시 마이그레이션이 이미 만든 테이블을 다시 만들지 않도록 최신 리비전으로 표시
+    command.stamp(get_alembic_config(), "head")
+    # 같은 id로 다시 만들어지는 사용자가 이전 테스트의 캐시를 보지 않도록 비움
+    token_cache.clear()
+    user_cache.clear()
 
 
 @pytest.fixture()
@@ -30,6 +41,40 @@ def session():
 app.dependency_overrides[SessionDep] = session
 
 
+@pytest.fixture()
+async def async_session():
+    async with AsyncSession(bind=async_engine, expire_on_commit=False) as session:
+        yield session
+    # 테스트마다 이벤트 루프가 바뀌므로 커넥션을 남겨두지 않음
+    await async_engine.dispose()
+
+
+@pytest.fixture()
+async def reconciled_counters(async_session: AsyncSession):
+    """
+    배포 시 마이그레이션이 채우는 것처럼 기존 데이터의 카운터 행을 채웁니다.
+    fixture는 요청한 순서대로 만들어지므로 데이터를 만드는 fixture보다 뒤에 요청해야 합니다.
+    """
+    await Counter.reconcile(async_session)
+
+
+# 테스트에서 쿼리 수를 셀 수 있도록 앱의 엔진을 계측
+for instrumented_engine in (engine, async_engine.sync_engine):
+    instrument_engine(instrumented_engine)
+
+
+@pytest.fixture()
+def count_queries():
+    """블록 안에서 앱의 엔진으로 실행된 SQL 문을 수집합니다."""
+
+    @contextmanager
+    def _count_queries():
+        with track_queries() as queries:
+            yield queries.statements
+
+    return _count_queries
+
+
 @pytest.fixture(scope="function")
 def default_user(session: Session):
     user = User(
@@ -0,0 +1,73 @@
+import sys
+import threading
+import time
+
+from app.core.cache import TTLCache
+
+
+def test_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_expires_entries(monkeypatch):
+    cache = TTLCache(maxsize=10, ttl=5)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=0)
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 10)
+
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+    assert len(cache) == 0
+
+
+def test_disabled_cache_keeps_nothing():
+    cache = TTLCache(maxsize=10, ttl=60, enabled=False)
+    cache.set("a", 1)
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_concurrent_access_from_threads():
+    # 동기 의존성은 스레드풀에서 돌기 때문에 여러 스레드가 같은 캐시를 동시에 만집니다
+    cache = TTLCache(maxsize=8, ttl=60)
+    errors = []
+    # 스레드 전환을 자주 일으켜 경합이 드러나게 합니다
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+
+    def worker(offset: int):
+        try:
+            for i in range(5000):
+                key = (offset + i) % 16
+                cache.set(key, i)
+                cache.get(key)
+                cache.get((key + 1) % 16)
+                if i % 7 == 0:
+                    cache.invalidate(key)
+        except Exception as e:  # noqa: BLE001
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert errors == []
+    assert len(cache) <= cache.maxsize
+    assert cache.hits + cache.misses == 8 * 5000 * 2
@@ -0,0 +1,23 @@
+import pytest
+
+from app.core.db import get_async_db_uri, get_connect_args
+
+
+@pytest.mark.parametrize(
+    "db_uri, async_uri",
+    [
+        ("sqlite:///test.db", "sqlite+aiosqlite:///test.db"),
+        ("postgresql://app:secret@db:5432/todo", "postgresql+asyncpg://app:secret@db:5432/todo"),
+        # 드라이버를 직접 지정하면 그대로 사용
+        ("postgresql+psycopg://app@db/todo", "postgresql+psycopg://app@db/todo"),
+    ],
+)
+def test_get_async_db_uri(db_uri: str, async_uri: str):
+    assert get_async_db_uri(db_uri) == async_uri
+
+
+def test_get_connect_args():
+    assert get_connect_args("sqlite:///test.db") == {"check_same_thread": False}
+    assert get_connect_args("sqlite+pysqlite:///test.db") == {"check_same_thread": False}
+    # psycopg2는 알 수 없는 연결 인자를 거부함
+    assert get_connect_args("postgresql://app@db/todo") == {}
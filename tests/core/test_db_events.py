@@ -0,0 +1,41 @@
+from sqlalchemy import create_engine, text
+
+from app.core import db_events, metrics, queries, timing
+from app.core.queries import track_queries
+from app.core.timing import RequestTiming, current_timing
+
+
+def test_single_listener_pair_for_all_subscribers():
+    engine = create_engine("sqlite://")
+    for module in (timing, queries, metrics, timing):
+        module.instrument_engine(engine)
+
+    assert len(engine.dispatch.before_cursor_execute) == 1
+    assert len(engine.dispatch.after_cursor_execute) == 1
+
+    request_timing = RequestTiming()
+    token = current_timing.set(request_timing)
+    statements = metrics.db_statements._values.get((), 0)
+    try:
+        with track_queries() as log, engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    finally:
+        current_timing.reset(token)
+
+    # 한 번 잰 시간을 모든 구독자가 함께 씀
+    assert log.count == 1
+    assert request_timing.db_count == 1
+    assert request_timing.db_time == log.total_time
+    assert metrics.db_statements._values.get((), 0) == statements + 1
+
+
+def test_subscribe_ignores_duplicates(monkeypatch):
+    monkeypatch.setattr(db_events, "_subscribers", ())
+
+    def callback(conn, statement, parameters, executemany, seconds):
+        pass
+
+    db_events.subscribe(callback)
+    db_events.subscribe(callback)
+
+    assert db_events._subscribers == (callback,)
@@ -0,0 +1,96 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.metrics import CallbackMetric, Counter, Histogram, Metric, Registry
+from app.core.settings import settings
+from app.middleware import MetricsMiddleware
+from app.routers import file, goal, metrics
+
+
+@pytest.fixture
+def metrics_client():
+    # 지표는 기본으로 꺼져 있으므로 켠 앱을 따로 구성
+    metrics_app = FastAPI()
+    metrics_app.add_middleware(MetricsMiddleware)
+    for router in (goal.router, file.router, metrics.router):
+        metrics_app.include_router(router)
+    with TestClient(metrics_app) as client:
+        yield client
+
+
+def test_metric_without_samples_cannot_be_created():
+    class Incomplete(Metric):
+        type = "gauge"
+
+    with pytest.raises(TypeError):
+        Incomplete("incomplete", "samples()가 없는 지표")
+
+
+def test_render_prometheus_text():
+    registry = Registry()
+    requests = registry.register(Counter("requests_total", "요청 수", ("route",)))
+    latency = registry.register(Histogram("latency_seconds", "지연 시간", buckets=(0.1, 1)))
+    registry.register(CallbackMetric("queue_depth", "큐 길이", lambda: [((), 3)]))
+
+    requests.inc('/a"b')
+    requests.inc('/a"b', amount=2)
+    for value in (0.05, 0.1, 0.5, 3):
+        latency.observe(value)
+
+    assert registry.render().splitlines() == [
+        "# HELP requests_total 요청 수",
+        "# TYPE requests_total counter",
+        'requests_total{route="/a\\"b"} 3',
+        "# HELP latency_seconds 지연 시간",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{le="0.1"} 2',
+        'latency_seconds_bucket{le="1"} 3',
+        'latency_seconds_bucket{le="+Inf"} 4',
+        "latency_seconds_sum 3.65",
+        "latency_seconds_count 4",
+        "# HELP queue_depth 큐 길이",
+        "# TYPE queue_depth gauge",
+        "queue_depth 3",
+    ]
+
+
+def test_metrics_endpoint(metrics_client: TestClient, login_user, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "MEDIA_ROOT", str(tmp_path))
+    headers = {"Authorization": f"Bearer {login_user['access_token']}"}
+    client = metrics_client
+    client.post("/files", headers=headers, files={"file": ("memo.txt", b"memo", "text/plain")})
+    client.get("/goals", headers=headers)
+    client.get("/goals", headers=headers)
+    client.get("/no-such-path")
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/plain; version=0.0.4; charset=utf-8"
+    lines = response.text.splitlines()
+    assert any(line.startswith('http_requests_total{method="GET",route="/goals",status="200"} ') for line in lines)
+    assert any(line.startswith('http_requests_total{method="GET",route="unmatched",status="404"} ') for line in lines)
+    assert any(
+        line.startswith('http_request_duration_seconds_bucket{method="GET",route="/goals",le="+Inf"} ')
+        for line in lines
+    )
+    assert any(line.startswith("db_statements_total ") for line in lines)
+    assert any(line.startswith("upload_bytes_total ") for line in lines)
+    assert "password_hash_queue_depth 0" in lines
+    assert any(line.startswith('cache_hits_total{cache="token"} ') for line in lines)
+    assert any(line.startswith('cache_hit_ratio{cache="user"} ') for line in lines)
+
+
+def test_metrics_disabled_by_default(client: TestClient):
+    assert settings.METRICS_ENABLED is False
+    assert client.get("/metrics").status_code == 404
+
+
+def test_metrics_token(metrics_client: TestClient, monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape-secret")
+
+    assert metrics_client.get("/metrics").status_code == 401
+    assert metrics_client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+    response = metrics_client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+    assert response.status_code == 200
+    assert "# TYPE http_requests_total counter" in response.text
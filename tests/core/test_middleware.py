@@ -0,0 +1,55 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from app.middleware import SQLAlchemyExceptionMiddleware
+
+app = FastAPI()
+app.add_middleware(SQLAlchemyExceptionMiddleware)
+
+
+@app.get("/unique")
+async def unique_violation():
+    raise IntegrityError("INSERT", {}, Exception("UNIQUE constraint failed: user.email"))
+
+
+@app.get("/foreign-key")
+async def foreign_key_violation():
+    raise IntegrityError("INSERT", {}, Exception("FOREIGN KEY constraint failed"))
+
+
+@app.get("/operational")
+async def operational_error():
+    raise OperationalError("SELECT", {}, Exception("database is locked"))
+
+
+@app.get("/stream")
+async def stream():
+    async def chunks():
+        for i in range(3):
+            yield f"{i}\n".encode()
+
+    return StreamingResponse(chunks())
+
+
+@pytest.fixture
+def middleware_client():
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.mark.parametrize(
+    "path, status_code",
+    [("/unique", 409), ("/foreign-key", 400), ("/operational", 500)],
+)
+def test_translate_db_exception(middleware_client: TestClient, path: str, status_code: int):
+    response = middleware_client.get(path)
+    assert response.status_code == status_code
+    assert "detail" in response.json()
+
+
+def test_pass_through_streaming_response(middleware_client: TestClient):
+    with middleware_client.stream("GET", "/stream") as response:
+        assert list(response.iter_lines()) == ["0", "1", "2"]
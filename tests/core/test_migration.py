@@ -0,0 +1,117 @@
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import Engine, create_engine, inspect, text
+from sqlmodel import Session, SQLModel
+
+from app.core.migration import BASELINE_REVISION, get_alembic_config, run_migrations
+from app.models import Goal, Note, Todo, User
+
+
+@pytest.fixture
+def empty_engine(tmp_path) -> Engine:
+    return create_engine(f"sqlite:///{tmp_path / 'migration.db'}")
+
+
+def get_revision(bind: Engine) -> str | None:
+    with bind.connect() as connection:
+        return MigrationContext.configure(connection).get_current_revision()
+
+
+def test_migrations_match_models(empty_engine: Engine):
+    run_migrations(empty_engine)
+
+    with empty_engine.connect() as connection:
+        diff = compare_metadata(MigrationContext.configure(connection), SQLModel.metadata)
+    assert diff == []
+
+
+def test_migrate_database_created_by_create_all(empty_engine: Engine):
+    # 마이그레이션 도입 전 lifespan의 create_all이 만들던 테이블 (초기 리비전과 같은 스키마)
+    config = get_alembic_config()
+    with empty_engine.begin() as connection:
+        config.attributes["connection"] = connection
+        command.upgrade(config, BASELINE_REVISION)
+        connection.execute(text("DROP TABLE alembic_version"))
+
+    run_migrations(empty_engine)
+
+    assert get_revision(empty_engine) == ScriptDirectory.from_config(get_alembic_config()).get_current_head()
+    index_names = {index["name"] for index in inspect(empty_engine).get_indexes("todo")}
+    assert "ix_todo_user_id_goal_id_done_id" in index_names
+
+
+def test_backfill_counters(empty_engine: Engine):
+    config = get_alembic_config()
+    with empty_engine.begin() as connection:
+        config.attributes["connection"] = connection
+        command.upgrade(config, "0010")
+
+    # 카운터 테이블 도입 전부터 있던 데이터
+    with Session(empty_engine) as session:
+        user = User(email="old@example.com", name="old", hashed_password="x")
+        session.add(user)
+        session.flush()
+        # 한 행씩 넣어 이후 리비전에서 추가된 insert sentinel 열을 쓰지 않음
+        goals = [Goal(title=f"목표 {i}", user_id=user.id) for i in range(2)]
+        for goal in goals:
+            session.add(goal)
+            session.flush()
+        todos = [Todo(title="할 일", done=done, user_id=user.id, goal_id=goals[0].id) for done in (True, False)]
+        for todo in todos:
+            session.add(todo)
+            session.flush()
+        todo = todos[0]
+        session.add(Note(title="노트", content="내용", user_id=user.id, goal_id=goals[0].id, todo_id=todo.id))
+        session.commit()
+        user_id, goal_ids = user.id, [goal.id for goal in goals]
+
+    run_migrations(empty_engine)
+
+    with empty_engine.connect() as connection:
+        rows = connection.execute(
+            text(
+                "SELECT goal_id, goals, todos, done_todos, notes FROM counter WHERE user_id = :user_id ORDER BY goal_id"
+            ),
+            {"user_id": user_id},
+        ).all()
+    assert [tuple(row) for row in rows] == [(0, 2, 2, 1, 1), (goal_ids[0], 0, 2, 1, 1), (goal_ids[1], 0, 0, 0, 0)]
+
+
+def test_todo_list_query_uses_index(empty_engine: Engine):
+    run_migrations(empty_engine)
+
+    with empty_engine.connect() as connection:
+        plan = connection.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT * FROM todo "
+                "WHERE user_id = 1 AND goal_id = 1 AND done = 0 ORDER BY id DESC LIMIT 21"
+            )
+        ).all()
+    details = " ".join(row[-1] for row in plan)
+    assert "ix_todo_user_id_goal_id_done_id" in details
+    assert "TEMP B-TREE" not in details
+
+
+@pytest.mark.parametrize(
+    ("order_by", "index"),
+    [
+        ("id DESC", "ix_todo_user_id_goal_id_id"),
+        ("created_at DESC, id DESC", "ix_todo_user_id_goal_id_created_at_id"),
+        ("updated_at DESC, id DESC", "ix_todo_user_id_goal_id_updated_at_id"),
+    ],
+)
+def test_todo_list_by_goal_query_uses_index(empty_engine: Engine, order_by: str, index: str):
+    run_migrations(empty_engine)
+
+    with empty_engine.connect() as connection:
+        plan = connection.execute(
+            text(
+                f"EXPLAIN QUERY PLAN SELECT * FROM todo WHERE user_id = 1 AND goal_id = 1 ORDER BY {order_by} LIMIT 21"
+            )
+        ).all()
+    details = " ".join(row[-1] for row in plan)
+    assert index in details
+    assert "TEMP B-TREE" not in details
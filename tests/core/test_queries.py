@@ -0,0 +1,62 @@
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+from app.core.queries import assert_max_queries, track_queries
+from app.core.settings import settings
+from app.depends.db import AsyncSessionDep
+from app.middleware import QueryLogMiddleware
+from app.models.goal import Goal
+from app.models.user import User
+
+
+def test_track_nested_queries(session: Session, default_user: User):
+    with track_queries() as outer:
+        session.exec(select(User)).all()
+        with track_queries() as inner:
+            session.exec(select(Goal)).all()
+
+    assert inner.count == 1
+    assert outer.count == 2
+    assert outer.total_time >= inner.total_time
+
+
+def test_assert_max_queries(session: Session):
+    with assert_max_queries(1):
+        session.exec(select(User)).all()
+
+    with pytest.raises(AssertionError, match="Expected at most 1 queries, got 2"):
+        with assert_max_queries(1):
+            session.exec(select(User)).all()
+            session.exec(select(Goal)).all()
+
+
+def test_log_slow_query_with_plan(session: Session, monkeypatch, caplog):
+    monkeypatch.setattr(settings, "SLOW_QUERY_MS", 0)
+    with caplog.at_level(logging.WARNING, logger="app.core.queries"):
+        session.exec(select(Goal).where(Goal.user_id == 1)).all()
+
+    message = caplog.records[-1].getMessage()
+    assert message.startswith("Slow query")
+    # SQLite의 EXPLAIN QUERY PLAN 결과
+    assert "ix_goal_user_id" in message
+
+
+def test_warn_possible_n_plus_one(default_user: User, caplog):
+    repeat_app = FastAPI()
+    repeat_app.add_middleware(QueryLogMiddleware, n_plus_one_threshold=3)
+
+    @repeat_app.get("/users/{user_id}/repeat")
+    async def repeat(session: AsyncSessionDep, user_id: int):
+        for _ in range(3):
+            await session.exec(select(User).where(User.id == user_id))
+        return {}
+
+    with caplog.at_level(logging.WARNING, logger="app.middleware.query_log"):
+        TestClient(repeat_app).get(f"/users/{default_user.id}/repeat")
+
+    [record] = caplog.records
+    assert record.getMessage().startswith("Possible N+1 in GET /users/{user_id}/repeat: 3 x SELECT")
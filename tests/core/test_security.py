@@ -0,0 +1,66 @@
+import os
+import signal
+import time
+
+import jwt
+import pytest
+from fastapi import HTTPException
+
+from app.core.security import ALGORITHM, PasswordHashPool, create_access_token, token_cache, verify_token
+from app.core.settings import settings
+from app.exceptions import ServiceUnavailableHTTPException
+
+
+@pytest.fixture
+def hash_pool():
+    pool = PasswordHashPool(max_workers=1, max_pending=4)
+    yield pool
+    pool.shutdown()
+
+
+async def test_hash_and_verify(hash_pool: PasswordHashPool):
+    hashed = await hash_pool.hash("test")
+
+    assert await hash_pool.verify("test", hashed)
+    assert not await hash_pool.verify("wrong", hashed)
+    assert hash_pool.queue_depth == 0
+
+
+async def test_reject_when_queue_is_full():
+    pool = PasswordHashPool(max_workers=1, max_pending=0)
+
+    with pytest.raises(ServiceUnavailableHTTPException):
+        await pool.hash("test")
+
+
+async def test_recover_from_killed_worker(hash_pool: PasswordHashPool):
+    hashed = await hash_pool.hash("test")
+    broken = hash_pool._executor
+    # OOM killer가 워커를 죽인 상황
+    for process in list(broken._processes.values()):
+        os.kill(process.pid, signal.SIGKILL)
+
+    # 깨진 풀을 버리고 새 풀에서 처리
+    assert await hash_pool.verify("test", hashed)
+    assert hash_pool._executor is not broken
+    assert await hash_pool.verify("test", hashed)
+
+
+def test_verify_token_decodes_once(monkeypatch):
+    token = create_access_token(1)
+    decoded = []
+    decode = jwt.decode
+    monkeypatch.setattr(jwt, "decode", lambda *args, **kwargs: decoded.append(token) or decode(*args, **kwargs))
+
+    assert verify_token(token)["sub"] == "1"
+    assert verify_token(token)["sub"] == "1"
+    assert len(decoded) == 1
+    assert token_cache.hits == 1
+
+
+def test_expired_token_is_not_cached():
+    token = jwt.encode({"exp": int(time.time()) - 1, "sub": "1"}, settings.SECRET_KEY, algorithm=ALGORITHM)
+
+    with pytest.raises(HTTPException):
+        verify_token(token)
+    assert len(token_cache) == 0
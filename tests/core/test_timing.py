@@ -0,0 +1,64 @@
+import json
+import logging
+import re
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.timing import RequestTiming, current_timing, measure
+from app.middleware import ServerTimingMiddleware
+from app.models.goal import Goal
+from app.routers import goal
+
+
+@pytest.fixture
+def timed_client():
+    timed_app = FastAPI()
+    timed_app.add_middleware(ServerTimingMiddleware, log=True)
+    timed_app.include_router(goal.router)
+    with TestClient(timed_app) as client:
+        yield client
+
+
+def parse_server_timing(header: str) -> dict[str, str]:
+    return {metric.split(";")[0]: metric for metric in header.split(", ")}
+
+
+def test_server_timing_header(timed_client: TestClient, login_user, default_goal: Goal, caplog):
+    headers = {"Authorization": f"Bearer {login_user['access_token']}"}
+    with caplog.at_level(logging.INFO, logger="app.middleware.server_timing"):
+        response = timed_client.get("/goals", headers=headers)
+    assert response.status_code == 200
+
+    metrics = parse_server_timing(response.headers["Server-Timing"])
+    assert list(metrics) == ["auth", "encode", "db", "handler", "total"]
+    assert all(re.fullmatch(rf"{name};dur=\d+\.\d\d.*", metric) for name, metric in metrics.items())
+    db_count = int(re.search(r'desc="(\d+) queries"', metrics["db"]).group(1))
+    assert db_count > 0
+
+    record = json.loads(caplog.records[-1].getMessage())
+    assert (record["method"], record["path"], record["status"], record["db_count"]) == ("GET", "/goals", 200, db_count)
+
+
+def test_measure_excludes_db_time():
+    timing = RequestTiming()
+    token = current_timing.set(timing)
+    try:
+        with measure("auth"):
+            time.sleep(0.02)
+            # 단계 안에서 실행된 쿼리 시간은 db에만 더함
+            timing.db_time += 0.015
+        phases = timing.phases()
+    finally:
+        current_timing.reset(token)
+
+    assert 0 < phases["auth"] < 0.015
+    assert phases["db"] == 0.015
+
+
+def test_measure_without_request():
+    with measure("auth"):
+        pass
+    assert current_timing.get() is None
@@ -0,0 +1,35 @@
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.note import Note
+from app.models.todo import Todo, TodoBase
+from app.schema.note import NoteResponse
+from app.schema.todo import TodoResponse
+
+
+def test_columns_for_skips_non_columns():
+    # note_id는 프로퍼티, todo/goal/user는 관계이므로 제외
+    assert [column.key for column in Todo.columns_for(TodoResponse)] == [
+        "id",
+        "title",
+        "done",
+        "link_url",
+        "file_url",
+        "user_id",
+        "goal_id",
+        "created_at",
+        "updated_at",
+    ]
+    assert "todo" not in [column.key for column in Note.columns_for(NoteResponse)]
+
+
+async def test_record_returns_nested_namedtuples(async_session: AsyncSession, default_note: Note):
+    query = select(Note.record(NoteResponse, Todo.record(TodoBase))).join(Todo, Note.todo_id == Todo.id)
+
+    [record] = (await async_session.exec(query)).all()
+
+    # 엔티티가 아닌 튜플 레코드이므로 세션에 올라가지 않음
+    assert isinstance(record, tuple)
+    assert (record.id, record.title, record.todo.id) == (default_note.id, default_note.title, default_note.todo_id)
+    assert list(async_session.identity_map.values()) == []
+    assert NoteResponse.model_validate(record._asdict()).todo.id == default_note.todo_id
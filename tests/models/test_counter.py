@@ -0,0 +1,61 @@
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.counter import USER_SCOPE, Counter
+from app.models.goal import Goal
+from app.models.note import Note
+from app.models.todo import Todo
+from app.models.user import User
+
+
+async def test_get_computes_missing_counters_without_writing(async_session: AsyncSession, default_note: Note):
+    user_counter = await Counter.get(async_session, default_note.user_id)
+    goal_counter = await Counter.get(async_session, default_note.user_id, default_note.goal_id)
+    goal_counters = await Counter.get_many(async_session, default_note.user_id)
+
+    assert (user_counter.goals, user_counter.todos, user_counter.done_todos, user_counter.notes) == (1, 1, 0, 1)
+    assert (goal_counter.goals, goal_counter.todos, goal_counter.done_todos, goal_counter.notes) == (0, 1, 0, 1)
+    assert [counter.goal_id for counter in goal_counters] == [default_note.goal_id]
+    # 조회는 행을 저장하지 않음
+    assert (await async_session.exec(select(Counter))).all() == []
+
+
+async def test_get_unknown_goal_returns_zero(async_session: AsyncSession, default_user: User):
+    counter = await Counter.get(async_session, default_user.id, 999999)
+
+    assert counter.todos == 0
+    assert await async_session.get(Counter, (default_user.id, 999999)) is None
+
+
+async def test_reconcile_repairs_drift(async_session: AsyncSession, default_todo: Todo):
+    assert await Counter.reconcile(async_session) == [
+        (default_todo.user_id, USER_SCOPE),
+        (default_todo.user_id, default_todo.goal_id),
+    ]
+    counter = await async_session.get(Counter, (default_todo.user_id, default_todo.goal_id))
+    counter.todos = 10
+    await async_session.commit()
+
+    assert await Counter.reconcile(async_session, fix=False) == [(default_todo.user_id, default_todo.goal_id)]
+    assert await Counter.reconcile(async_session) == [(default_todo.user_id, default_todo.goal_id)]
+    assert await Counter.reconcile(async_session, fix=False) == []
+    assert (await Counter.get(async_session, default_todo.user_id, default_todo.goal_id)).todos == 1
+
+
+async def test_update_todo_stats(
+    async_session: AsyncSession, session: Session, default_user: User, default_goal: Goal, default_todo: Todo
+):
+    other_goal = Goal(title="다른 목표", user_id=default_user.id)
+    session.add(other_goal)
+    session.commit()
+    await Counter.reconcile(async_session)
+
+    await Counter.update_todo_stats(async_session, default_user.id, [((default_goal.id, False), (other_goal.id, True))])
+    await async_session.commit()
+
+    user_counter = await Counter.get(async_session, default_user.id, USER_SCOPE)
+    old_goal_counter = await Counter.get(async_session, default_user.id, default_goal.id)
+    new_goal_counter = await Counter.get(async_session, default_user.id, other_goal.id)
+    assert (user_counter.todos, user_counter.done_todos) == (1, 1)
+    assert (old_goal_counter.todos, old_goal_counter.done_todos) == (0, 0)
+    assert (new_goal_counter.todos, new_goal_counter.done_todos) == (1, 1)
@@ -1,46 +1,46 @@
-import os
-import pytest
+import asyncio
+import io
 from pathlib import Path
-from unittest.mock import Mock
 
+import pytest
+import xxhash
 from fastapi import UploadFile
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.datastructures import Headers
 
+from app.core.db import async_engine
 from app.core.settings import settings
+from app.exceptions import PayloadTooLargeHTTPException
+from app.models.blob import Blob
 from app.models.file import File
 from app.models.user import User
 
 
-@pytest.fixture
-def test_user():
-    return User(email="test@example.com", hashed_password="hashed", name="Test User")
+def make_upload_file(content: bytes, filename: str = "test_upload.txt") -> UploadFile:
+    return UploadFile(file=io.BytesIO(content), filename=filename, headers=Headers({"content-type": "text/plain"}))
 
 
 @pytest.fixture
-def test_file(test_user):
+def test_file(default_user: User):
     return File(
         filename="test.txt",
         original_filename="original.txt",
-        file_path=f"user_{test_user.id}/test.txt",
+        file_path=f"user_{default_user.id}/test.txt",
         mime_type="text/plain",
         size=100,
-        user_id=test_user.id,
+        user_id=default_user.id,
     )
 
 
 @pytest.fixture
-def temp_upload_file(tmp_path):
-    content = b"test content"
-    file_path = tmp_path / "test_upload.txt"
-    file_path.write_bytes(content)
+def media_root(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "MEDIA_ROOT", str(tmp_path))
+    return tmp_path
 
-    async def mock_read(size: int = -1) -> bytes:
-        return content
 
-    upload_file = Mock(spec=UploadFile)
-    upload_file.filename = "test_upload.txt"
-    upload_file.content_type = "text/plain"
-    upload_file.read = mock_read
-    return upload_file
+def media_files(media_root: Path) -> list[str]:
+    return sorted(path.relative_to(media_root).as_posix() for path in media_root.rglob("*") if path.is_file())
 
 
 class TestFile:
@@ -49,39 +49,207 @@ class TestFile:
         expected_path = str(Path(settings.MEDIA_ROOT) / f"user_{test_file.user_id}/test.txt")
         assert full_path == expected_path
 
-    @pytest.mark.asyncio
-    async def test_create_from_upload(self, test_user, temp_upload_file):
+    async def test_create_from_upload(self, async_session: AsyncSession, default_user: User, media_root):
         # 파일 생성 테스트
-        file_obj = await File.create_from_upload(upload_file=temp_upload_file, user_id=test_user.id)
+        file_obj = await File.create_from_upload(async_session, make_upload_file(b"test content"), default_user.id)
+        await async_session.commit()
 
         # 기본 속성 검증
+        checksum = xxhash.xxh3_128_hexdigest(b"test content")
+        assert file_obj.id is not None
         assert file_obj.original_filename == "test_upload.txt"
         assert file_obj.mime_type == "text/plain"
         assert file_obj.size == len(b"test content")
-        assert file_obj.user_id == test_user.id
-
-        # 파일 저장 검증
-        saved_path = Path(file_obj.get_save_path())
-        assert saved_path.exists()
-        assert saved_path.read_bytes() == b"test content"
-
-        # 테스트 후 정리
-        if saved_path.exists():
-            saved_path.unlink()
-            if saved_path.parent.exists():
-                saved_path.parent.rmdir()
-
-    @pytest.mark.asyncio
-    async def test_save_and_delete_file(self, test_file):
-        content = b"test content"
-
-        # 파일 저장 테스트
-        await test_file.save_file(content)
-        saved_path = Path(test_file.get_save_path())
-        assert saved_path.exists()
-        assert saved_path.read_bytes() == content
-
-        # 파일 삭제 테스트
-        await test_file.delete_file()
-        assert not saved_path.exists()
-        assert not saved_path.parent.exists()  # 부모 디렉토리도 삭제되었는지 확인
+        assert file_obj.checksum == checksum
+        assert file_obj.file_path == f"blobs/{checksum[:2]}/{checksum}"
+
+        # 파일 저장 검증 (임시 파일은 남지 않음)
+        assert media_files(media_root) == [file_obj.file_path]
+        assert Path(file_obj.get_save_path()).read_bytes() == b"test content"
+
+    async def test_create_from_upload_in_chunks(
+        self, async_session: AsyncSession, default_user: User, media_root, monkeypatch
+    ):
+        monkeypatch.setattr(settings, "UPLOAD_CHUNK_SIZE", 4)
+        content = b"0123456789" * 10
+        upload_file = make_upload_file(content)
+        reads = []
+        original_read = upload_file.read
+
+        async def read(size: int = -1) -> bytes:
+            reads.append(size)
+            return await original_read(size)
+
+        upload_file.read = read
+        file_obj = await File.create_from_upload(async_session, upload_file, default_user.id)
+
+        # 한 번에 청크 크기만큼만 읽음
+        assert set(reads) == {4}
+        assert file_obj.size == len(content)
+        assert Path(file_obj.get_save_path()).read_bytes() == content
+
+    async def test_create_from_upload_too_large(
+        self, async_session: AsyncSession, default_user: User, media_root, monkeypatch
+    ):
+        monkeypatch.setattr(settings, "UPLOAD_CHUNK_SIZE", 4)
+        monkeypatch.setattr(settings, "UPLOAD_MAX_SIZE", 10)
+
+        with pytest.raises(PayloadTooLargeHTTPException):
+            await File.create_from_upload(async_session, make_upload_file(b"x" * 11), default_user.id)
+
+        # 디스크에 쓰기 전에 거절
+        assert media_files(media_root) == []
+        assert (await async_session.exec(select(Blob))).all() == []
+
+    async def test_save_stream_too_large(self, test_file: File, media_root, monkeypatch):
+        monkeypatch.setattr(settings, "UPLOAD_MAX_SIZE", 10)
+        saved = Path(test_file.get_save_path())
+        saved.parent.mkdir()
+        saved.write_bytes(b"old")
+
+        async def chunks():
+            for _ in range(3):
+                yield b"x" * 4
+
+        # 기존 파일은 그대로 두고 임시 파일은 지움
+        with pytest.raises(PayloadTooLargeHTTPException):
+            await test_file.save_stream(chunks())
+        assert media_files(media_root) == [test_file.file_path]
+        assert saved.read_bytes() == b"old"
+
+    async def test_duplicate_upload_shares_blob(
+        self, async_session: AsyncSession, default_user: User, media_root, monkeypatch
+    ):
+        first = await File.create_from_upload(async_session, make_upload_file(b"same", "a.txt"), default_user.id)
+        await async_session.commit()
+
+        upload_file = make_upload_file(b"same", "b.txt")
+        writes = []
+        original_save_stream = File.save_stream
+
+        async def save_stream(self, chunks):
+            writes.append(self)
+            await original_save_stream(self, chunks)
+
+        monkeypatch.setattr(File, "save_stream", save_stream)
+        second = await File.create_from_upload(async_session, upload_file, default_user.id)
+        await async_session.commit()
+
+        # 같은 내용이면 디스크에 다시 쓰지 않고 행만 추가
+        assert writes == []
+        assert (first.filename, second.filename) == ("a.txt", "b.txt")
+        assert first.file_path == second.file_path
+        assert (await async_session.get(Blob, first.checksum)).ref_count == 2
+        assert media_files(media_root) == [first.file_path]
+
+    async def test_delete_unlinks_blob_with_last_reference(
+        self, async_session: AsyncSession, default_user: User, media_root
+    ):
+        files = [
+            await File.create_from_upload(async_session, make_upload_file(b"same", name), default_user.id)
+            for name in ("a.txt", "b.txt")
+        ]
+        await async_session.commit()
+
+        assert await files[0].delete(async_session) == []
+        await async_session.commit()
+        assert media_files(media_root) == [files[1].file_path]
+        assert (await async_session.get(Blob, files[1].checksum)).ref_count == 1
+
+        orphaned = await files[1].delete(async_session)
+        assert orphaned == [files[1]]
+        # 커밋 전에는 파일을 지우지 않음
+        assert media_files(media_root) == [files[1].file_path]
+        await async_session.commit()
+        await File.remove_files(async_session, orphaned)
+        assert media_files(media_root) == []
+        assert (await async_session.exec(select(Blob))).all() == []
+        assert (await async_session.exec(select(File))).all() == []
+
+    async def test_delete_rollback_keeps_blob(self, async_session: AsyncSession, default_user: User, media_root):
+        file_obj = await File.create_from_upload(async_session, make_upload_file(b"keep"), default_user.id)
+        await async_session.commit()
+        file_path, checksum = file_obj.file_path, file_obj.checksum
+
+        assert await file_obj.delete(async_session) == [file_obj]
+        await async_session.rollback()
+
+        assert media_files(media_root) == [file_path]
+        assert (await async_session.get(Blob, checksum)).ref_count == 1
+
+    async def test_upload_between_delete_commit_and_unlink(
+        self, async_session: AsyncSession, default_user: User, media_root
+    ):
+        file_obj = await File.create_from_upload(async_session, make_upload_file(b"same", "a.txt"), default_user.id)
+        await async_session.commit()
+        orphaned = await file_obj.delete(async_session)
+        await async_session.commit()
+
+        # 삭제가 커밋된 뒤 파일을 지우기 전에 같은 내용이 다른 요청으로 다시 올라옴
+        async with AsyncSession(async_engine, expire_on_commit=False) as other_session:
+            uploaded = await File.create_from_upload(other_session, make_upload_file(b"same", "b.txt"), default_user.id)
+            await other_session.commit()
+
+        await File.remove_files(async_session, orphaned)
+
+        assert media_files(media_root) == [uploaded.file_path]
+        assert Path(uploaded.get_save_path()).read_bytes() == b"same"
+        assert (await async_session.get(Blob, uploaded.checksum)).ref_count == 1
+
+    async def test_upload_while_removal_holds_claim(self, async_session: AsyncSession, default_user: User, media_root):
+        file_obj = await File.create_from_upload(async_session, make_upload_file(b"same", "a.txt"), default_user.id)
+        await async_session.commit()
+        orphaned = await file_obj.delete(async_session)
+        await async_session.commit()
+
+        # 삭제 쪽이 키를 잡고 파일을 지우기 전에 같은 내용이 다른 요청으로 올라옴
+        assert await Blob.claim_removed(async_session, file_obj.checksum)
+
+        async def upload() -> File:
+            async with AsyncSession(async_engine, expire_on_commit=False) as other_session:
+                uploaded = await File.create_from_upload(
+                    other_session, make_upload_file(b"same", "b.txt"), default_user.id
+                )
+                await other_session.commit()
+                return uploaded
+
+        task = asyncio.create_task(upload())
+        await asyncio.sleep(0.2)
+        # 키가 커밋되지 않았으므로 업로드는 키가 풀릴 때까지 기다림
+        assert not task.done()
+
+        Path(file_obj.get_save_path()).unlink()
+        await Blob.drop_claim(async_session, file_obj.checksum)
+        await async_session.commit()
+        uploaded = await task
+
+        assert orphaned == [file_obj]
+        assert Path(uploaded.get_save_path()).read_bytes() == b"same"
+        assert (await async_session.get(Blob, uploaded.checksum)).ref_count == 1
+
+    async def test_acquire_claimed_blob_writes_file(self, async_session: AsyncSession):
+        # ref_count가 0인 행은 지우는 중인 blob의 키이므로 새로 참조하는 쪽이 파일을 써야 함
+        async_session.add(Blob(checksum="abc", size=0, ref_count=0))
+        await async_session.commit()
+
+        assert await Blob.acquire(async_session, "abc", 4)
+        assert not await Blob.acquire(async_session, "abc", 4)
+        blob = await async_session.get(Blob, "abc")
+        assert (blob.ref_count, blob.size) == (2, 4)
+
+    async def test_upload_restores_missing_blob(self, async_session: AsyncSession, default_user: User, media_root):
+        first = await File.create_from_upload(async_session, make_upload_file(b"same"), default_user.id)
+        await async_session.commit()
+        Path(first.get_save_path()).unlink()
+
+        await File.create_from_upload(async_session, make_upload_file(b"same"), default_user.id)
+        assert Path(first.get_save_path()).read_bytes() == b"same"
+
+    async def test_create_from_upload_strips_directories(
+        self, async_session: AsyncSession, default_user: User, media_root
+    ):
+        file_obj = await File.create_from_upload(
+            async_session, make_upload_file(b"x", filename="../../escape.txt"), default_user.id
+        )
+        assert file_obj.filename == "escape.txt"
+        assert media_files(media_root) == [file_obj.file_path]
@@ -21,3 +21,23 @@ def test_refresh_token(client: TestClient, login_user):
         headers={"Authorization": f"Bearer {login_user['refresh_token']}"},
     )
     assert response.status_code == 200
+
+
+def test_login_does_not_load_relationships(client: TestClient, default_user: User, count_queries):
+    with count_queries() as statements:
+        response = client.post(
+            "/auth/login",
+            json={"email": "test@example.com", "password": "test"},
+        )
+    assert response.status_code == 200
+    assert len(statements) == 1
+
+
+def test_refresh_token_does_not_load_relationships(client: TestClient, login_user, count_queries):
+    with count_queries() as statements:
+        response = client.post(
+            "/auth/tokens",
+            headers={"Authorization": f"Bearer {login_user['refresh_token']}"},
+        )
+    assert response.status_code == 200
+    assert len(statements) == 1
@@ -0,0 +1,74 @@
+import io
+import json
+import zipfile
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.core import export
+from app.core.settings import settings
+from app.models.goal import Goal
+from app.models.note import Note
+from app.models.todo import Todo
+from app.models.user import User
+
+
+def parse_ndjson(content: bytes) -> list[dict]:
+    return [json.loads(line) for line in content.decode().splitlines()]
+
+
+async def test_export_ndjson(client: TestClient, login_user, default_user: User, default_note: Note):
+    response = client.get("/export", headers={"Authorization": f"Bearer {login_user['access_token']}"})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    records = parse_ndjson(response.content)
+    assert [record["type"] for record in records] == ["user", "goal", "todo", "note"]
+    assert records[0]["data"]["email"] == default_user.email
+    assert "hashed_password" not in records[0]["data"]
+    assert records[3]["data"]["title"] == default_note.title
+
+
+async def test_export_ndjson_in_chunks(session: Session, default_user: User, default_goal: Goal, monkeypatch):
+    monkeypatch.setattr(export, "EXPORT_CHUNK_SIZE", 10)
+    session.add_all(Todo(title=f"할일 {i}", user_id=default_user.id, goal_id=default_goal.id) for i in range(25))
+    session.commit()
+
+    chunks = [chunk async for chunk in export.iter_ndjson(default_user.id)]
+
+    # user 1줄, goal 1개, todo 10 + 10 + 5
+    assert [chunk.count(b"\n") for chunk in chunks] == [1, 1, 10, 10, 5]
+
+
+async def test_export_zip(
+    client: TestClient, login_user, default_user: User, default_todo: Todo, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(settings, "MEDIA_ROOT", str(tmp_path))
+    headers = {"Authorization": f"Bearer {login_user['access_token']}"}
+    content = b"\x89PNG" * 1000
+    file_id = client.post("/files", headers=headers, files={"file": ("photo.png", content, "image/png")}).json()["id"]
+
+    response = client.get("/export?format=zip", headers=headers)
+    assert response.status_code == 200
+
+    with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+        assert archive.namelist() == ["export.ndjson", f"media/{file_id}/photo.png"]
+        records = parse_ndjson(archive.read("export.ndjson"))
+        assert [record["type"] for record in records] == ["user", "goal", "todo", "file"]
+        assert archive.read(f"media/{file_id}/photo.png") == content
+
+
+async def test_export_zip_skips_missing_media(client: TestClient, login_user, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "MEDIA_ROOT", str(tmp_path))
+    headers = {"Authorization": f"Bearer {login_user['access_token']}"}
+    uploaded = [
+        client.post("/files", headers=headers, files={"file": (name, name.encode(), "text/plain")}).json()
+        for name in ("kept.txt", "lost.txt")
+    ]
+    (tmp_path / uploaded[1]["url"].removeprefix(f"{settings.MEDIA_URL}/")).unlink()
+
+    response = client.get("/export?format=zip", headers=headers)
+    assert response.status_code == 200
+
+    with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+        assert archive.namelist() == ["export.ndjson", f"media/{uploaded[0]['id']}/kept.txt"]
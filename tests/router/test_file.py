@@ -0,0 +1,32 @@
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from app.core.settings import settings
+
+
+def test_upload_and_delete_file(client: TestClient, login_user, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "MEDIA_ROOT", str(tmp_path))
+    headers = {"Authorization": f"Bearer {login_user['access_token']}"}
+    files = {"file": ("memo.txt", b"memo", "text/plain")}
+
+    uploaded = [client.post("/files", headers=headers, files=files).json() for _ in range(2)]
+    # 같은 내용은 같은 주소를 공유
+    assert uploaded[0]["url"] == uploaded[1]["url"]
+    blob = tmp_path / Path(uploaded[0]["url"]).relative_to(settings.MEDIA_URL)
+    assert blob.read_bytes() == b"memo"
+
+    assert client.delete(f"/files/{uploaded[0]['id']}", headers=headers).status_code == 204
+    assert blob.exists()
+    assert client.delete(f"/files/{uploaded[1]['id']}", headers=headers).status_code == 204
+    assert not blob.exists()
+    assert client.delete(f"/files/{uploaded[1]['id']}", headers=headers).status_code == 404
+
+
+def test_upload_too_large(client: TestClient, login_user, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "MEDIA_ROOT", str(tmp_path))
+    monkeypatch.setattr(settings, "UPLOAD_MAX_SIZE", 3)
+    headers = {"Authorization": f"Bearer {login_user['access_token']}"}
+
+    response = client.post("/files", headers=headers, files={"file": ("memo.txt", b"memo", "text/plain")})
+    assert response.status_code == 413
@@ -1,6 +1,7 @@
 import pytest
 from fastapi.testclient import TestClient
 
+from app.models.counter import USER_SCOPE, Counter
 from app.models.goal import Goal
 from app.models.user import User
 from sqlmodel import Session
@@ -38,6 +39,13 @@ async def test_get_goals(client: TestClient, login_user, default_goal: Goal):
     assert response.json()["next_cursor"] is None
 
 
+async def test_get_goals_matches_goal_detail(client: TestClient, login_user, default_goal: Goal):
+    headers = {"Authorization": f"Bearer {login_user['access_token']}"}
+    goals = client.get("/goals", headers=headers).json()["goals"]
+
+    assert goals == [client.get(f"/goals/{default_goal.id}", headers=headers).json()]
+
+
 async def test_get_goals_with_cursor(client: TestClient, login_user, session: Session, default_user: User):
     # 여러 개의 목표 생성
     goals = []
@@ -54,7 +62,7 @@ async def test_get_goals_with_cursor(client: TestClient, login_user, session: Se
     )
     assert response.status_code == 200
     assert len(response.json()["goals"]) == 20
-    assert response.json()["next_cursor"] > 0
+    assert response.json()["next_cursor"] is not None
 
     # 다음 페이지 요청
     response = client.get(
@@ -93,6 +101,19 @@ async def test_update_goal(client: TestClient, login_user, default_goal: Goal):
     assert response.json()["title"] == "수정된 목표"
 
 
+async def test_update_goal_without_counter_rows(client: TestClient, login_user, default_goal: Goal, session: Session):
+    headers = {"Authorization": f"Bearer {login_user['access_token']}"}
+
+    response = client.patch(f"/goals/{default_goal.id}", headers=headers, json={"title": "수정된 목표"})
+    assert response.status_code == 200
+
+    session.refresh(default_goal)
+    user_counter = session.get(Counter, (default_goal.user_id, USER_SCOPE))
+    assert default_goal.title == "수정된 목표"
+    assert default_goal.change_seq == user_counter.version == 1
+    assert user_counter.goals == 1
+
+
 async def test_update_goal_not_found(client: TestClient, login_user):
     response = client.patch(
         "/goals/999999",
@@ -144,3 +165,43 @@ async def test_get_goals_with_sort_order(client: TestClient, login_user, session
     assert response.status_code == 200
     assert response.json()["goals"][0]["title"] == "목표 0"
     assert response.json()["goals"][-1]["title"] == "목표 2"
+
+
+async def test_get_goals_not_modified(
+    client: TestClient, login_user, default_goal: Goal, reconciled_counters, count_queries
+):
+    headers = {"Authorization": f"Bearer {login_user['access_token']}"}
+    response = client.get("/goals", headers=headers)
+    etag = response.headers["ETag"]
+
+    # 데이터가 그대로면 목록 조회 없이 304
+    with count_queries() as statements:
+        response = client.get("/goals", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+    assert len(statements) == 1
+
+    response = client.get(f"/goals/{default_goal.id}", headers={**headers, "If-None-Match": f"W/{etag}"})
+    assert response.status_code == 304
+
+    client.patch(f"/goals/{default_goal.id}", headers=headers, json={"title": "수정된 목표"})
+    response = client.get("/goals", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json()["goals"][0]["title"] == "수정된 목표"
+
+
+def test_get_goals_not_modified_without_counter(client: TestClient, login_user, default_goal: Goal, count_queries):
+    # 카운터 행이 없으면 집계 없이 버전 0으로 ETag를 만듦
+    headers = {"Authorization": f"Bearer {login_user['access_token']}"}
+    etag = f'"{default_goal.user_id}-0"'
+    with count_queries() as statements:
+        response = client.get("/goals", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert len(statements) == 1
+
+    client.patch(f"/goals/{default_goal.id}", headers=headers, json={"title": "수정된 목표"})
+    response = client.get("/goals", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
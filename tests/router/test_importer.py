@@ -0,0 +1,129 @@
+import json
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core import importer
+from app.core.importer import NdjsonImporter
+from app.models.counter import Counter
+from app.models.goal import Goal
+from app.models.note import Note
+from app.models.todo import Todo
+from app.models.user import User
+
+
+def to_ndjson(*records: tuple[str, dict]) -> bytes:
+    return "".join(json.dumps({"type": record_type, "data": data}) + "\n" for record_type, data in records).encode()
+
+
+async def test_import_resolves_references(
+    client: TestClient, login_user, session: Session, default_user: User, async_session: AsyncSession
+):
+    await Counter.get(async_session, default_user.id)
+    body = to_ndjson(
+        ("goal", {"id": "g1", "title": "운동"}),
+        ("todo", {"id": "t1", "title": "달리기", "goalId": "g1", "done": True}),
+        ("todo", {"id": "t2", "title": "수영", "goalId": "g1"}),
+        ("note", {"title": "기록", "content": "5km", "goal_id": "g1", "todo_id": "t1"}),
+    )
+    response = client.post("/import", headers={"Authorization": f"Bearer {login_user['access_token']}"}, content=body)
+    assert response.status_code == 200
+    assert response.json() == {"goals": 1, "todos": 2, "notes": 1, "failed": 0, "errors": []}
+
+    goal = session.exec(select(Goal)).one()
+    todos = session.exec(select(Todo).order_by(Todo.id)).all()
+    note = session.exec(select(Note)).one()
+    assert [(todo.title, todo.goal_id, todo.done) for todo in todos] == [
+        ("달리기", goal.id, True),
+        ("수영", goal.id, False),
+    ]
+    assert (note.goal_id, note.todo_id) == (goal.id, todos[0].id)
+    assert await Counter.reconcile(async_session, fix=False) == []
+
+
+async def test_import_reports_record_errors(client: TestClient, login_user, session: Session):
+    body = b"\n".join(
+        [
+            b"not json",
+            to_ndjson(("goal", {"id": "g1", "title": "운동"})).strip(),
+            to_ndjson(("goal", {"id": "g2"})).strip(),
+            to_ndjson(("todo", {"title": "달리기", "goalId": "unknown"})).strip(),
+            to_ndjson(("todo", {"id": "t1", "title": "달리기", "goalId": "g1"})).strip(),
+            to_ndjson(("note", {"title": "a", "content": "a", "goal_id": "g1", "todo_id": "t1"})).strip(),
+            to_ndjson(("note", {"title": "b", "content": "b", "goal_id": "g1", "todo_id": "t1"})).strip(),
+            to_ndjson(("habit", {"title": "?"})).strip(),
+        ]
+    )
+    response = client.post("/import", headers={"Authorization": f"Bearer {login_user['access_token']}"}, content=body)
+    assert response.status_code == 200
+    result = response.json()
+    assert (result["goals"], result["todos"], result["notes"], result["failed"]) == (1, 1, 1, 5)
+    assert [error["line"] for error in result["errors"]] == [1, 3, 8, 4, 7]
+
+
+async def test_import_in_batches(session: Session, default_user: User, async_session: AsyncSession):
+    await Counter.get(async_session, default_user.id)
+    records = [("goal", {"id": goal, "title": f"목표 {goal}"}) for goal in range(3)]
+    records += [("todo", {"title": f"할일 {i}", "goalId": i % 3}) for i in range(10)]
+    body = to_ndjson(*records)
+
+    async def chunks():
+        # 줄 중간에서 잘린 청크도 처리
+        for start in range(0, len(body), 7):
+            yield body[start : start + 7]
+
+    result = await NdjsonImporter(async_session, default_user.id, batch_size=4).run(chunks())
+
+    assert (result.goals, result.todos, result.failed) == (3, 10, 0)
+    assert len(session.exec(select(Todo)).all()) == 10
+    assert await Counter.reconcile(async_session, fix=False) == []
+
+
+async def test_import_maps_ids_in_input_order(
+    session: Session, default_user: User, async_session: AsyncSession, reconciled_counters, count_queries
+):
+    records = [("goal", {"id": f"g{i}", "title": f"목표 {i}"}) for i in range(5)]
+    records += [("todo", {"title": f"할일 {i}", "goalId": f"g{i}"}) for i in range(5)]
+
+    async def chunks():
+        yield to_ndjson(*records)
+
+    with count_queries() as statements:
+        result = await NdjsonImporter(async_session, default_user.id).run(chunks())
+
+    assert (result.goals, result.todos, result.failed) == (5, 5, 0)
+    todos = session.exec(select(Todo.title, Goal.title).join(Goal, Goal.id == Todo.goal_id).order_by(Todo.id)).all()
+    assert [tuple(todo) for todo in todos] == [(f"할일 {i}", f"목표 {i}") for i in range(5)]
+    # 테이블마다 INSERT 한 번
+    inserts = [statement.split("(")[0].strip() for statement in statements if statement.startswith("INSERT")]
+    assert inserts.count("INSERT INTO goal") == 1
+    assert inserts.count("INSERT INTO todo") == 1
+
+
+async def test_import_skips_too_long_line(
+    session: Session, default_user: User, async_session: AsyncSession, monkeypatch
+):
+    monkeypatch.setattr(importer, "IMPORT_MAX_LINE_SIZE", 100)
+    await Counter.get(async_session, default_user.id)
+    long_goal = ("goal", {"id": "long", "title": "x" * 300})
+    body = to_ndjson(("goal", {"id": "g1", "title": "운동"}), long_goal, ("todo", {"title": "달리기", "goalId": "g1"}))
+
+    async def chunks():
+        # 한도의 두 배가 넘는 줄이 여러 청크에 걸쳐 들어옴
+        for start in range(0, len(body), 16):
+            yield body[start : start + 16]
+
+    result = await NdjsonImporter(async_session, default_user.id).run(chunks())
+
+    assert (result.goals, result.todos, result.failed) == (1, 1, 1)
+    assert [(error.line, error.detail) for error in result.errors] == [(2, "Line too long")]
+
+
+async def test_export_can_be_imported(client: TestClient, login_user, default_note: Note, session: Session):
+    headers = {"Authorization": f"Bearer {login_user['access_token']}"}
+    exported = client.get("/export", headers=headers).content
+
+    response = client.post("/import", headers=headers, content=exported)
+    assert response.json()["failed"] == 0
+    assert len(session.exec(select(Note)).all()) == 2
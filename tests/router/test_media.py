@@ -0,0 +1,100 @@
+from pathlib import Path
+
+import pytest
+import xxhash
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+from app.core.settings import settings
+from app.models.file import File
+from app.models.user import User
+
+CONTENT = bytes(range(256)) * 64
+
+
+@pytest.fixture
+def media_root(tmp_path, monkeypatch):
+    media_root = tmp_path / "media"
+    media_root.mkdir()
+    monkeypatch.setattr(settings, "MEDIA_ROOT", str(media_root))
+    return media_root
+
+
+@pytest.fixture
+def media_url(client: TestClient, login_user, media_root) -> str:
+    headers = {"Authorization": f"Bearer {login_user['access_token']}"}
+    response = client.post("/files", headers=headers, files={"file": ("video.mp4", CONTENT, "video/mp4")})
+    return "/" + response.json()["url"]
+
+
+def test_get_blob(client: TestClient, media_url: str):
+    response = client.get(media_url)
+    assert response.status_code == 200
+    assert response.content == CONTENT
+    assert response.headers["content-type"] == "video/mp4"
+    assert response.headers["etag"] == f'"{xxhash.xxh3_128_hexdigest(CONTENT)}"'
+    assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+    assert response.headers["accept-ranges"] == "bytes"
+    assert "content-disposition" not in response.headers
+
+    response = client.get(media_url, headers={"If-None-Match": response.headers["etag"]})
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+def test_get_blob_hides_other_users_filename(client: TestClient, session: Session, media_url: str):
+    # 같은 내용을 다른 사용자가 다른 이름으로 올려도 그 이름이 응답에 드러나지 않음
+    other_user = User(email="other@example.com", name="other", hashed_password="test")
+    session.add(other_user)
+    session.commit()
+    owned = session.exec(select(File)).one()
+    shared = owned.model_dump(exclude={"id", "user_id", "filename", "original_filename"})
+    session.add(File(**shared, filename="salary.mp4", original_filename="salary.mp4", user_id=other_user.id))
+    session.commit()
+
+    response = client.get(media_url)
+    assert response.status_code == 200
+    assert "content-disposition" not in response.headers
+
+
+def test_get_blob_range(client: TestClient, media_url: str):
+    etag = client.head(media_url).headers["etag"]
+
+    response = client.get(media_url, headers={"Range": "bytes=100-199", "If-Range": etag})
+    assert response.status_code == 206
+    assert response.headers["content-range"] == f"bytes 100-199/{len(CONTENT)}"
+    assert response.content == CONTENT[100:200]
+
+    # 다른 버전을 기준으로 한 이어받기는 전체를 다시 보냄
+    response = client.get(media_url, headers={"Range": "bytes=100-199", "If-Range": '"stale"'})
+    assert response.status_code == 200
+    assert response.content == CONTENT
+
+    response = client.get(media_url, headers={"Range": f"bytes={len(CONTENT)}-"})
+    assert response.status_code == 416
+
+
+def test_get_missing_blob(client: TestClient, media_url: str, media_root: Path):
+    assert client.get(media_url.replace("/media/", "/media/x")).status_code == 404
+    assert client.get(f"/media/blobs/00/{'0' * 32}").status_code == 404
+
+
+def test_get_legacy_file(client: TestClient, media_root: Path):
+    legacy = media_root / "1" / "photo.png"
+    legacy.parent.mkdir()
+    legacy.write_bytes(b"\x89PNG")
+
+    response = client.get("/media/1/photo.png")
+    assert response.status_code == 200
+    assert response.content == b"\x89PNG"
+    assert response.headers["content-type"] == "image/png"
+    assert response.headers["cache-control"] == "public, no-cache"
+
+    response = client.get("/media/1/photo.png", headers={"If-None-Match": response.headers["etag"]})
+    assert response.status_code == 304
+
+
+def test_get_media_outside_root(client: TestClient, media_root: Path):
+    (media_root.parent / "secret.txt").write_text("secret")
+    assert client.get("/media/%2E%2E/secret.txt").status_code == 404
+    assert client.get("/media/1").status_code == 404
@@ -54,19 +54,59 @@ async def test_get_notes(client: TestClient, login_user, default_note: Note, def
     assert response.json()["next_cursor"] is None
 
 
+async def test_get_notes_matches_note_detail(
+    client: TestClient, login_user, default_user: User, default_note: Note, default_goal: Goal
+):
+    headers = {"Authorization": f"Bearer {login_user['access_token']}"}
+    notes = client.get(f"/notes?goal_id={default_goal.id}", headers=headers).json()["notes"]
+
+    # 조인으로 읽은 할 일, 목표, 사용자가 상세 조회의 관계 로딩 결과와 같음
+    assert notes == [client.get(f"/notes/{default_note.id}", headers=headers).json()]
+    assert notes[0]["todo"]["id"] == default_note.todo_id
+    assert notes[0]["user"]["email"] == default_user.email
+
+
+async def test_get_notes_keeps_note_of_deleted_todo(
+    client: TestClient, login_user, default_note: Note, default_goal: Goal, default_todo: Todo
+):
+    headers = {"Authorization": f"Bearer {login_user['access_token']}"}
+    assert client.delete(f"/todos/{default_todo.id}", headers=headers).status_code == 204
+
+    response = client.get(f"/notes?goal_id={default_goal.id}", headers=headers)
+
+    # 할 일이 없어져도 노트는 목록에 남고 todo만 null
+    assert response.json()["total_count"] == 1
+    assert response.json()["notes"] == [client.get(f"/notes/{default_note.id}", headers=headers).json()]
+    assert response.json()["notes"][0]["todo"] is None
+
+
+async def test_get_notes_of_deleted_goal(client: TestClient, login_user, default_note: Note, default_goal: Goal):
+    headers = {"Authorization": f"Bearer {login_user['access_token']}"}
+    assert client.delete(f"/goals/{default_goal.id}", headers=headers).status_code == 204
+
+    response = client.get(f"/notes?goal_id={default_goal.id}", headers=headers)
+
+    # 삭제된 목표는 카운터가 없으므로 목록도 카운터와 같이 비어 있음
+    assert response.json()["total_count"] == 0
+    assert response.json()["notes"] == []
+
+
 async def test_get_notes_with_cursor(
     client: TestClient, login_user, session: Session, default_user: User, default_goal: Goal, default_todo: Todo
 ):
-    # 여러 개의 노트 생성
+    # 여러 개의 노트 생성 (할 일 하나에 노트는 하나)
     notes = []
     for i in range(25):
+        todo = Todo(title=f"할일 {i}", user_id=default_user.id, goal_id=default_goal.id)
+        session.add(todo)
+        session.flush()
         note = Note(
             title=f"노트 {i}",
             content=f"내용 {i}",
             link_url="https://example.com",
             user_id=default_user.id,
             goal_id=default_goal.id,
-            todo_id=default_todo.id,
+            todo_id=todo.id,
         )
         session.add(note)
         notes.append(note)
@@ -126,6 +166,9 @@ async def test_update_note(client: TestClient, login_user, default_note: Note):
     assert response.status_code == 200
     assert response.json()["title"] == "수정된 노트"
     assert response.json()["content"] == "수정된 내용"
+    # 커밋 후 다시 읽지 않아도 조회할 때 로딩한 관계가 응답에 담김
+    assert response.json()["todo"]["title"] == default_note.todo.title
+    assert response.json()["goal"]["id"] == default_note.goal_id
 
 
 async def test_update_note_not_found(client: TestClient, login_user):
@@ -0,0 +1,67 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.core.queries import assert_max_queries
+from app.models.goal import Goal
+from app.models.note import Note
+from app.models.todo import Todo
+from app.models.user import User
+
+GOALS = 3
+TODOS_PER_GOAL = 5
+
+
+@pytest.fixture
+def seeded(session: Session, default_user: User) -> dict[str, int]:
+    """목표마다 할 일 여러 개와 노트 두 개를 만들어, 행마다 쿼리가 늘어나면 예산을 넘도록 합니다."""
+    goals = [Goal(title=f"목표 {i}", user_id=default_user.id) for i in range(GOALS)]
+    session.add_all(goals)
+    session.commit()
+    todos = [
+        Todo(title=f"할일 {i}", user_id=default_user.id, goal_id=goal.id, done=i % 2 == 0)
+        for goal in goals
+        for i in range(TODOS_PER_GOAL)
+    ]
+    session.add_all(todos)
+    session.commit()
+    notes = [
+        Note(title="노트", content="내용", user_id=default_user.id, goal_id=todo.goal_id, todo_id=todo.id)
+        for todo in todos
+        if todo.title in ("할일 0", "할일 1")
+    ]
+    session.add_all(notes)
+    session.commit()
+    return {"goal_id": goals[0].id, "todo_id": todos[0].id, "note_id": notes[0].id}
+
+
+# 엔드포인트별 쿼리 수 상한. 목록의 행 수와 관계없이 일정해야 합니다.
+QUERY_BUDGETS = [
+    ("GET", "/user", None, 1),
+    ("GET", "/goals", None, 3),
+    ("GET", "/goals/{goal_id}", None, 2),
+    ("PATCH", "/goals/{goal_id}", {"title": "수정"}, 3),
+    ("GET", "/todos", None, 3),
+    ("GET", "/todos?goalId={goal_id}", None, 3),
+    ("GET", "/todos/progress?goalId={goal_id}", None, 2),
+    ("GET", "/todos/{todo_id}", None, 3),
+    ("PATCH", "/todos/{todo_id}", {"done": False}, 5),
+    ("POST", "/todos", {"title": "새 할일", "goalId": "{goal_id}"}, 5),
+    ("GET", "/notes?goal_id={goal_id}", None, 3),
+    ("GET", "/notes/{note_id}", None, 5),
+    ("PATCH", "/notes/{note_id}", {"title": "수정"}, 6),
+    ("GET", "/sync?since=0", None, 6),
+]
+
+
+@pytest.mark.parametrize("method, path, body, budget", QUERY_BUDGETS, ids=[f"{m} {p}" for m, p, *_ in QUERY_BUDGETS])
+def test_query_budget(
+    client: TestClient, login_user, seeded: dict[str, int], reconciled_counters, method, path, body, budget
+):
+    headers = {"Authorization": f"Bearer {login_user['access_token']}"}
+    if body is not None:
+        body = {key: int(value.format(**seeded)) if value == "{goal_id}" else value for key, value in body.items()}
+
+    with assert_max_queries(budget):
+        response = client.request(method, path.format(**seeded), headers=headers, json=body)
+    assert response.status_code == 200, response.text
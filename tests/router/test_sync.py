@@ -0,0 +1,53 @@
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.models.goal import Goal
+from app.models.todo import Todo
+from app.models.user import User
+
+
+def sync_all(client: TestClient, headers: dict, since: int | None = None, size: int = 500) -> dict:
+    """next_cursor가 없을 때까지 페이지를 모아 반환합니다."""
+    params = {"size": size} if since is None else {"size": size, "since": since}
+    merged = {"goals": [], "todos": [], "notes": [], "deleted": []}
+    while True:
+        response = client.get("/sync", headers=headers, params=params)
+        assert response.status_code == 200
+        body = response.json()
+        for field in merged:
+            merged[field] += body[field]
+        if body["next_cursor"] is None:
+            return {**merged, "version": body["version"]}
+        params = {"size": size, "cursor": body["next_cursor"]}
+
+
+async def test_sync_returns_only_changes(
+    client: TestClient, login_user, session: Session, default_user: User, default_goal: Goal
+):
+    session.add_all(Todo(title=f"할일 {i}", user_id=default_user.id, goal_id=default_goal.id) for i in range(50))
+    session.commit()
+    headers = {"Authorization": f"Bearer {login_user['access_token']}"}
+
+    # 처음에는 모든 행을 여러 페이지로 받음
+    full = sync_all(client, headers, size=7)
+    assert len(full["goals"]) == 1
+    assert len(full["todos"]) == 50
+    assert len({todo["id"] for todo in full["todos"]}) == 50
+
+    todo_ids = [todo["id"] for todo in full["todos"]]
+    client.patch(f"/todos/{todo_ids[0]}", headers=headers, json={"done": True})
+    client.patch("/todos/bulk", headers=headers, json={"ids": todo_ids[1:3], "title": "수정"})
+    client.delete(f"/todos/{todo_ids[3]}", headers=headers)
+    new_todo = client.post("/todos", headers=headers, json={"title": "새 할일", "goalId": default_goal.id}).json()
+
+    delta = sync_all(client, headers, since=full["version"], size=2)
+    assert sorted(todo["id"] for todo in delta["todos"]) == sorted([*todo_ids[:3], new_todo["id"]])
+    assert [(deleted["entity"], deleted["entity_id"]) for deleted in delta["deleted"]] == [("todo", todo_ids[3])]
+    assert delta["goals"] == []
+
+    assert sync_all(client, headers, since=delta["version"])["todos"] == []
+
+
+async def test_sync_invalid_cursor(client: TestClient, login_user):
+    response = client.get("/sync?cursor=abc", headers={"Authorization": f"Bearer {login_user['access_token']}"})
+    assert response.status_code == 400
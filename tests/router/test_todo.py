@@ -1,6 +1,11 @@
+from datetime import datetime
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import Session
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.counter import USER_SCOPE, Counter
 
 from app.models.note import Note
 from app.models.todo import Todo
@@ -53,6 +58,9 @@ async def test_create_todo(client: TestClient, login_user, default_goal: Goal):
     assert response.status_code == 200
     assert response.json()["title"] == "새로운 할일"
     assert "id" in response.json()
+    # 방금 생성된 할 일에는 노트가 없음
+    assert response.json()["note_id"] is None
+    datetime.fromisoformat(response.json()["created_at"])
 
 
 async def test_get_todos(client: TestClient, login_user, default_todo: Todo, default_goal: Goal):
@@ -67,6 +75,17 @@ async def test_get_todos(client: TestClient, login_user, default_todo: Todo, def
     assert response.json()["next_cursor"] is None
 
 
+async def test_get_todos_of_deleted_goal(client: TestClient, login_user, default_todo: Todo, default_goal: Goal):
+    headers = {"Authorization": f"Bearer {login_user['access_token']}"}
+    assert client.delete(f"/goals/{default_goal.id}", headers=headers).status_code == 204
+
+    response = client.get(f"/todos?goalId={default_goal.id}", headers=headers)
+
+    # 삭제된 목표는 카운터가 없으므로 목록도 카운터와 같이 비어 있음
+    assert response.json()["total_count"] == 0
+    assert response.json()["todos"] == []
+
+
 async def test_get_todos_with_done_filter(
     client: TestClient, login_user, session: Session, default_user: User, default_goal: Goal
 ):
@@ -153,7 +172,7 @@ async def test_get_todo_not_found(client: TestClient, login_user):
     assert response.status_code == 404
 
 
-async def test_update_todo(client: TestClient, login_user, default_todo: Todo):
+async def test_update_todo(client: TestClient, login_user, default_todo: Todo, default_note: Note):
     response = client.patch(
         f"/todos/{default_todo.id}",
         headers={"Authorization": f"Bearer {login_user['access_token']}"},
@@ -162,6 +181,28 @@ async def test_update_todo(client: TestClient, login_user, default_todo: Todo):
     assert response.status_code == 200
     assert response.json()["title"] == "수정된 할일"
     assert response.json()["done"] is True
+    # 커밋 후 다시 읽지 않아도 조회할 때 로딩한 노트가 응답에 담김
+    assert response.json()["note_id"] == default_note.id
+
+
+async def test_update_todo_done_without_counter_rows(
+    client: TestClient, login_user, default_todo: Todo, session: Session
+):
+    # 카운터 테이블 도입 전부터 있던 사용자처럼 카운터 행이 하나도 없는 상태
+    assert session.exec(select(Counter)).all() == []
+    headers = {"Authorization": f"Bearer {login_user['access_token']}"}
+
+    response = client.patch(f"/todos/{default_todo.id}", headers=headers, json={"done": True})
+    assert response.status_code == 200
+
+    # 수정 전 데이터로 사용자 행을 만든 뒤 변경분을 한 번만 반영
+    user_counter = session.get(Counter, (default_todo.user_id, USER_SCOPE))
+    session.refresh(user_counter)
+    assert (user_counter.todos, user_counter.done_todos) == (1, 1)
+    response = client.get(f"/todos/progress?goalId={default_todo.goal_id}", headers=headers)
+    assert response.json()["progress"] == 1.0
+    assert client.get("/todos?done=false", headers=headers).json()["total_count"] == 0
+    assert client.get("/todos?done=true", headers=headers).json()["total_count"] == 1
 
 
 async def test_update_todo_not_found(client: TestClient, login_user):
@@ -250,3 +291,269 @@ async def test_get_todos_with_note(client: TestClient, login_user, default_goal:
     assert response.json()["total_count"] == 1
     assert len(response.json()["todos"]) == 1
     assert response.json()["todos"][0]["note_id"] == default_note.id
+
+
+async def test_get_todos_matches_todo_detail(
+    client: TestClient, login_user, session: Session, default_goal: Goal, default_note: Note
+):
+    # 노트가 있는 할 일과 없는 할 일
+    session.add(Todo(title="노트 없는 할일", user_id=default_goal.user_id, goal_id=default_goal.id))
+    session.commit()
+    headers = {"Authorization": f"Bearer {login_user['access_token']}"}
+    todos = client.get("/todos", headers=headers).json()["todos"]
+
+    # 컬럼만 조회하는 목록과 엔티티로 조회하는 상세가 같은 응답을 만듦
+    assert len(todos) == 2
+    for todo in todos:
+        assert todo == client.get(f"/todos/{todo['id']}", headers=headers).json()
+
+
+async def test_get_todos_total_count_follows_filters(
+    client: TestClient, login_user, session: Session, default_user: User, default_goal: Goal
+):
+    other_goal = Goal(title="다른 목표", user_id=default_user.id)
+    session.add(other_goal)
+    session.commit()
+    headers = {"Authorization": f"Bearer {login_user['access_token']}"}
+
+    for goal_id in (default_goal.id, default_goal.id, other_goal.id):
+        response = client.post("/todos", headers=headers, json={"title": "할일", "goalId": goal_id})
+        assert response.status_code == 200
+    todo_id = response.json()["id"]
+
+    # 다른 목표의 할 일을 완료 처리하면서 기본 목표로 옮김
+    response = client.patch(f"/todos/{todo_id}", headers=headers, json={"done": True, "goalId": default_goal.id})
+    assert response.status_code == 200
+
+    def total_count(query: str) -> int:
+        response = client.get(f"/todos?{query}", headers=headers)
+        assert response.status_code == 200
+        return response.json()["total_count"]
+
+    assert total_count("") == 3
+    assert total_count(f"goalId={default_goal.id}") == 3
+    assert total_count(f"goalId={default_goal.id}&done=true") == 1
+    assert total_count(f"goalId={default_goal.id}&done=false") == 2
+    assert total_count(f"goalId={other_goal.id}") == 0
+
+    response = client.delete(f"/todos/{todo_id}", headers=headers)
+    assert response.status_code == 204
+    assert total_count("done=true") == 0
+    assert total_count("") == 2
+
+
+async def test_get_todo_progress_follows_updates(
+    client: TestClient,
+    login_user,
+    async_session: AsyncSession,
+    default_goal: Goal,
+    default_todo: Todo,
+    reconciled_counters,
+):
+    headers = {"Authorization": f"Bearer {login_user['access_token']}"}
+
+    def progress() -> float:
+        response = client.get(f"/todos/progress?goalId={default_goal.id}", headers=headers)
+        assert response.status_code == 200
+        return response.json()["progress"]
+
+    assert progress() == 0.0
+
+    client.patch(f"/todos/{default_todo.id}", headers=headers, json={"done": True})
+    assert progress() == 1.0
+
+    client.post("/todos", headers=headers, json={"title": "새로운 할일", "goalId": default_goal.id})
+    assert progress() == 0.5
+
+    client.delete(f"/todos/{default_todo.id}", headers=headers)
+    assert progress() == 0.0
+
+    # 저장된 값이 실제 집계와 일치하는지 확인
+    assert await Counter.reconcile(async_session, fix=False) == []
+
+
+@pytest.fixture
+def other_goal(session: Session, default_user: User) -> Goal:
+    goal = Goal(title="다른 목표", user_id=default_user.id)
+    session.add(goal)
+    session.commit()
+    session.refresh(goal)
+    return goal
+
+
+@pytest.fixture
+def progress_todos(session: Session, default_user: User, default_goal: Goal, other_goal: Goal) -> list[Todo]:
+    """default_goal은 절반, other_goal은 모두 완료된 할 일"""
+    todos = [
+        Todo(title="완료", user_id=default_user.id, goal_id=default_goal.id, done=True),
+        Todo(title="미완료", user_id=default_user.id, goal_id=default_goal.id),
+        Todo(title="완료", user_id=default_user.id, goal_id=other_goal.id, done=True),
+    ]
+    session.add_all(todos)
+    session.commit()
+    return todos
+
+
+@pytest.fixture
+def goal_todos(session: Session, default_user: User, default_goal: Goal, request) -> list[Todo]:
+    """default_goal에 미완료 할 일을 만듭니다. 개수는 indirect 파라미터로 정하며 기본은 4개입니다."""
+    todos = [
+        Todo(title=f"할일 {i}", user_id=default_user.id, goal_id=default_goal.id)
+        for i in range(getattr(request, "param", 4))
+    ]
+    session.add_all(todos)
+    session.commit()
+    return todos
+
+
+async def test_get_todo_progress_batch(
+    client: TestClient,
+    login_user,
+    default_goal: Goal,
+    other_goal: Goal,
+    progress_todos: list[Todo],
+    reconciled_counters,
+    count_queries,
+):
+    headers = {"Authorization": f"Bearer {login_user['access_token']}"}
+
+    response = client.get("/todos/progress/batch", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["progresses"] == [
+        {"goal_id": default_goal.id, "total": 2, "completed": 1, "progress": 0.5},
+        {"goal_id": other_goal.id, "total": 1, "completed": 1, "progress": 1.0},
+    ]
+
+    # 목표 수와 관계없이 쿼리 한 번으로 조회
+    with count_queries() as statements:
+        response = client.get(
+            f"/todos/progress/batch?goalIds={other_goal.id}&goalIds={default_goal.id}&goalIds=999999",
+            headers=headers,
+        )
+    assert response.status_code == 200
+    assert [progress["progress"] for progress in response.json()["progresses"]] == [1.0, 0.5, 0.0]
+    # ETag용 버전 조회 포함
+    assert len(statements) <= 3
+
+    response = client.get(f"/todos/progress?goalId={default_goal.id}", headers=headers)
+    assert response.json()["progress"] == 0.5
+
+
+async def test_bulk_create_todos(
+    client: TestClient, login_user, default_goal: Goal, async_session: AsyncSession, reconciled_counters, count_queries
+):
+    headers = {"Authorization": f"Bearer {login_user['access_token']}"}
+    todos = [{"title": f"할일 {i}", "goalId": default_goal.id} for i in range(100)]
+
+    # 할 일 수와 관계없이 일정한 쿼리 수로 처리
+    with count_queries() as statements:
+        response = client.post("/todos/bulk", headers=headers, json={"todos": todos})
+    assert response.status_code == 200
+    assert [todo["title"] for todo in response.json()["todos"]] == [todo["title"] for todo in todos]
+    assert all(todo["note_id"] is None for todo in response.json()["todos"])
+    assert len(statements) <= 5
+
+    response = client.get(f"/todos?goalId={default_goal.id}", headers=headers)
+    assert response.json()["total_count"] == 100
+    assert await Counter.reconcile(async_session, fix=False) == []
+
+
+async def test_bulk_create_todos_with_invalid_goal(
+    client: TestClient, login_user, default_goal: Goal, session: Session
+):
+    other_user = User(email="other@example.com", name="other", hashed_password="-")
+    session.add(other_user)
+    session.commit()
+    other_goal = Goal(title="다른 사용자의 목표", user_id=other_user.id)
+    session.add(other_goal)
+    session.commit()
+
+    response = client.post(
+        "/todos/bulk",
+        headers={"Authorization": f"Bearer {login_user['access_token']}"},
+        json={"todos": [{"title": "할일", "goalId": default_goal.id}, {"title": "할일", "goalId": other_goal.id}]},
+    )
+    assert response.status_code == 404
+    assert session.exec(select(Todo)).all() == []
+
+
+async def test_bulk_update_and_delete_todos(
+    client: TestClient,
+    login_user,
+    default_goal: Goal,
+    other_goal: Goal,
+    goal_todos: list[Todo],
+    async_session: AsyncSession,
+    reconciled_counters,
+):
+    ids = [todo.id for todo in goal_todos]
+    headers = {"Authorization": f"Bearer {login_user['access_token']}"}
+
+    response = client.patch(
+        "/todos/bulk", headers=headers, json={"ids": ids[:2], "done": True, "goalId": other_goal.id}
+    )
+    assert response.status_code == 200
+    assert response.json()["count"] == 2
+
+    response = client.get(f"/todos/progress/batch?goalIds={default_goal.id}&goalIds={other_goal.id}", headers=headers)
+    assert [progress["progress"] for progress in response.json()["progresses"]] == [0.0, 1.0]
+
+    response = client.post("/todos/bulk/delete", headers=headers, json={"ids": ids[1:3]})
+    assert response.status_code == 200
+    assert response.json()["count"] == 2
+    assert await Counter.reconcile(async_session, fix=False) == []
+
+
+@pytest.mark.parametrize("field", ["title", "done", "goalId"])
+async def test_bulk_update_rejects_null(client: TestClient, login_user, default_todo: Todo, field: str):
+    headers = {"Authorization": f"Bearer {login_user['access_token']}"}
+
+    response = client.patch("/todos/bulk", headers=headers, json={"ids": [default_todo.id], field: None})
+    assert response.status_code == 422
+
+    # 값을 보내지 않은 필드는 그대로 두고, null을 허용하는 필드는 비울 수 있음
+    response = client.patch("/todos/bulk", headers=headers, json={"ids": [default_todo.id], "linkUrl": None})
+    assert response.status_code == 200
+
+
+async def test_bulk_todos_not_found_changes_nothing(
+    client: TestClient, login_user, default_todo: Todo, session: Session
+):
+    headers = {"Authorization": f"Bearer {login_user['access_token']}"}
+
+    response = client.patch("/todos/bulk", headers=headers, json={"ids": [default_todo.id, 999999], "done": True})
+    assert response.status_code == 404
+
+    response = client.post("/todos/bulk/delete", headers=headers, json={"ids": [default_todo.id, 999999]})
+    assert response.status_code == 404
+
+    session.refresh(default_todo)
+    assert default_todo.done is False
+
+
+@pytest.mark.parametrize("goal_todos", [50], indirect=True)
+async def test_complete_and_clear_done_todos_in_goal(
+    client: TestClient,
+    login_user,
+    default_goal: Goal,
+    goal_todos: list[Todo],
+    async_session: AsyncSession,
+    reconciled_counters,
+    count_queries,
+):
+    headers = {"Authorization": f"Bearer {login_user['access_token']}"}
+
+    response = client.post(f"/todos/bulk/complete?goalId={default_goal.id}", headers=headers)
+    assert response.json()["count"] == 50
+    response = client.get(f"/todos/progress?goalId={default_goal.id}", headers=headers)
+    assert response.json()["progress"] == 1.0
+
+    with count_queries() as statements:
+        response = client.delete(f"/todos/bulk/done?goalId={default_goal.id}", headers=headers)
+    assert response.json()["count"] == 50
+    # 삭제, 카운터 갱신, 버전 갱신, 삭제 기록(tombstone) 일괄 삽입
+    assert len(statements) <= 4
+
+    response = client.get(f"/todos?goalId={default_goal.id}", headers=headers)
+    assert response.json()["total_count"] == 0
+    assert await Counter.reconcile(async_session, fix=False) == []
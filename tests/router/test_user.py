@@ -1,4 +1,5 @@
 from fastapi.testclient import TestClient
+from sqlmodel import Session
 
 from app.models.user import User
 
@@ -39,3 +40,32 @@ async def test_get_user(client: TestClient, login_user):
     assert response.json()["email"] == "test@example.com"
     assert response.json()["name"] == "test"
     assert "hashed_password" not in response.json()
+
+
+async def test_get_user_does_not_load_relationships(client: TestClient, login_user, count_queries):
+    with count_queries() as statements:
+        response = client.get(
+            "/user",
+            headers={"Authorization": f"Bearer {login_user['access_token']}"},
+        )
+    assert response.status_code == 200
+    assert len(statements) == 1
+
+
+async def test_get_user_uses_cache_until_user_changes(
+    client: TestClient, login_user, session: Session, default_user: User, count_queries
+):
+    headers = {"Authorization": f"Bearer {login_user['access_token']}"}
+    client.get("/user", headers=headers)
+
+    with count_queries() as statements:
+        response = client.get("/user", headers=headers)
+    assert response.json()["name"] == "test"
+    assert statements == []
+
+    default_user.name = "changed"
+    session.add(default_user)
+    session.commit()
+
+    response = client.get("/user", headers=headers)
+    assert response.json()["name"] == "changed"
@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from hypothesis import HealthCheck, given, settings
+from hypothesis import strategies as st
+from sqlmodel import Session, delete, func, select
+
+from app.exceptions import BadRequestHTTPException
+from app.models.goal import Goal
+from app.models.user import User
+from app.schema.common import SORT_COLUMNS, KeysetPaginator, SortField, SortOrder
+
+BASE_TIME = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def walk_pages(session: Session, user_id: int, size: int, sort_order: SortOrder, sort_by: SortField) -> list[list[int]]:
+    pages, cursor = [], None
+    # 커서가 앞으로 나아가지 않으면 무한히 반복하므로 행 수만큼만 시도
+    for _ in range(session.exec(select(func.count()).select_from(Goal)).one() + 1):
+        paginator = KeysetPaginator(Goal, size, cursor, sort_order, sort_by)
+        rows, cursor = paginator.paginate(
+            session.exec(paginator.apply(select(Goal).where(Goal.user_id == user_id))).all()
+        )
+        pages.append([row.id for row in rows])
+        if cursor is None:
+            return pages
+    raise AssertionError("페이지가 끝나지 않습니다")
+
+
+@settings(max_examples=50, deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture])
+@given(
+    # 정렬 키가 겹치는 경우가 많도록 좁은 범위에서 생성
+    offsets=st.lists(st.tuples(st.integers(0, 5), st.integers(0, 5)), max_size=30),
+    size=st.integers(1, 7),
+    sort_order=st.sampled_from(SortOrder),
+    sort_by=st.sampled_from(SortField),
+)
+def test_pages_never_overlap_or_skip(session: Session, default_user: User, offsets, size, sort_order, sort_by):
+    session.exec(delete(Goal))
+    session.add_all(
+        Goal(
+            title="목표",
+            user_id=default_user.id,
+            created_at=BASE_TIME + timedelta(seconds=created),
+            updated_at=BASE_TIME + timedelta(seconds=updated),
+        )
+        for created, updated in offsets
+    )
+    session.commit()
+
+    goals = session.exec(select(Goal)).all()
+    column = SORT_COLUMNS[sort_by]
+    expected = sorted(goals, key=lambda goal: (getattr(goal, column), goal.id), reverse=sort_order == SortOrder.DESC)
+
+    pages = walk_pages(session, default_user.id, size, sort_order, sort_by)
+
+    assert [goal_id for page in pages for goal_id in page] == [goal.id for goal in expected]
+    assert all(len(page) == size for page in pages[:-1])
+
+
+def test_reject_cursor_from_other_sort(session: Session, default_user: User):
+    session.add_all(Goal(title="목표", user_id=default_user.id) for _ in range(3))
+    session.commit()
+    paginator = KeysetPaginator(Goal, 1, sort_by=SortField.CREATED_AT)
+    _, cursor = paginator.paginate(session.exec(paginator.apply(select(Goal))).all())
+
+    with pytest.raises(BadRequestHTTPException):
+        KeysetPaginator(Goal, 1, cursor, sort_by=SortField.UPDATED_AT)
+    with pytest.raises(BadRequestHTTPException):
+        KeysetPaginator(Goal, 1, "not-a-cursor")